@@ -0,0 +1,344 @@
+# ---------------------------------------------------------------------------
+# \benchmarks\bench_gateway.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Offline-Benchmark des kompletten Nachrichtenpfads ohne Discord-Account.
+
+`discum` wird durch `benchmarks/fake_discum.py` ersetzt. Die Nachrichten laufen durch
+  SelfBot.setup_events.on_message -> CommandTree.prepare -> CommandDispatcher
+  -> CommandTree.run -> Command.execute -> respond -> OutboundQueue (typingAction + reply)
+Gemessen werden Durchsatz sowie p50/p95/p99 je Abschnitt.
+
+Aufruf:
+  python benchmarks/bench_gateway.py [--count 2000] [--rate 0] [--mode quiet|debug|pretty]
+  python benchmarks/bench_gateway.py --replay aufnahme.jsonl [--speed 1.0]
+  python benchmarks/bench_gateway.py --json neu.json --baseline alt.json
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import random
+import argparse
+import threading
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STAGES = ("gateway", "prepare", "queue", "execute", "reply", "total")
+_DEFAULT_MIX = "ping:4,echo:4,help:1,work:1,chat:2"
+_AUTHOR = {"id": "300000000000000001", "username": "bench", "discriminator": "0001", "bot": False}
+
+
+def _configure(opts) -> None:
+    import settings
+    settings.PREFIX = "$"
+    settings.DEBUG = opts.mode != "pretty"
+    settings.LOGGING = False
+    settings.LOG_STRUCTURED = False
+    settings.GATEWAY_RECORD_PATH = ""
+    settings.SESSION_CACHE = ""
+    settings.MODULE_RELOAD_INTERVAL = 0
+    settings.DISPATCH_WORKERS = opts.workers
+    settings.DISPATCH_QUEUE_LIMIT = opts.queue_limit
+
+
+def _build_bot(opts):
+    import fake_discum
+    fake_discum.install()
+    import main
+    from src.core.discord.commandtree import Command
+    from src.core.animation.debug_animation import logger as debug_logger
+
+    # Login, Verschleierung und Start-Animation gehören nicht zum gemessenen Pfad
+    main.SelfBot._perform_login = lambda self: "benchmark-token"
+    main.apply_chameleon_mask = lambda bot: None
+    main.pretty_banner = lambda *args, **kwargs: None
+
+    bot = main.SelfBot()
+    debug_logger.debug_enabled = opts.mode == "debug"
+    bot.allowed_users = frozenset()
+    bot.commands.allowed_users = None
+    if not opts.admission:
+        from src.core.discord.admission import AdmissionControl
+        bot.commands.admission = AdmissionControl(None, None, None)
+    bot.bot.rest_latency = opts.rest_ms / 1000.0
+    if opts.ratelimit:
+        count, _, per = opts.ratelimit.partition("/")
+        bot.bot.rate_limit = (int(count), float(per or 5))
+
+    work = opts.work_ms / 1000.0
+
+    def echo(ctx, args):
+        return " ".join(args) or "echo"
+
+    def benchwork(ctx, args):
+        # Simuliert I/O-gebundene Arbeit (z. B. ein externer API-Call)
+        time.sleep(work)
+        return "fertig"
+
+    bot.commands.register(Command("benchecho", echo, "Benchmark-Echo", "Gibt die Argumente zurück"))
+    bot.commands.register(Command("benchwork", benchwork, "Benchmark-Arbeit", "Schläft --work-ms Millisekunden"))
+    return bot
+
+
+def _synthetic(count: int, mix: str, channels: int, seed: int) -> List[Dict]:
+    templates = {
+        "ping": "$ping",
+        "echo": "$benchecho hallo welt 123",
+        "help": "$help",
+        "work": "$benchwork",
+        "chat": "das ist keine Befehlsnachricht",
+    }
+    weighted = []
+    for part in mix.split(","):
+        name, _, weight = part.partition(":")
+        if name not in templates:
+            raise SystemExit(f"Unbekannter Mix-Eintrag: {name} (erlaubt: {', '.join(templates)})")
+        weighted.extend([name] * int(weight or 1))
+    rnd = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        payloads.append({"ts": None, "op": 0, "t": "MESSAGE_CREATE", "d": {
+            "id": str(400000000000000000 + i),
+            "channel_id": str(200000000000000000 + rnd.randrange(channels)),
+            "author": _AUTHOR,
+            "content": templates[rnd.choice(weighted)],
+        }})
+    return payloads
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    n = len(ordered)
+    return {
+        "n": n,
+        "mean": sum(ordered) / n if n else 0.0,
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "max": ordered[-1] if n else 0.0,
+    }
+
+
+class _Probe:
+    """Misst Zeitstempel je Nachricht, indem es die Methoden des laufenden Bots umhüllt."""
+
+    def __init__(self, bot):
+        self.records: Dict[str, Dict[str, float]] = {}
+        self.by_trace: Dict[str, Dict[str, float]] = {}
+        self.replies = 0
+        self.last_reply = 0.0
+        self._current = threading.local()
+        self._lock = threading.Lock()
+        tree = bot.commands
+        clock = time.perf_counter
+
+        orig_prepare, orig_run, orig_run_async = tree.prepare, tree.run, tree.run_async
+
+        def prepare(channel_id, author, content):
+            start = clock()
+            result = orig_prepare(channel_id, author, content)
+            rec = getattr(self._current, "rec", None)
+            if rec is not None:
+                rec["prepare"] = clock() - start
+                rec["prepared"] = clock()
+                if result[1] is not None:
+                    self.by_trace[result[1].trace_id] = rec
+            return result
+
+        def run(invocation):
+            rec = self.by_trace.get(invocation.trace_id)
+            if rec is not None:
+                rec["run_start"] = clock()
+            try:
+                return orig_run(invocation)
+            finally:
+                if rec is not None:
+                    rec["run_end"] = clock()
+
+        async def run_async(invocation):
+            rec = self.by_trace.get(invocation.trace_id)
+            if rec is not None:
+                rec["run_start"] = clock()
+            try:
+                return await orig_run_async(invocation)
+            finally:
+                if rec is not None:
+                    rec["run_end"] = clock()
+
+        def on_send(channel_id, message_id, text):
+            now = clock()
+            rec = self.records.get(message_id)
+            with self._lock:
+                self.replies += 1
+                self.last_reply = now
+            if rec is not None and "reply" not in rec:
+                rec["reply"] = now
+
+        tree.prepare, tree.run, tree.run_async = prepare, run, run_async
+        bot.bot.on_send = on_send
+
+    def feed(self, gateway, raw: Dict) -> None:
+        rec = {"feed": time.perf_counter()}
+        self.records[str(raw["d"].get("id"))] = rec
+        self._current.rec = rec
+        gateway.feed(raw)
+        rec["gateway"] = time.perf_counter()
+        self._current.rec = None
+
+    def stages(self) -> Dict[str, List[float]]:
+        out: Dict[str, List[float]] = {name: [] for name in STAGES}
+        for rec in self.records.values():
+            out["gateway"].append(rec["gateway"] - rec["feed"])
+            if "prepare" in rec:
+                out["prepare"].append(rec["prepare"])
+            if "run_start" in rec:
+                out["queue"].append(rec["run_start"] - rec["prepared"])
+                if "run_end" in rec:
+                    out["execute"].append(rec["run_end"] - rec["run_start"])
+                    if "reply" in rec:
+                        out["reply"].append(rec["reply"] - rec["run_end"])
+            if "reply" in rec:
+                out["total"].append(rec["reply"] - rec["feed"])
+        return {name: [v * 1000.0 for v in values] for name, values in out.items()}
+
+
+def _drive(bot, probe: _Probe, payloads: List[Dict], rate: float, speed: float) -> float:
+    gateway = bot.bot.gateway
+    start = time.perf_counter()
+    first_ts = next((p["ts"] for p in payloads if p.get("ts") is not None), None)
+    for i, raw in enumerate(payloads):
+        if rate > 0:
+            due = start + i / rate
+        elif speed > 0 and first_ts is not None and raw.get("ts") is not None:
+            due = start + (raw["ts"] - first_ts) / speed
+        else:
+            due = 0.0
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        probe.feed(gateway, raw)
+    return start
+
+
+def _drain(bot, probe: _Probe, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        idle = bot.dispatcher.depth == 0 and bot.outbound.depth == 0
+        if idle and time.perf_counter() - probe.last_reply > 0.2:
+            return
+        time.sleep(0.02)
+
+
+def _compare(result: Dict, baseline_path: str, tolerance: float, floor_ms: float) -> List[str]:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    regressions = []
+    for name, stats in result["stages"].items():
+        old = base.get("stages", {}).get(name)
+        if not old or not stats["n"]:
+            continue
+        if stats["p95"] > old["p95"] * (1 + tolerance) and stats["p95"] - old["p95"] > floor_ms:
+            regressions.append(f"{name}: p95 {old['p95']:.2f} ms -> {stats['p95']:.2f} ms")
+    old_tp, new_tp = base.get("throughput", 0), result["throughput"]
+    if old_tp and new_tp < old_tp / (1 + tolerance):
+        regressions.append(f"Durchsatz: {old_tp:.0f}/s -> {new_tp:.0f}/s")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Anzahl synthetischer Nachrichten")
+    parser.add_argument("--rate", type=float, default=0.0, help="Nachrichten pro Sekunde (0 = so schnell wie möglich)")
+    parser.add_argument("--mix", default=_DEFAULT_MIX, help=f"Gewichtete Befehlsmischung (Standard: {_DEFAULT_MIX})")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--replay", help="JSONL-Aufnahme von GatewayRecorder statt synthetischer Nachrichten")
+    parser.add_argument("--speed", type=float, default=0.0, help="Replay-Tempo relativ zur Aufnahme (0 = so schnell wie möglich)")
+    parser.add_argument("--mode", choices=("quiet", "debug", "pretty"), default="quiet",
+                        help="quiet: keine Ausgabe, debug: Debug-Logs, pretty: Laufzeit-Ausgaben (append_message)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-limit", type=int, default=100000)
+    parser.add_argument("--rest-ms", type=float, default=0.0, help="Simulierte Latenz je REST-Aufruf")
+    parser.add_argument("--admission", action="store_true", help="Befehls-Limits aus settings.py aktiv lassen (RATE_LIMIT_*)")
+    parser.add_argument("--ratelimit", help="Simuliertes Nachrichten-Limit pro Channel, z. B. 5/5 (5 Nachrichten je 5 s)")
+    parser.add_argument("--work-ms", type=float, default=5.0, help="Dauer von $benchwork")
+    parser.add_argument("--drain-timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Ergebnis als JSON speichern")
+    parser.add_argument("--baseline", help="Mit früherem --json-Ergebnis vergleichen, Exit-Code 1 bei Regression")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Erlaubte Verschlechterung (0.25 = 25 %%)")
+    parser.add_argument("--floor-ms", type=float, default=0.5, help="Abweichungen darunter gelten als Rauschen")
+    opts = parser.parse_args()
+
+    _configure(opts)
+    if opts.replay:
+        from src.core.discord.gateway_recorder import load_recording
+        payloads = list(load_recording(opts.replay, events=("MESSAGE_CREATE",)))
+    else:
+        payloads = _synthetic(opts.count, opts.mix, opts.channels, opts.seed)
+
+    # Konsolenausgaben des Bots kosten weiterhin Zeit, landen aber nicht im Terminal
+    devnull = open(os.devnull, "w")
+    stdout = sys.stdout
+    sys.stdout = devnull
+    try:
+        bot = _build_bot(opts)
+        probe = _Probe(bot)
+        start = _drive(bot, probe, payloads, opts.rate, opts.speed)
+        fed = time.perf_counter()
+        _drain(bot, probe, opts.drain_timeout)
+        bot.cleanup()
+        atexit.unregister(bot.cleanup)
+        from src.core.animation.debug_animation import logger as debug_logger
+        debug_logger.flush(timeout=30)
+    finally:
+        sys.stdout = stdout
+
+    stages = {name: _summarize(values) for name, values in probe.stages().items()}
+    elapsed = max(probe.last_reply, fed) - start
+    result = {
+        "config": {k: v for k, v in vars(opts).items() if k not in ("json", "baseline")},
+        "messages": len(payloads),
+        "replies": probe.replies,
+        "elapsed_s": elapsed,
+        "throughput": probe.replies / elapsed if elapsed > 0 else 0.0,
+        "rate_limited": bot.commands.metrics.rate_limited,
+        "coalesced": bot.commands.metrics.coalesced,
+        "throttled": bot.commands.metrics.throttled + bot.commands.metrics.dropped,
+        "stages": stages,
+    }
+
+    print(f"Nachrichten: {len(payloads)}  Antworten: {probe.replies}  Dauer: {elapsed:.2f}s  "
+          f"Durchsatz: {result['throughput']:.0f} Antworten/s  (mode={opts.mode}, workers={opts.workers})")
+    print(f"429-Antworten: {result['rate_limited']}  Zusammengefasst: {result['coalesced']}  Gedrosselt: {result['throttled']}")
+    print(f"{'Abschnitt':<10}{'n':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}   [ms]")
+    for name in STAGES:
+        s = stages[name]
+        print(f"{name:<10}{s['n']:>7}{s['mean']:>10.3f}{s['p50']:>10.3f}{s['p95']:>10.3f}{s['p99']:>10.3f}{s['max']:>10.3f}")
+
+    if opts.json:
+        with open(opts.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    if opts.baseline:
+        regressions = _compare(result, opts.baseline, opts.tolerance, opts.floor_ms)
+        if regressions:
+            print("Regressionen gegenüber Baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("Keine Regression gegenüber Baseline.")
+
+
+if __name__ == "__main__":
+    main()
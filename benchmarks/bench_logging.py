@@ -0,0 +1,90 @@
+# ---------------------------------------------------------------------------
+# \benchmarks\bench_logging.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Mikro-Benchmark für die Kosten von Log-Aufrufen auf dem Nachrichtenpfad.
+
+Vergleicht bei deaktiviertem Debug-Output:
+  - eager:  f-String wird vor dem Aufruf gebaut (bisheriger Stil)
+  - lazy:   Format-String + Argumente, Formatierung erst nach Level-Prüfung
+  - guard:  `if logger.is_enabled(DEBUG):` vor dem Aufruf
+und misst anschließend `CommandTree.handle` pro Nachricht.
+
+Aufruf:  python benchmarks/bench_logging.py [--number 200000]
+"""
+import os
+import sys
+import timeit
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import settings
+settings.LOGGING = False
+
+from src.core.animation.debug_animation import DebugConsole, DEBUG, logger as debug_logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200000)
+    opts = parser.parse_args()
+
+    console = DebugConsole()
+    console.debug_enabled = False
+    debug_logger.debug_enabled = False
+
+    author = {"id": "123456789012345678", "username": "bench", "avatar": "a" * 32, "discriminator": "0001"}
+    ctx = {"channel_id": "234567890123456789", "author_id": author["id"], "author_username": "bench"}
+    result = "```\nPong!\n=====\nDie Antwortzeit beträgt: 0 ms\n```"
+
+    def eager():
+        console.debug('CommandTree.handle', f"Verarbeite Nachricht von author={author} ctx={ctx} -> {result!r}")
+
+    def lazy():
+        console.debug('CommandTree.handle', "Verarbeite Nachricht von author=%s ctx=%s -> %r", author, ctx, result)
+
+    def guard():
+        if console.is_enabled(DEBUG):
+            console.debug('CommandTree.handle', f"Verarbeite Nachricht von author={author} ctx={ctx} -> {result!r}")
+
+    n = opts.number
+    print(f"Log-Aufruf bei DEBUG=False ({n} Aufrufe)")
+    timings = {}
+    for name, fn in (("eager", eager), ("lazy", lazy), ("guard", guard)):
+        timings[name] = min(timeit.repeat(fn, number=n, repeat=3)) / n * 1e9
+        print(f"  {name:<6} {timings[name]:>8.0f} ns/Aufruf")
+    print(f"  Ersparnis lazy gegenüber eager: {timings['eager'] - timings['lazy']:.0f} ns/Aufruf")
+
+    from src.core.discord.commandtree import CommandTree, Command
+    tree = CommandTree(None, "$")
+    tree.allowed_users = None
+    # Limits würden nach wenigen Aufrufen nur noch den Ablehnungspfad messen
+    from src.core.discord.admission import AdmissionControl
+    tree.admission = AdmissionControl(None, None, None)
+    # Leerer Command, damit nur der Overhead von Parsing/Dispatch/Logging gemessen wird
+    tree.register(Command("benchnoop", lambda ctx, args: "ok", "Benchmark", "Benchmark"))
+    m = max(1, n // 20)
+
+    def handle():
+        tree.handle(ctx["channel_id"], author, "$benchnoop")
+
+    per_msg = min(timeit.repeat(handle, number=m, repeat=3)) / m * 1e6
+    print(f"CommandTree.handle('$benchnoop') bei DEBUG=False: {per_msg:.1f} µs/Nachricht")
+    debug_logger.debug_enabled = True
+    debug_logger.async_enabled = True
+    devnull = open(os.devnull, "w")
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        per_msg_on = min(timeit.repeat(handle, number=m, repeat=3)) / m * 1e6
+        debug_logger.flush(timeout=30)
+    finally:
+        sys.stdout = stdout
+        debug_logger.debug_enabled = False
+    print(f"CommandTree.handle('$benchnoop') bei DEBUG=True (async, stdout -> devnull): {per_msg_on:.1f} µs/Nachricht")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# ---------------------------------------------------------------------------
+# \benchmarks\bench_startup.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Startup-Benchmark für die Modul-Entdeckung des CommandTree.
+
+Erzeugt ein temporäres Paket mit N synthetischen Modulen und misst in jeweils
+frischen Prozessen:
+  - eager:      alle Module importieren und setup() aufrufen (bisheriges Verhalten)
+  - lazy-cold:  Lazy-Modus ohne Index (Index wird aufgebaut)
+  - lazy-warm:  Lazy-Modus mit gültigem Index (nur Platzhalter)
+
+Aufruf:  python benchmarks/bench_startup.py [--modules 300] [--repeat 3]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MODULE_TEMPLATE = '''
+from src.core.discord.commandtree import Command
+
+# Simulierter Import-/Initialisierungsaufwand eines typischen Moduls
+_TABLE = {{i: str(i) * 8 for i in range({work})}}
+
+
+def setup(command_tree):
+    def cb_a(ctx, args):
+        return "a{idx}:" + _TABLE[1]
+
+    def cb_b(ctx, args):
+        return "b{idx}:" + " ".join(args)
+
+    command_tree.register(Command(
+        name="bench{idx}a", callback=cb_a,
+        help_description_short="Benchmark {idx} A",
+        help_description_long="Synthetischer Benchmark-Command {idx} A"
+    ))
+    command_tree.register(Command(
+        name="bench{idx}b", callback=cb_b,
+        help_description_short="Benchmark {idx} B",
+        help_description_long="Synthetischer Benchmark-Command {idx} B"
+    ))
+'''
+
+
+def _generate(base: str, package: str, count: int, work: int) -> None:
+    pkg_dir = os.path.join(base, package)
+    os.makedirs(pkg_dir)
+    open(os.path.join(pkg_dir, "__init__.py"), "w").close()
+    for i in range(count):
+        mod_dir = os.path.join(pkg_dir, f"mod{i:04d}")
+        os.makedirs(mod_dir)
+        open(os.path.join(mod_dir, "__init__.py"), "w").close()
+        with open(os.path.join(mod_dir, "setup.py"), "w", encoding="utf-8") as f:
+            f.write(_MODULE_TEMPLATE.format(idx=i, work=work))
+
+
+def _child(base: str, package: str, mode: str, index_path: str) -> None:
+    import tracemalloc
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, base)
+    tracemalloc.start()
+    before = len(sys.modules)
+    t0 = time.perf_counter()
+    from src.core.discord.commandtree import CommandTree
+    tree = CommandTree(
+        None, "$",
+        modules_package=package,
+        lazy_modules=(mode != "eager"),
+        index_path=index_path
+    )
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    # Erster Aufruf eines Commands (lädt im Lazy-Modus genau ein Modul nach)
+    tree.allowed_users = None
+    t1 = time.perf_counter()
+    _, reply = tree.handle("1", {"id": "1", "username": "bench"}, "$bench0a")
+    first_call = time.perf_counter() - t1
+    assert reply.startswith("a0:"), reply
+    print(json.dumps({
+        "mode": mode,
+        "seconds": elapsed,
+        "peak_kib": peak / 1024,
+        "commands": len(tree.commands),
+        "imported_modules": len(sys.modules) - before,
+        "loaded_setups": len(tree.loaded_modules),
+        "first_call": first_call,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--work", type=int, default=2000, help="Größe der Tabelle pro Modul (Importaufwand)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=4, metavar=("BASE", "PACKAGE", "MODE", "INDEX"), help=argparse.SUPPRESS)
+    opts = parser.parse_args()
+
+    if opts.child:
+        _child(*opts.child)
+        return
+
+    base = tempfile.mkdtemp(prefix="selfbot_bench_")
+    package = "bench_modules"
+    index_path = os.path.join(base, "module_index.json")
+    try:
+        _generate(base, package, opts.modules, opts.work)
+        results = {"eager": [], "lazy-cold": [], "lazy-warm": []}
+        for _ in range(opts.repeat):
+            for mode in ("eager", "lazy-cold", "lazy-warm"):
+                if mode == "lazy-cold" and os.path.exists(index_path):
+                    os.remove(index_path)
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", base, package, mode, index_path],
+                    cwd=base, capture_output=True, text=True, check=True
+                )
+                results[mode].append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+        print(f"Module: {opts.modules}, Commands: {opts.modules * 2 + 1}, Wiederholungen: {opts.repeat}")
+        print(f"{'Modus':<10} {'Startup ms':>11} {'Peak KiB':>10} {'Imports':>8} {'setup()':>8} {'1. Aufruf ms':>13}")
+        for mode, runs in results.items():
+            best = min(runs, key=lambda r: r["seconds"])
+            print(
+                f"{mode:<10} {best['seconds'] * 1000:>11.1f} {best['peak_kib']:>10.0f} "
+                f"{best['imported_modules']:>8} {best['loaded_setups']:>8} {best['first_call'] * 1000:>13.2f}"
+            )
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# ---------------------------------------------------------------------------
+# \benchmarks\bench_store.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Benchmark für den Modul-Store (`src/core/system/store.py`).
+
+Vergleicht, was ein Modul pro Änderung an seinen Daten bezahlt:
+  - json:         ganzes Dict bei jeder Änderung neu als JSON schreiben (bisher üblich)
+  - json-atomic:  dasselbe mit Temp-Datei, fsync und os.replace (absturzsicher)
+  - store:        KVStore.set pro Änderung, Group Commit im Hintergrund, flush am Ende
+
+Aufruf:  python benchmarks/bench_store.py [--keys 2000] [--writes 5000] [--reads 20000]
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import settings
+settings.LOGGING = False
+
+from src.core.system.store import KVStore
+
+
+def _value(i: int) -> dict:
+    return {"user": str(100000000000000000 + i), "punkte": i, "notiz": "x" * 40}
+
+
+def bench_json(path: str, keys: int, ops, atomic: bool) -> float:
+    data = {f"k{i}": _value(i) for i in range(keys)}
+    start = time.perf_counter()
+    for key, value in ops:
+        data[key] = value
+        if atomic:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+    return time.perf_counter() - start
+
+
+def bench_store(path: str, keys: int, ops, interval: float):
+    store = KVStore(path, commit_interval=interval)
+    ns = store.namespace("bench")
+    for i in range(keys):
+        ns.set(f"k{i}", _value(i))
+    store.flush(timeout=60)
+    start = time.perf_counter()
+    for key, value in ops:
+        ns.set(key, value)
+    queued = time.perf_counter() - start
+    store.flush(timeout=60)
+    total = time.perf_counter() - start
+    stats = store.stats()
+    store.close()
+    return queued, total, stats
+
+
+def bench_reads(path: str, keys: int, reads: int, cache_size: int) -> float:
+    store = KVStore(path, cache_size=cache_size)
+    rng = random.Random(2)
+    names = [f"k{rng.randrange(keys)}" for _ in range(reads)]
+    start = time.perf_counter()
+    for name in names:
+        store.get("bench", name)
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=2000, help="Anzahl Einträge des Moduls")
+    parser.add_argument("--writes", type=int, default=5000, help="Anzahl Änderungen")
+    parser.add_argument("--reads", type=int, default=20000, help="Anzahl zufälliger Lesezugriffe")
+    parser.add_argument("--interval", type=float, default=0.5, help="STORE_COMMIT_INTERVAL für den Store")
+    opts = parser.parse_args()
+
+    rng = random.Random(1)
+    ops = [(f"k{rng.randrange(opts.keys)}", _value(rng.randrange(10 ** 6))) for _ in range(opts.writes)]
+    workdir = tempfile.mkdtemp(prefix="bench-store-")
+    try:
+        print(f"{opts.writes} Änderungen an {opts.keys} Einträgen")
+        for name, atomic in (("json", False), ("json-atomic", True)):
+            # Die JSON-Varianten sind linear in keys * writes, bei großen Werten nur einen Ausschnitt messen
+            sample = ops[:min(len(ops), 500)]
+            elapsed = bench_json(os.path.join(workdir, name + ".json"), opts.keys, sample, atomic)
+            per_op = elapsed / len(sample)
+            print(f"  {name:<12} {per_op * 1e6:>10.1f} µs/Änderung  (hochgerechnet {per_op * len(ops):.2f} s)")
+        path = os.path.join(workdir, "store.sqlite3")
+        queued, total, stats = bench_store(path, opts.keys, ops, opts.interval)
+        print(
+            f"  {'store':<12} {queued / len(ops) * 1e6:>10.1f} µs/Änderung  "
+            f"(bis alles geschrieben ist {total:.2f} s, {stats['commits']} Commits)"
+        )
+        for label, cache_size in (("mit Cache", 10000), ("ohne Cache", 0)):
+            elapsed = bench_reads(path, opts.keys, opts.reads, cache_size)
+            print(f"Lesen {label:<11} {elapsed / opts.reads * 1e6:>8.1f} µs/Zugriff")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
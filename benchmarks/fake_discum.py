@@ -0,0 +1,233 @@
+# ---------------------------------------------------------------------------
+# \benchmarks\fake_discum.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Lokaler Ersatz für `discum`, damit der Nachrichtenpfad von `main.SelfBot` ohne
+Discord-Account gemessen werden kann. Bildet nur ab, was der Selfbot benutzt:
+Gateway-Hooks (`gateway.command`), `resp.event`/`resp.parsed.auto()` und die
+REST-Aufrufe `sendMessage`, `reply`, `sendFile`, `typingAction`, `info`.
+
+`install()` registriert das Modul als `discum` in `sys.modules` und legt, nur falls
+Selenium nicht installiert ist, Platzhalter für die Imports in `main.py` an.
+"""
+import sys
+import time
+import types
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class DiscordError(Exception):
+    pass
+
+
+class _Event:
+    __slots__ = ("message", "ready", "ready_supplemental")
+
+    def __init__(self, raw: Dict):
+        t = raw.get("t")
+        self.message = t == "MESSAGE_CREATE"
+        self.ready = t == "READY"
+        self.ready_supplemental = t == "READY_SUPPLEMENTAL"
+
+
+class _Parsed:
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Dict):
+        self._raw = raw
+
+    def auto(self) -> Dict:
+        return self._raw.get("d") or {}
+
+
+class Response:
+    __slots__ = ("raw", "event", "parsed")
+
+    def __init__(self, raw: Dict):
+        self.raw = raw
+        self.event = _Event(raw)
+        self.parsed = _Parsed(raw)
+
+
+class _FakeHTTPResponse:
+    def __init__(self, data, status_code: int = 200, headers: Optional[Dict[str, str]] = None):
+        self._data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+
+class _Session:
+    def __init__(self, user: Dict):
+        self.user = user
+
+
+class Gateway:
+    def __init__(self, user: Dict):
+        self._hooks: List[Callable] = []
+        self.session = _Session(user)
+        self.sent: List[Dict] = []
+        self._closed = threading.Event()
+
+    def command(self, func: Callable) -> Callable:
+        self._hooks.append(func)
+        return func
+
+    def feed(self, raw: Dict) -> None:
+        """Spielt ein Gateway-Payload ein. Läuft wie bei discum synchron im aufrufenden (Gateway-)Thread."""
+        resp = Response(raw)
+        for hook in list(self._hooks):
+            hook(resp)
+
+    def send(self, payload: Dict) -> None:
+        self.sent.append(payload)
+
+    def run(self, auto_reconnect: bool = True) -> None:
+        self._closed.wait()
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class Client:
+    """
+    `rest_latency` simuliert die Round-Trip-Zeit jedes REST-Aufrufs.
+    `on_send(channel_id, message_id, text)` wird nach jedem erfolgreichen `reply`/`sendMessage` aufgerufen.
+    `rate_limit = (anzahl, sekunden)` simuliert Discords Nachrichten-Limit pro Channel
+    inkl. `X-RateLimit-*`-Headern und 429-Antworten mit `retry_after`.
+    """
+
+    def __init__(self, token: str = "", log=None, user: Optional[Dict] = None):
+        self.token = token
+        self.user = user or {"id": "100000000000000000", "username": "selfbot", "discriminator": "0001"}
+        self.gateway = Gateway(self.user)
+        self.rest_latency = 0.0
+        self.on_send: Optional[Callable[[str, Optional[str], str], None]] = None
+        self.rate_limit: Optional[Tuple[int, float]] = None
+        self.calls: Dict[str, int] = {}
+        self._windows: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _rest(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        if self.rest_latency:
+            time.sleep(self.rest_latency)
+
+    def _message_limit(self, channel_id: str) -> Tuple[Optional[_FakeHTTPResponse], Dict[str, str]]:
+        """Festes Fenster pro Channel. Liefert (429-Antwort oder None, Header für die Erfolgsantwort)."""
+        if self.rate_limit is None:
+            return None, {}
+        limit, per = self.rate_limit
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(channel_id)
+            if window is None or now >= window[0] + per:
+                window = self._windows[channel_id] = [now, 0]
+            reset_after = window[0] + per - now
+            if window[1] >= limit:
+                self.calls["429"] = self.calls.get("429", 0) + 1
+                headers = {
+                    "X-RateLimit-Bucket": "fake-messages", "X-RateLimit-Limit": str(limit),
+                    "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+                    "Retry-After": f"{reset_after:.3f}",
+                }
+                return _FakeHTTPResponse(
+                    {"message": "You are being rate limited.", "retry_after": round(reset_after, 3), "global": False},
+                    429, headers
+                ), headers
+            window[1] += 1
+            headers = {
+                "X-RateLimit-Bucket": "fake-messages", "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(limit - window[1]), "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            }
+        return None, headers
+
+    def info(self):
+        self._rest("info")
+        return _FakeHTTPResponse(self.user)
+
+    def typingAction(self, channel_id: str):
+        self._rest("typingAction")
+        return _FakeHTTPResponse(None, 204)
+
+    def sendMessage(self, channel_id: str, message: str = "", *args, **kwargs):
+        self._rest("sendMessage")
+        limited, headers = self._message_limit(channel_id)
+        if limited is not None:
+            return limited
+        if self.on_send is not None:
+            self.on_send(channel_id, None, message)
+        return _FakeHTTPResponse({"channel_id": channel_id, "content": message}, 200, headers)
+
+    def reply(self, channel_id: str, message_id: str, message: str = "", *args, **kwargs):
+        self._rest("reply")
+        limited, headers = self._message_limit(channel_id)
+        if limited is not None:
+            return limited
+        if self.on_send is not None:
+            self.on_send(channel_id, message_id, message)
+        return _FakeHTTPResponse({"channel_id": channel_id, "content": message}, 200, headers)
+
+    def sendFile(self, channel_id: str, filelocation: str, isurl: bool = False, message: str = "", *args, **kwargs):
+        self._rest("sendFile")
+        limited, headers = self._message_limit(channel_id)
+        if limited is not None:
+            return limited
+        if self.on_send is not None:
+            self.on_send(channel_id, None, message)
+        return _FakeHTTPResponse({"channel_id": channel_id, "content": message, "attachments": [filelocation]}, 200, headers)
+
+    def getGuilds(self):
+        self._rest("getGuilds")
+        return _FakeHTTPResponse([])
+
+
+def _stub_selenium() -> None:
+    try:
+        import selenium.webdriver  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    class _Unavailable:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("Selenium ist im Benchmark nicht verfügbar")
+
+    class WebDriverException(Exception):
+        pass
+
+    class TimeoutException(WebDriverException):
+        pass
+
+    modules = {
+        "selenium": {},
+        "selenium.webdriver": {"Chrome": _Unavailable},
+        "selenium.webdriver.chrome": {},
+        "selenium.webdriver.chrome.options": {"Options": _Unavailable},
+        "selenium.webdriver.chrome.service": {"Service": _Unavailable},
+        "selenium.common": {},
+        "selenium.common.exceptions": {"WebDriverException": WebDriverException, "TimeoutException": TimeoutException},
+        "selenium.webdriver.support": {},
+        "selenium.webdriver.support.ui": {"WebDriverWait": _Unavailable},
+        "selenium.webdriver.support.expected_conditions": {},
+        "selenium.webdriver.common": {},
+        "selenium.webdriver.common.by": {"By": type("By", (), {"NAME": "name", "CSS_SELECTOR": "css selector"})},
+    }
+    for name, attrs in modules.items():
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+    for name in modules:
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, sys.modules[name])
+
+
+def install() -> None:
+    sys.modules["discum"] = sys.modules[__name__]
+    _stub_selenium()
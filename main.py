@@ -11,8 +11,15 @@ import time
 
 # Flags
 DEBUG_OVERRIDE = len(sys.argv) > 1 and sys.argv[1] == "DEBUG"
+PROFILE_STARTUP = "--profile-startup" in sys.argv[1:]
 NO_SETTINGS = False
 
+# Startup-Profiler vor allen weiteren Imports aktivieren, damit auch diese gemessen werden
+from src.core.system.startup_profiler import profiler as startup_profiler
+if PROFILE_STARTUP:
+    startup_profiler.enable()
+startup_profiler.begin("imports")
+
 # Settings override
 try:
     import settings
@@ -22,12 +29,14 @@ try:
     DEBUG = getattr(settings, 'DEBUG', False)
     MAX_CHUNK_SIZE = getattr(settings, 'MAX_CHUNK_SIZE', 2000)
     prefix = getattr(settings, 'PREFIX', None)
+    FAST_START = "--fast-start" in sys.argv[1:] or getattr(settings, 'FAST_START', False)
 except ImportError:
     settings = None
     def spawn_restart():
         pass
     DEBUG = True
     MAX_CHUNK_SIZE = 2000
+    FAST_START = "--fast-start" in sys.argv[1:]
     NO_SETTINGS = True
 
 # Debug-Logger/Print Import
@@ -39,20 +48,14 @@ debug_logger.logging_enabled = getattr(settings, 'LOGGING', True) if settings el
 
 # Weitere Imports
 import re
-import traceback
 import threading
 import asyncio
 import atexit
+import itertools
+from concurrent.futures import Future
 from datetime import datetime
 
-# Selenium-Imports
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import WebDriverException, TimeoutException as SeleniumTimeout
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+# Selenium wird erst in `_login_via_chrome` importiert (siehe `_selenium_errors`)
 
 # Discum client
 import discum
@@ -63,9 +66,22 @@ except ImportError:
 
 # Projekt-Imports
 from src.core.discord.commandtree import CommandTree
+from src.core.discord.dispatcher import CommandDispatcher
+from src.core.discord.chunker import iter_chunks, is_streaming
+from src.core.discord.attachment import FileResponse, ATTACHMENT_THRESHOLD
+from src.core.discord.outbound import OutboundQueue
+from src.core.discord.rest import RestError
+from src.core.discord import process_pool
+from src.core.discord.message import error_message
 from src.core.discord.chameleon_mask import mask as apply_chameleon_mask
+from src.core.discord.gateway_recorder import GatewayRecorder, GATEWAY_RECORD_PATH
+from src.core.system.flight_recorder import flight_recorder
 from src.core.animation.running_animation import print_banner, append_message
 from src.core.animation.pretty_animation import pretty_banner
+from src.core.animation.console_renderer import renderer as console_renderer
+from src.core.system.session_cache import SessionCache
+
+startup_profiler.end("imports")
 
 # DEBUG_OVERRIDE Print
 def DEBUG_OVERRIDE_PRINT():
@@ -73,6 +89,7 @@ def DEBUG_OVERRIDE_PRINT():
     debug_logger.error('LOGIN', "Login-Fehler: Mehrere Login-Versuche fehlgeschlagen.")
     time.sleep(3)
 
+startup_profiler.begin("pre_startup")
 if DEBUG_OVERRIDE:
     DEBUG_OVERRIDE_PRINT()
 
@@ -88,6 +105,7 @@ if prefix is None:
     debug_logger.warning('main', "Prefix nicht gesetzt, verwende '&'")
     print_banner("Pre-startup Fehler")
     append_message("Prefix nicht gesetzt, verwende '&'")
+startup_profiler.end("pre_startup")
 
 
 def retry(exceptions, tries=2, delay=5, backoff=2, logger=None):
@@ -99,7 +117,7 @@ def retry(exceptions, tries=2, delay=5, backoff=2, logger=None):
                     return func(*args, **kwargs)
                 except exceptions as e:
                     if logger:
-                        logger.warning(func.__name__, f"Fehler: {e}. Versuche {mtries-1} mal weiter, Warte {mdelay}s")
+                        logger.warning(func.__name__, "Fehler: %s. Versuche %s mal weiter, Warte %ss", e, mtries-1, mdelay)
                     time.sleep(mdelay)
                     mtries -= 1
                     mdelay *= backoff
@@ -107,6 +125,13 @@ def retry(exceptions, tries=2, delay=5, backoff=2, logger=None):
         return wrapper
     return decorator
 
+def _selenium_errors() -> tuple:
+    """Selenium-Exceptions, sofern Selenium schon geladen ist. Vor dem Login kann keine auftreten."""
+    exceptions = sys.modules.get('selenium.common.exceptions')
+    if exceptions is None:
+        return ()
+    return (exceptions.WebDriverException, exceptions.TimeoutException)
+
 class LoginError(Exception):
     def __init__(self, message, attempts: int, last_exception: Exception = None):
         super().__init__(message)
@@ -126,39 +151,54 @@ class SelfBot:
 
     def __init__(self, DEBUG=False):
         self.DEBUG = getattr(settings, 'DEBUG', False)
-        debug_logger.debug('init', f"DEBUG={self.DEBUG}")
+        debug_logger.debug('init', "DEBUG=%s", self.DEBUG)
 
         def _global_exception_hook(exc_type, exc_value, exc_traceback):
-            non_critical = (WebDriverException, SeleniumTimeout)
-            if issubclass(exc_type, non_critical):
-                debug_logger.error('_global_exception_hook', f"Nicht-kritische Exception: {exc_value}")
+            non_critical = _selenium_errors()
+            if non_critical and issubclass(exc_type, non_critical):
+                debug_logger.error('_global_exception_hook', "Nicht-kritische Exception: %s", exc_value)
             else:
                 self._handle_unhandled_exception(exc_type, exc_value, exc_traceback)
         sys.excepthook = _global_exception_hook
 
         raw = getattr(settings, 'ALLLOWED_USERS', None) or getattr(settings, 'ALLOWED_USERS', [])
+        # frozenset: wird für jede eingehende Nachricht geprüft
         if isinstance(raw, str):
-            self.allowed_users = [u.strip() for u in raw.split(',') if u.strip()]
+            self.allowed_users = frozenset(u.strip() for u in raw.split(',') if u.strip())
         elif isinstance(raw, (list, tuple)):
-            self.allowed_users = [str(u) for u in raw]
+            self.allowed_users = frozenset(str(u) for u in raw)
         else:
-            self.allowed_users = []
-        debug_logger.debug('init', f"Allowed users: {self.allowed_users}")
+            self.allowed_users = frozenset()
+        debug_logger.debug('init', "Allowed users: %s", self.allowed_users)
 
-        if not self.DEBUG:
-            pretty_banner(
-                banner_text="Bastiix Selfbot startet",
-                completion_title="Login-Fenster geöffnet",
-                completion_message="Bitte im Chrome-Fenster einloggen oder warten bis der Automatischer Login abgeschlossen ist.",
-            )
+        self.fast_start = FAST_START
+        self.selfbot_user = None
+        self._stop_event = threading.Event()
+        self._startup_done = False
+        self._token_rejected = False
+        self._token_verified = False
+        self.logger = debug_logger
+        # Optional: Token verschlüsselt zwischenspeichern, damit ein Neustart ohne Browser auskommt
+        self.session_cache = SessionCache.from_settings()
+
+        # Eigener asyncio-Loop, auf dem `async def`-Commands ausgeführt werden
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self._run_event_loop_with_backoff, daemon=True).start()
+        debug_logger.debug('init', 'Eigenen asyncio Event-Loop gestartet')
+
+        # Fast-Start: Modul-Entdeckung läuft parallel zum Login, der Client wird danach eingetragen
+        commands_ready = None
+        if self.fast_start:
+            debug_logger.debug('init', 'Fast-Start: CommandTree wird parallel zum Login aufgebaut')
+            commands_ready = self._in_background("commandtree", self._build_commands)
 
         # Login
+        self.bot = None
         try:
-            token = self._perform_login()
-            self.TOKEN = token.strip('"')
+            self.TOKEN = self._obtain_token()
             debug_logger.debug('init', 'Token erfolgreich abgerufen und geparst')
         except LoginError as le:
-            debug_logger.error('init', f"LoginError: {le}")
+            debug_logger.error('init', "LoginError: %s", le)
             append_message(f"Login fehlgeschlagen: {le}")
             if self.DEBUG:
                 self._write_stackdump(le, crash=True)
@@ -168,28 +208,92 @@ class SelfBot:
                 spawn_restart()
                 sys.exit(1)
 
-        # Bot-Setup
-        self.bot = discum.Client(token=self.TOKEN, log={'console': False, 'file': False})
-        self.selfbot_user = None
-        self._stop_event = threading.Event()
-        self.logger = debug_logger
-        self.commands = CommandTree(self.bot, prefix, logger=self.logger)
+        # Bot-Setup (bei gültiger gespeicherter Sitzung existiert der Client schon)
+        if self.bot is None:
+            with startup_profiler.phase("client"):
+                self.bot = discum.Client(token=self.TOKEN, log={'console': False, 'file': False})
+
+        if commands_ready is None:
+            self._build_commands()
+        else:
+            commands_ready.result()
+            self.commands.bot = self.bot
         self.commands.token = self.TOKEN
+        self.commands.start_reload_watcher()
+        self.commands.metrics.start_textfile_dump(self.commands.scheduler)
+        self.rest = self.commands.rest
+        # Prozesse für cpu_bound-Commands vorwärmen; Start und Modul-Imports laufen im Hintergrund
+        cpu_modules = self.commands.cpu_bound_modules()
+        if cpu_modules and process_pool.pool.enabled:
+            process_pool.pool.start(preload=cpu_modules)
+        self.dispatcher = CommandDispatcher(self.commands, logger=self.logger)
+        # Ein Timer-Rad für alle periodischen Jobs (Modul-Watcher, Metrik-Export, Modul-Jobs, Chameleon-Mask).
+        # Die Jobs laufen in eigenen Threads (SCHEDULER_WORKERS), nicht in den Befehls-Workern.
+        self.commands.scheduler.start(self._stop_event)
+        # Alle Nachrichten laufen über eine Sende-Queue pro Channel (Rate-Limits, Retries, Zusammenfassen).
+        # Sie teilt die Rate-Limit-Buckets mit der REST-Fassade.
+        self.outbound = OutboundQueue(
+            self.bot, metrics=self.commands.metrics, logger=self.logger, tracker=self.rest.tracker
+        )
+        # Queue-Tiefen für Crash-Reports
+        flight_recorder.add_gauge("dispatcher", lambda: self.dispatcher.depth)
+        flight_recorder.add_gauge("outbound", lambda: self.outbound.depth)
+        flight_recorder.add_gauge("store", lambda: self.commands.store.stats()["pending"])
+        flight_recorder.add_gauge("scheduler", lambda: len(self.commands.scheduler.jobs()))
+        flight_recorder.add_gauge("process_pool", process_pool.pool.stats)
 
         self.setup_events()
-        apply_chameleon_mask(self)
-        debug_logger.debug('init', 'Chameleon Mask angewendet')
-
-        self.loop = asyncio.new_event_loop()
-        threading.Thread(target=self._run_event_loop_with_backoff, daemon=True).start()
-        debug_logger.debug('init', 'Eigenen asyncio Event-Loop gestartet')
+        if self.fast_start:
+            # Unabhängig vom Rest des Starts, blockiert sonst mehrere Sekunden
+            self._in_background("chameleon_mask", self._apply_mask)
+        else:
+            self._apply_mask()
 
         atexit.register(self.cleanup)
         debug_logger.debug('init', 'SelfBot initialisiert')
-        self._startup_done = False
 
-    @retry((WebDriverException, SeleniumTimeout), tries=MAX_LOGIN_ATTEMPTS, delay=LOGIN_DELAY, backoff=BACKOFF, logger=debug_logger)
+    def _build_commands(self):
+        with startup_profiler.phase("commandtree"):
+            self.commands = CommandTree(getattr(self, 'bot', None), prefix, logger=self.logger, loop=self.loop)
+
+    def _apply_mask(self):
+        with startup_profiler.phase("chameleon_mask"):
+            apply_chameleon_mask(self)
+        debug_logger.debug('init', 'Chameleon Mask angewendet')
+
+    def _in_background(self, name: str, fn) -> Future:
+        """Startphase in eigenem Thread ausführen. Fehler landen im Future statt im excepthook."""
+        future: Future = Future()
+
+        def _run():
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                debug_logger.error('startup', "Startphase %s fehlgeschlagen: %s", name, e)
+                future.set_exception(e)
+
+        threading.Thread(target=_run, name=f"startup-{name}", daemon=True).start()
+        return future
+
     def _login_via_chrome(self):
+        # Selenium erst hier importieren: wird nur für den Login gebraucht
+        with startup_profiler.phase("import_selenium"):
+            from selenium.common.exceptions import WebDriverException, TimeoutException as SeleniumTimeout
+        attempt = retry(
+            (WebDriverException, SeleniumTimeout), tries=self.MAX_LOGIN_ATTEMPTS,
+            delay=self.LOGIN_DELAY, backoff=self.BACKOFF, logger=debug_logger
+        )(self._chrome_login_once)
+        return attempt()
+
+    def _chrome_login_once(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.common.exceptions import WebDriverException, TimeoutException as SeleniumTimeout
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+
         try:
             service = Service(log_path=os.devnull)
             opts = Options()
@@ -219,13 +323,13 @@ class SelfBot:
                 submit_btn.click()
                 debug_logger.debug('_login_via_chrome', 'Anmeldedaten abgeschickt')
             except Exception as e:
-                debug_logger.error('_login_via_chrome', f"Automatisches Login fehlgeschlagen: {e}")
+                debug_logger.error('_login_via_chrome', "Automatisches Login fehlgeschlagen: %s", e)
                 pretty_manual = True
                 if not self.DEBUG:
                     append_message('Automatisches Login fehlgeschlagen. Bitte manuell einloggen.')
 
         WebDriverWait(driver, 300, poll_frequency=1).until(lambda d: '/channels/' in d.current_url)
-        debug_logger.debug('_login_via_chrome', f"Redirect erkannt: {driver.current_url}")
+        debug_logger.debug('_login_via_chrome', "Redirect erkannt: %s", driver.current_url)
 
         driver.execute_script("""
             const iframe = document.createElement('iframe');
@@ -247,17 +351,71 @@ class SelfBot:
             sys.exit(1)
         finally:
             driver.quit()
-        debug_logger.debug('_login_via_chrome', f"Token gefunden: {token[:8]}…")
+        debug_logger.debug('_login_via_chrome', "Token gefunden: %s…", token[:8])
         return token
 
+    def _obtain_token(self) -> str:
+        """Token aus dem Session-Cache, sofern Discord es noch annimmt, sonst per Browser-Login."""
+        cached = self.session_cache.load() if self.session_cache is not None else None
+        if cached:
+            with startup_profiler.phase("session_check"):
+                valid = self._check_cached_token(cached)
+            if valid is not False:
+                debug_logger.debug('_obtain_token', "Gespeicherte Sitzung wird verwendet (%s)", self.session_cache.backend)
+                if not self.DEBUG:
+                    append_message('Gespeicherte Sitzung gefunden, Browser-Login wird übersprungen.')
+                return cached
+            self.bot = None
+            self.session_cache.clear()
+            if not self.DEBUG:
+                append_message('Gespeicherte Sitzung abgelaufen, Browser-Login wird gestartet.')
+
+        if not self.DEBUG:
+            pretty_banner(
+                banner_text="Bastiix Selfbot startet",
+                completion_title="Login-Fenster geöffnet",
+                completion_message="Bitte im Chrome-Fenster einloggen oder warten bis der Automatischer Login abgeschlossen ist.",
+            )
+        with startup_profiler.phase("login"):
+            token = self._perform_login().strip('"')
+        if self.session_cache is not None:
+            self.session_cache.save(token)
+        return token
+
+    def _check_cached_token(self, token: str):
+        """
+        Ein einzelner REST-Aufruf statt `verify_token` (das bei Fehlern beendet). True = gültig,
+        False = von Discord abgelehnt, None = nicht prüfbar (z. B. Netzwerk), dann prüft `run()` erneut.
+        """
+        self.bot = discum.Client(token=token, log={'console': False, 'file': False})
+        try:
+            resp = self.bot.info()
+        except Exception as e:
+            debug_logger.warning('_check_cached_token', "Gespeicherte Sitzung nicht prüfbar: %s", e)
+            return None
+        status = getattr(resp, 'status_code', 200)
+        if status in (401, 403):
+            debug_logger.warning('_check_cached_token', "Gespeicherte Sitzung von Discord abgelehnt (%s)", status)
+            return False
+        try:
+            data = resp.json() if hasattr(resp, 'json') else resp
+        except ValueError:
+            data = None
+        if status < 400 and isinstance(data, dict) and data.get('id'):
+            self._token_verified = True
+            return True
+        debug_logger.warning('_check_cached_token', "Unerwartete Antwort bei der Prüfung (%s)", status)
+        return None
+
     def _perform_login(self):
         try:
             return self._login_via_chrome()
         except Exception as e:
-            debug_logger.error('_perform_login', f'Login-Versuche erschöpft nach {self.MAX_LOGIN_ATTEMPTS} Versuchen: {e}')
+            debug_logger.error('_perform_login', "Login-Versuche erschöpft nach %s Versuchen: %s", self.MAX_LOGIN_ATTEMPTS, e)
             raise LoginError(f'Login nach {self.MAX_LOGIN_ATTEMPTS} Versuchen fehlgeschlagen', attempts=self.MAX_LOGIN_ATTEMPTS, last_exception=e) from e
 
     def _run_event_loop_with_backoff(self):
+        asyncio.set_event_loop(self.loop)
         retries = self.EVENT_LOOP_RETRIES
         delay = self.EVENT_LOOP_DELAY
         while retries > 0:
@@ -265,7 +423,7 @@ class SelfBot:
                 self.loop.run_forever()
                 return
             except Exception as e:
-                debug_logger.error('_run_event_loop', f"Event-Loop Fehler: {e}")
+                debug_logger.error('_run_event_loop', "Event-Loop Fehler: %s", e)
                 self._write_stackdump(e, crash=True)
                 if not self.DEBUG:
                     spawn_restart()
@@ -278,105 +436,112 @@ class SelfBot:
         if issubclass(exc_type, KeyboardInterrupt):
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
-        debug_logger.error('_unhandled_exception', f"{exc_value}")
+        debug_logger.error('_unhandled_exception', "%s", exc_value)
         self._write_stackdump(exc_value, crash=True)
+        if getattr(self, 'commands', None) is not None:
+            # Vor dem Neustart, sonst liest die neue Instanz einen veralteten Stand
+            self.commands.store.flush()
         if not self.DEBUG:
             spawn_restart()
         sys.exit(1)
 
     def _write_stackdump(self, exception, crash=False):
-        prefix = 'CRASH' if crash else 'EXCEPTION'
-        timestamp = datetime.utcnow().strftime('%H.%M_%d.%m.%Y')
-        filename = f"{prefix}_{timestamp}.log"
-        path = os.path.join('.', 'log', 'system', filename)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(f"{prefix} {datetime.utcnow().isoformat()}\n")
-            traceback.print_exception(type(exception), exception, exception.__traceback__, file=f)
-
-    def request_with_backoff(self, func, *args, **kwargs):
-        delay = 1
-        for attempt in range(1, 6):
-            try:
-                debug_logger.debug('backoff', f"Versuch {attempt} für {func.__name__}")
-                return func(*args, **kwargs)
-            except Exception as e:
-                debug_logger.warning('backoff', f"{func.__name__} fehlgeschlagen: {e}, warte {delay}s")
-                time.sleep(delay)
-                delay *= 2
-        debug_logger.error('backoff', f"Maximale Versuche für {func.__name__} erreicht")
-        if not self.DEBUG:
-            append_message(f"Fehler bei {func.__name__}. Maximale Versuche erreicht.")
-        sys.exit(1)
+        # Traceback plus Flugschreiber: letzte Log-Einträge, Events, Befehle, Queues und alle Thread-Stacks
+        try:
+            path = flight_recorder.write_crash_report(exception, crash=crash)
+        except OSError as e:
+            debug_logger.error('_write_stackdump', "Crash-Report konnte nicht geschrieben werden: %s", e)
+            return
+        debug_logger.error('_write_stackdump', "Crash-Report geschrieben: %s", path)
 
     def verify_token(self):
+        with startup_profiler.phase("verify_token"):
+            self._verify_token()
+
+    def _verify_token_concurrently(self):
+        # Läuft parallel zu gateway.run(): ein ungültiges Token beendet das Gateway, run() dann den Prozess
+        try:
+            self.verify_token()
+        except SystemExit:
+            self._token_rejected = True
+            self.bot.gateway.close()
+
+    def _verify_token(self):
         debug_logger.debug('verify_token', 'Überprüfe Token via REST info()')
         try:
-            resp = self.request_with_backoff(self.bot.info)
+            # 401/403 schlagen sofort fehl, nur 429/5xx/Timeouts werden wiederholt
+            resp = self.rest.info()
             data = resp.json() if hasattr(resp, 'json') else resp
             if not isinstance(data, dict) or not data.get('id'):
                 raise ValueError('Ungültige Antwort von info()')
-            debug_logger.debug('verify_token', f"Token gültig für User ID {data['id']}")
+            debug_logger.debug('verify_token', "Token gültig für User ID %s", data['id'])
         except Exception as e:
-            debug_logger.error('verify_token', f'Verifikation fehlgeschlagen: {e}')
+            debug_logger.error('verify_token', "Verifikation fehlgeschlagen: %s", e)
+            if self.session_cache is not None:
+                # Sonst würde jeder Neustart wieder mit dem abgelehnten Token beginnen
+                self.session_cache.clear()
             if not self.DEBUG:
                 append_message(f"Fehler beim Verifizieren des Tokens: {e}")
             sys.exit(1)
 
     async def simulate_typing_send(self, channel: str, message: str) -> None:
         try:
-            debug_logger.debug('simulate_typing_send', f"Aufruf mit channel={channel}, message length={len(message)}")
+            debug_logger.debug('simulate_typing_send', "Aufruf mit channel=%s, message length=%s", channel, len(message))
         except Exception as e:
-            debug_logger.error('simulate_typing_send', f"Logger konnte Eingangsparameter nicht protokollieren: {e}")
+            debug_logger.error('simulate_typing_send', "Logger konnte Eingangsparameter nicht protokollieren: %s", e)
 
         if not re.fullmatch(r"\d+", channel):
             err_msg = f"Ungültige channel-ID: {channel}"; debug_logger.error('simulate_typing_send', err_msg); raise ValueError(err_msg)
 
         async def _type_and_wait(chan: str, wait: float):
-            try:
-                self.bot.typingAction(chan)
-                debug_logger.debug('simulate_typing_send', f"Typing event ausgelöst für {wait:.2f}s")
-            except DiscordError as e:
-                debug_logger.error('simulate_typing_send', f"Discord-Fehler beim Typing-Event: {e}")
-            except Exception as e:
-                debug_logger.error('simulate_typing_send', f"Unbekannter Fehler beim Typing-Event: {e}")
+            if self.outbound.typing(chan):
+                debug_logger.debug('simulate_typing_send', "Typing event ausgelöst für %.2fs", wait)
             await asyncio.sleep(wait)
 
         if len(message) > MAX_CHUNK_SIZE:
-            total_chunks = (len(message) + MAX_CHUNK_SIZE - 1) // MAX_CHUNK_SIZE
-            debug_logger.debug('simulate_typing_send', f"Nachricht in {total_chunks} Chunks aufgeteilt")
-            for idx, i in enumerate(range(0, len(message), MAX_CHUNK_SIZE), start=1):
-                chunk = message[i:i + MAX_CHUNK_SIZE]
-                debug_logger.debug('simulate_typing_send', f"Bereite Chunk {idx}/{total_chunks} vor (Zeichen {i}-{i+len(chunk)})")
+            # An Zeilengrenzen teilen, Code-Blöcke werden pro Chunk geschlossen und wieder geöffnet
+            for idx, chunk in enumerate(iter_chunks(message, MAX_CHUNK_SIZE), start=1):
+                debug_logger.debug('simulate_typing_send', "Bereite Chunk %s vor (%s Zeichen)", idx, len(chunk))
                 try:
                     await _type_and_wait(channel, 1.0)
-                    self.bot.sendMessage(channel, chunk)
-                    debug_logger.debug('simulate_typing_send', f"Chunk {idx}/{total_chunks} gesendet an {channel}")
+                    await asyncio.wrap_future(self.outbound.send(channel, chunk))
+                    debug_logger.debug('simulate_typing_send', "Chunk %s gesendet an %s", idx, channel)
                 except DiscordError as e:
-                    debug_logger.error('simulate_typing_send', f"Discord-Fehler beim Chunk {idx}: {e}")
+                    debug_logger.error('simulate_typing_send', "Discord-Fehler beim Chunk %s: %s", idx, e)
                 except Exception as e:
-                    debug_logger.error('simulate_typing_send', f"Unbekannter Fehler beim Chunk {idx}: {e}")
+                    debug_logger.error('simulate_typing_send', "Unbekannter Fehler beim Chunk %s: %s", idx, e)
             return
 
         length = len(message)
         delay = 1.0 if length <= 100 else 1.0 + (min(length, MAX_CHUNK_SIZE) - 100) * 3.0 / (MAX_CHUNK_SIZE - 100)
-        debug_logger.debug('simulate_typing_send', f"Simuliere Tippen für {length} Zeichen: Warte {delay:.2f}s")
+        debug_logger.debug('simulate_typing_send', "Simuliere Tippen für %s Zeichen: Warte %.2fs", length, delay)
         try:
             await _type_and_wait(channel, delay)
-            self.bot.sendMessage(channel, message)
-            debug_logger.debug('simulate_typing_send', f"Nachricht gesendet an {channel}")
+            await asyncio.wrap_future(self.outbound.send(channel, message))
+            debug_logger.debug('simulate_typing_send', "Nachricht gesendet an %s", channel)
         except DiscordError as e:
-            debug_logger.error('simulate_typing_send', f"Discord-Fehler beim Senden: {e}")
+            debug_logger.error('simulate_typing_send', "Discord-Fehler beim Senden: %s", e)
         except Exception as e:
-            debug_logger.error('simulate_typing_send', f"Unbekannter Fehler beim Senden: {e}")
+            debug_logger.error('simulate_typing_send', "Unbekannter Fehler beim Senden: %s", e)
 
     def setup_events(self):
-        @self.bot.gateway.command
-        def on_connect(resp):
-            if not resp.event.ready_supplemental:
-                return
-            debug_logger.debug('on_connect', f"Connected: ready={resp.event.ready_supplemental}")
-            time.sleep(1)
+        self.recorder = None
+        if GATEWAY_RECORD_PATH:
+            # Mitschnitt für Offline-Replay (benchmarks/bench_gateway.py)
+            self.recorder = GatewayRecorder(GATEWAY_RECORD_PATH)
+            self.recorder.attach(self.bot.gateway)
+
+        # Ein einziger Gateway-Callback, der nach Event-Typ verteilt. Handler bekommen das rohe `d`-Dict.
+        events = self.commands.events
+        events.attach(self.bot.gateway)
+
+        def on_connect(data):
+            debug_logger.debug('on_connect', "Connected: READY_SUPPLEMENTAL empfangen")
+            startup_profiler.end("gateway_connect")
+            startup_profiler.begin("on_connect")
+            if not self.fast_start:
+                # Fast-Start wartet nicht: fehlt der User im Session-Cache, greift der REST-Fallback
+                time.sleep(1)
             try:
                 u = self.bot.gateway.session.user
                 if not u or not u.get('id'):
@@ -384,9 +549,13 @@ class SelfBot:
                 self.selfbot_user = u
                 debug_logger.debug('on_connect', 'User aus Gateway-Cache geladen')
             except Exception:
-                resp = self.request_with_backoff(self.bot.info)
-                self.selfbot_user = resp.json() if hasattr(resp, 'json') else resp
-                debug_logger.debug('on_connect', 'User über REST info() geladen')
+                try:
+                    resp = self.rest.info()
+                    self.selfbot_user = resp.json() if hasattr(resp, 'json') else resp
+                    debug_logger.debug('on_connect', 'User über REST info() geladen')
+                except RestError as e:
+                    debug_logger.error('on_connect', "User konnte nicht geladen werden: %s", e)
+                    self.selfbot_user = {'username': 'unbekannt'}
             payload = {'op': 3, 'd': {'since': 0, 'activities': [], 'status': 'online', 'afk': False}}
             self.bot.gateway.send(payload)
 
@@ -396,57 +565,159 @@ class SelfBot:
                 append_message(f"Angemeldet als {self.selfbot_user['username']}#{self.selfbot_user.get('discriminator','')}")
                 append_message(f"Geladene Befehle: {len(self.commands.commands)}")
                 print_banner('Laufzeit')
+            startup_profiler.end("on_connect")
+            startup_profiler.finish()
+
+        def accept_message(msg):
+            # Vorfilter auf den Rohdaten: die meisten Nachrichten sind keine Befehle
+            content = msg.get('content')
+            if not content or not content.lstrip().startswith(self.commands.prefix):
+                return False
+            author = msg.get('author') or {}
+            if author.get('bot', False):
+                return False
+            return not self.allowed_users or str(author.get('id')) in self.allowed_users
 
-        @self.bot.gateway.command
-        def on_message(resp):
-            if not resp.event.message:
-                return
-            try:
-                msg = resp.parsed.auto()
-            except Exception:
-                debug_logger.error('on_message', 'Parsing fehlgeschlagen')
-                return
+        def on_message(msg):
             author = msg.get('author') or {}
-            author_id = str(author.get('id'))
-            if author.get('bot', False) or (self.allowed_users and author_id not in self.allowed_users):
-                return
             content = msg.get('content', '').strip()
             channel = msg.get('channel_id')
             message_id = msg.get('id')
-            if not content.startswith(self.commands.prefix):
-                return
-            debug_logger.debug('on_message', f"Inhalt empfangen: {content}")
-            handled, reply = self.commands.handle(channel, author, content)
+            received_at = time.perf_counter()
+            debug_logger.debug('on_message', "Inhalt empfangen: %s", content)
+            handled, invocation, reply = self.commands.prepare(channel, author, content)
             if not handled:
                 return
-            if not self.DEBUG:
-                cmd_label = content.split()[0]
-                append_message(f"{author.get('username','?')} hat den Befehl {cmd_label} ausgeführt.")
-            try:
-                self.bot.typingAction(channel)
-                self.bot.reply(channel, message_id, reply)
-                debug_logger.debug('on_message', f"Replied to message {message_id} in channel {channel}")
-            except Exception as e:
-                debug_logger.error('on_message', f"Fehler beim Reply: {e}")
+
+            def observe_reply(fut):
+                if fut.exception() is None:
+                    self.commands.metrics.observe_reply(time.perf_counter() - received_at)
+
+            def respond(result):
+                # `result` ist ein String, ein Iterator (Streaming-Command) oder eine FileResponse
+                if not self.DEBUG:
+                    cmd_label = content.split()[0]
+                    append_message(f"{author.get('username','?')} hat den Befehl {cmd_label} ausgeführt.")
+                sent = 0
+                previous = None
+                try:
+                    if isinstance(result, str) and ATTACHMENT_THRESHOLD and len(result) > ATTACHMENT_THRESHOLD:
+                        # Statt dutzender Chunks eine komprimierte Textdatei
+                        result = FileResponse.from_text(result, content=f"Ausgabe ({len(result)} Zeichen) als Anhang.")
+                    if isinstance(result, FileResponse):
+                        previous = self.outbound.send_file(channel, result, reply_to=message_id)
+                        previous.add_done_callback(observe_reply)
+                        previous.result()
+                        return
+                    source = result
+                    overflow = []
+                    if ATTACHMENT_THRESHOLD and is_streaming(result):
+                        # Langer Stream: nur die ersten ATTACHMENT_THRESHOLD Zeichen gehen als Nachrichten raus,
+                        # der Rest als Anhang. Der Anhang entsteht aus dem Rohtext, nicht aus den Chunks, sonst
+                        # stünden die vom Chunker eingefügten ``` zum Schließen/Wiederöffnen von Code-Blöcken darin.
+                        raw = iter(result)
+
+                        def head():
+                            budget = ATTACHMENT_THRESHOLD
+                            for piece in raw:
+                                piece = piece if isinstance(piece, str) else str(piece)
+                                if len(piece) > budget:
+                                    # Möglichst an einer Zeilengrenze trennen; ohne Umbruch das Stück ganz in den Anhang
+                                    cut = piece.rfind("\n", 0, budget) + 1
+                                    if not cut and budget == ATTACHMENT_THRESHOLD:
+                                        cut = budget
+                                    yield piece[:cut]
+                                    overflow.append(piece[cut:])
+                                    return
+                                budget -= len(piece)
+                                yield piece
+
+                        source = head()
+                    for chunk in iter_chunks(source, MAX_CHUNK_SIZE):
+                        if previous is not None:
+                            # Höchstens ein Chunk pro Stream in der Queue, sonst wächst sie bei großen Ausgaben unbegrenzt
+                            previous.result()
+                        if sent == 0:
+                            previous = self.outbound.reply(channel, message_id, chunk)
+                            previous.add_done_callback(observe_reply)
+                        else:
+                            previous = self.outbound.send(channel, chunk, typing=True)
+                        sent += 1
+                    if overflow:
+                        rest = FileResponse.from_text(
+                            (p if isinstance(p, str) else str(p) for p in itertools.chain(overflow, raw)),
+                            content="Restliche Ausgabe als Anhang."
+                        )
+                        previous = self.outbound.send_file(channel, rest, reply_to=None if sent else message_id)
+                        if not sent:
+                            previous.add_done_callback(observe_reply)
+                        previous.result()
+                        sent += 1
+                    debug_logger.debug('on_message', "Reply an message %s in channel %s eingereiht (%s Nachrichten)", message_id, channel, sent)
+                except Exception as e:
+                    debug_logger.error('on_message', "Fehler beim Reply nach %s Nachrichten: %s", sent, e)
+                    self.outbound.send(channel, error_message(f"Ausgabe abgebrochen: {e}"))
+
+            if invocation is None:
+                respond(reply)
+                return
+            # Ausführung und Antwort laufen im Worker-Pool, der Gateway-Thread bleibt frei
+            if not self.dispatcher.submit(invocation, respond):
+                respond(self.dispatcher.reject_message(invocation))
+
+        events.on("READY_SUPPLEMENTAL", on_connect)
+        events.on("MESSAGE_CREATE", on_message, accept=accept_message)
 
     def cleanup(self):
         debug_logger.debug('cleanup', 'Starte Cleanup')
         self._stop_event.set()
+        try:
+            self.commands.scheduler.stop()
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Stoppen des Schedulers: %s", e)
+        try:
+            self.dispatcher.shutdown(wait=False)
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Beenden des Dispatchers: %s", e)
+        try:
+            self.outbound.shutdown(timeout=5.0)
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Beenden der Sende-Queue: %s", e)
+        try:
+            self.commands.store.close()
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Schreiben des Stores: %s", e)
+        try:
+            process_pool.pool.shutdown()
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Beenden des Prozess-Pools: %s", e)
+        if self.recorder is not None:
+            self.recorder.close()
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except Exception as e:
+            debug_logger.error('cleanup', "Fehler beim Stoppen des Event-Loops: %s", e)
         try:
             self.bot.gateway.close()
             debug_logger.debug('cleanup', 'Gateway geschlossen')
         except Exception as e:
-            debug_logger.error('cleanup', f"Fehler beim Schließen. Erzwinge das schließen in 10 Sekunden. Fehler: {e}")
+            debug_logger.error('cleanup', "Fehler beim Schließen. Erzwinge das schließen in 10 Sekunden. Fehler: %s", e)
             time.sleep(10)
             sys.exit(1)
 
     def run(self):
-        self.verify_token()
+        if self._token_verified:
+            debug_logger.debug('run', 'Token wurde beim Laden der Sitzung bereits geprüft')
+        elif self.fast_start:
+            self._in_background("verify_token", self._verify_token_concurrently)
+        else:
+            self.verify_token()
         if self.DEBUG:
             debug_logger.debug('startup', 'Starte im Debug-Modus')
         else:
             print_banner('Initialisierung abgeschlossen')
             append_message('Starte Selfbot login...')
+        startup_profiler.begin("gateway_connect")
         try:
             self.bot.gateway.run(auto_reconnect=True)
         except KeyboardInterrupt:
@@ -458,16 +729,21 @@ class SelfBot:
                     completion_title='Alle Systeme offline',
                     completion_message='Bis zum nächsten Mal!'
                 )
+                # Abschied noch vollständig anzeigen, atexit würde die Animation abkürzen
+                console_renderer.flush(timeout=5.0)
             sys.exit(0)
         except Exception as e:
-            debug_logger.error('run', f"Gateway-Fehler: {e}")
+            debug_logger.error('run', "Gateway-Fehler: %s", e)
         else:
+            if self._token_rejected:
+                sys.exit(1)
             if not self.DEBUG:
                 pretty_banner(
                     banner_text='Discum Selfbot wird beendet',
                     completion_title='Alle Systeme offline',
                     completion_message='Bis zum nächsten Mal!'
                 )
+                console_renderer.flush(timeout=5.0)
 
 if __name__ == '__main__':
     bot = SelfBot(DEBUG=DEBUG)
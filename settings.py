@@ -5,20 +5,65 @@
 
 DEBUG = False                                       # Debug-Mode (True/False) Prettymode = DEBUGMODE FALSE
 LOGGING = True                                      # Logging-Mode (True/False) 
+LOG_ASYNC = True                                    # Log-Einträge im Hintergrund gebündelt schreiben (False = sofort im aufrufenden Thread)
+LOG_FLUSH_INTERVAL = 0.5                            # Sekunden zwischen zwei Flushes der Logdatei im Async-Modus
+LOG_LEVEL = "DEBUG"                                 # Mindest-Level der Ausgabe: "DEBUG", "WARNING" oder "ERROR"
+LOG_STRUCTURED = False                              # True = JSONL-Logs unter log/structured/ (rotiert + gzip) statt einer .txt-Datei
+LOG_ROTATE_BYTES = 10 * 1024 * 1024                 # Segmentgröße, ab der rotiert wird
+LOG_ROTATE_AGE = 24 * 60 * 60                       # Maximales Alter eines Segments in Sekunden (0 = nur nach Größe)
+LOG_MAX_TOTAL_BYTES = 200 * 1024 * 1024             # Obergrenze für alle Segmente zusammen, älteste werden gelöscht (0 = unbegrenzt)
 PREFIX = ""                                        # Prefix für Befehle   
 LOGIN_EMAIL = ""                                    # leer lassen wenn login manuell eingegeben werden soll
 LOGIN_PASSWORD = ""                                 # leer lassen wenn login manuell eingegeben werden soll
+SESSION_CACHE = ""                                  # Token für Neustarts merken: "" = aus, "keyring" = OS-Schlüsselbund, "passphrase" = verschlüsselte Datei
+SESSION_CACHE_PATH = "cache/session.bin"            # Datei für SESSION_CACHE = "passphrase" (wird mit 0600 angelegt)
+SESSION_CACHE_PASSPHRASE = ""                       # leer lassen und besser die Umgebungsvariable SELFBOT_SESSION_PASSPHRASE setzen
 
 ALLLOWED_USERS = ("", "")                           # Liste der erlaubten User IDs [z.B. ("123456789012345678", "987654321098765432")] leer lassen wenn alle User erlaubt sind 
 MAINCOLOR   = "\033[1;36m"                          # Hauptfarbe
 SECONDCOLOR = "\033[94m"                            # Sekundärfarbe       
 STAMPCOLOR  = "\033[1;33m"                          # Zeitstempel-Farbe
 RESETCOLOR  = "\033[0m"                             # Reset-Farbe 
+CONSOLE_QUEUE_SIZE = 256                            # Max. wartende Konsolen-Ausgaben (Banner/Meldungen), darüber hinaus wird verworfen
 
+FAST_START = False                                  # Unabhängige Startphasen parallel ausführen (wie `python main.py --fast-start`)
 MAX_CHUNK_SIZE = 2000                               # Maximaler Chunk-Size für Discord-Nachrichten
 
 SELFBOT_DUMP_CHANNEL = ""        # Discord Dump Channel ID
 
+DISPATCH_WORKERS = 4                                # Anzahl Worker-Threads für die Befehlsausführung
+DISPATCH_QUEUE_LIMIT = 64                           # Maximale Anzahl laufender + wartender Befehle, danach wird abgelehnt
+COMMAND_TIMEOUT = 60                                # Standard-Timeout pro Befehl in Sekunden (0 = kein Timeout)
+OUTBOUND_WORKERS = 2                                # Threads der Sende-Queue (Channels werden parallel, pro Channel der Reihe nach gesendet)
+OUTBOUND_MAX_RETRIES = 5                            # Wiederholungen bei Netzwerkfehlern/5xx (429 wird immer nach retry_after wiederholt)
+OUTBOUND_COALESCE = True                            # Angestaute kurze Nachrichten eines Channels zu einer zusammenfassen
+ATTACHMENT_THRESHOLD = 8000                         # Textausgaben über so vielen Zeichen als gzip-Anhang statt in Chunks senden (0 = immer Chunks)
+ATTACHMENT_MAX_SIZE = 10 * 1024 * 1024              # Max. Größe eines Anhangs in Byte (Upload-Limit von Discord, 0 = nicht prüfen)
+RATE_LIMIT_GLOBAL = None                            # Max. Befehle (Anzahl, Sekunden) über alle User zusammen, z. B. (30, 10) (None = unbegrenzt)
+RATE_LIMIT_USER = None                              # Max. Befehle (Anzahl, Sekunden) pro User, z. B. (10, 10) (None = unbegrenzt)
+RATE_LIMIT_COMMAND = None                           # Standard-Limit pro Befehl über alle User, Module können per Command(rate_limit=...) eigene setzen
+RATE_LIMIT_DROP_AFTER = 3                           # Nach so vielen abgelehnten Aufrufen in Folge wird ohne Antwort verworfen
+COMMAND_CACHE_TTL = 60                              # Standard-Gültigkeit in Sekunden für mit @cached markierte Befehle
+COMMAND_CACHE_SIZE = 256                            # Standard-Anzahl Einträge pro gecachtem Befehl (LRU)
+REST_MAX_RETRIES = 3                                # Wiederholungen für REST-Aufrufe nach 429, bei GET/PUT/PATCH/DELETE auch nach 5xx und Timeouts
+REST_TIMEOUT = 15                                   # Sekunden, nach denen ein REST-Request als Timeout gilt
+REST_POOL_SIZE = 16                                 # Offene Keep-Alive-Verbindungen zu Discord (sollte >= DISPATCH_WORKERS + OUTBOUND_WORKERS sein)
+REST_CACHE_TTL = 0                                  # Sekunden, die GET-Antworten zwischengespeichert werden (0 = nur per call(..., cache_ttl=...))
+REST_CACHE_SIZE = 512                               # Max. gecachte GET-Antworten (LRU)
+STATE_CACHE_MAX_ENTRIES = 20000                     # Max. Guilds + Channels + Rollen im State-Cache (ctx["state"]), darüber werden ungenutzte Guilds verdrängt (0 = nur REST)
+PROCESS_POOL_SIZE = 2                               # Prozesse für Commands mit cpu_bound=True (0 = aus, sie laufen dann im Worker-Thread)
+PROCESS_POOL_MAX_TASKS = 100                        # Aufträge, nach denen ein Prozess durch einen frischen ersetzt wird (0 = nie)
+STORE_COMMIT_INTERVAL = 0.5                         # Sekunden, in denen Schreibzugriffe auf den Modul-Store gesammelt und gemeinsam committet werden
+STORE_CACHE_SIZE = 10000                            # Max. Werte im Lese-Cache des Modul-Stores (LRU)
+SCHEDULER_TICK = 0.25                               # Sekunden pro Slot im Timer-Rad des Schedulers (Genauigkeit geplanter Jobs)
+SCHEDULER_WORKERS = 2                               # Threads, in denen geplante Jobs laufen (getrennt von den Befehls-Workern)
+FLIGHT_RECORDER_SIZE = 2000                         # Letzte Log-Einträge, Gateway-Events und Befehle im Speicher für Crash-Reports (0 = aus)
+LAZY_MODULES = True                                 # Module erst beim ersten Aufruf importieren (Index unter cache/module_index.json)
+MODULE_RELOAD_INTERVAL = 0                          # Sekunden zwischen automatischen Reload-Prüfungen der Module (0 = nur per Befehl)
+METRICS_TEXTFILE_PATH = ""                          # Pfad für den Prometheus-Textfile-Export der Befehls-Metriken, z. B. "/var/lib/node_exporter/textfile/selfbot.prom" (leer = aus)
+METRICS_DUMP_INTERVAL = 15                          # Sekunden zwischen zwei Exporten
+GATEWAY_RECORD_PATH = ""                            # Pfad einer JSONL-Datei, in die Gateway-Events für Offline-Replays mitgeschnitten werden (leer = aus)
+
 
 
 # SYSTEM-Variablen (besser nicht ändern wenn nicht nötig)
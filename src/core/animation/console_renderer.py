@@ -0,0 +1,132 @@
+# ---------------------------------------------------------------------------
+# \src\core\animation\console_renderer.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from typing import Callable, Deque, Optional
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+CONSOLE_QUEUE_SIZE = getattr(settings, 'CONSOLE_QUEUE_SIZE', 256)
+
+# So lange wartet das Programmende höchstens auf noch nicht ausgegebene Meldungen
+_EXIT_FLUSH_TIMEOUT = 2.0
+
+Job = Callable[["ConsoleRenderer"], None]
+
+
+class ConsoleRenderer:
+    """
+    Gibt die Konsolen-UI (Banner, Laufzeit-Meldungen, Animationen) in einem eigenen Thread aus.
+
+    `submit` kehrt sofort zurück. Die Queue ist auf `maxsize` Einträge begrenzt, darüber
+    hinaus wird verworfen und später als eine Zeile "N Meldungen übersprungen" gemeldet.
+    Animationen fragen `hurry()` ab: Wartet bereits die nächste Ausgabe, wird der Rest
+    einer Typewriter-Zeile auf einmal geschrieben und Pulse-Effekte werden abgebrochen.
+    """
+
+    def __init__(self, maxsize: int = CONSOLE_QUEUE_SIZE):
+        self.maxsize = max(1, int(maxsize))
+        self._cond = threading.Condition()
+        self._jobs: Deque[Job] = deque()
+        self._busy = False
+        self._closing = False
+        self._dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backlog(self) -> int:
+        return len(self._jobs)
+
+    def submit(self, job: Job) -> bool:
+        """Reiht eine Ausgabe ein. False, wenn die Queue voll ist und die Ausgabe verworfen wurde."""
+        with self._cond:
+            if len(self._jobs) >= self.maxsize:
+                self._dropped += 1
+                return False
+            self._jobs.append(job)
+            self._cond.notify_all()
+        self._ensure_thread()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wartet, bis alles ausgegeben ist (z. B. vor `input()`). False bei Timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    def close(self, timeout: float = _EXIT_FLUSH_TIMEOUT) -> None:
+        # Beim Beenden keine Animationen mehr, nur noch den Rest ausgeben
+        self._closing = True
+        with self._cond:
+            self._cond.notify_all()
+        self.flush(timeout)
+
+    # --- Hilfen für Jobs -----------------------------------------------------
+
+    def hurry(self) -> bool:
+        """True, wenn Animationen abgekürzt werden sollen (weitere Ausgaben warten oder Programmende)."""
+        return self._closing or bool(self._jobs)
+
+    def write(self, text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def typewrite(self, text: str, delay: float) -> None:
+        """Zeichenweise Ausgabe mit Zeilenumbruch. Bei Rückstau wird der Rest sofort geschrieben."""
+        out = sys.stdout
+        for i, ch in enumerate(text):
+            if self.hurry():
+                out.write(text[i:])
+                break
+            out.write(ch)
+            out.flush()
+            time.sleep(delay)
+        out.write("\n")
+        out.flush()
+
+    def pause(self, seconds: float) -> bool:
+        """Wartet `seconds`, bricht aber ab, sobald eine neue Ausgabe eintrifft. False bei Abbruch."""
+        with self._cond:
+            return not self._cond.wait_for(self.hurry, seconds)
+
+    # --- Thread --------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='console-renderer', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                job = self._jobs.popleft()
+                self._busy = True
+                dropped, self._dropped = self._dropped, 0
+            try:
+                if dropped:
+                    self.write(f"   ↳ {dropped} Konsolen-Meldungen übersprungen\n")
+                job(self)
+            except Exception as e:
+                # Die Konsolenausgabe darf nie den Bot stören
+                try:
+                    sys.stderr.write(f"Konsolenausgabe fehlgeschlagen: {e}\n")
+                except Exception:
+                    pass
+
+
+renderer = ConsoleRenderer()
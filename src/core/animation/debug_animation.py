@@ -4,11 +4,20 @@
 # ---------------------------------------------------------------------------
 import os
 import re
+import sys
+import time
+import queue
 import atexit
 import shutil
+import signal
 import textwrap
+import threading
+import traceback
 from datetime import datetime
- 
+
+from src.core.animation.structured_log import StructuredLogSink, current_trace_id
+from src.core.system.flight_recorder import flight_recorder
+
 try:
     import settings
 except ImportError:
@@ -22,6 +31,22 @@ _RESET       = settings.RESETCOLOR or "\033[0m"
 
 _ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
 
+# Log-Level (aufsteigend). Ausgegeben wird alles ab `LOG_LEVEL`, sofern DEBUG aktiv ist.
+DEBUG   = 10
+WARNING = 30
+ERROR   = 40
+_LEVELS = {"DEBUG": DEBUG, "WARNING": WARNING, "WARNUNG": WARNING, "ERROR": ERROR, "FEHLER": ERROR}
+# Anzeigename -> Level-Name im strukturierten Log
+_LEVEL_KEYS = {"DEBUG": "DEBUG", "WARNUNG": "WARNING", "FEHLER": "ERROR"}
+
+LOG_ASYNC          = getattr(settings, "LOG_ASYNC", True)
+LOG_FLUSH_INTERVAL = getattr(settings, "LOG_FLUSH_INTERVAL", 0.5)
+LOG_STRUCTURED     = getattr(settings, "LOG_STRUCTURED", False)
+LOG_BATCH_SIZE     = 256
+_WIDTH_REFRESH     = 5.0
+_EMPTY             = object()
+
+
 class DebugConsole:
     def __init__(self):
         self._debug_count = 0
@@ -30,21 +55,84 @@ class DebugConsole:
 
         self.debug_enabled   = getattr(settings, "DEBUG", False)
         self.logging_enabled = getattr(settings, "LOGGING", False)
+        self.level           = self._parse_level(getattr(settings, "LOG_LEVEL", DEBUG))
+        self.async_enabled   = LOG_ASYNC
         self._log_fp         = None
+        self._sink           = None
 
-        if self.logging_enabled:
+        # Terminalbreite und TextWrapper werden gecacht statt pro Zeile neu erzeugt
+        self._width          = None
+        self._width_checked  = 0.0
+        self._wrapper        = None
+        self._wrap_lock      = threading.Lock()
+
+        # Jeder Eintrag landet im Flugschreiber, auch wenn DEBUG aus ist (für Crash-Reports).
+        # Ausgegebene Einträge fertig formatiert, verworfene als Momentaufnahme von msg/args.
+        self._record         = flight_recorder.append
+
+        self._queue          = queue.SimpleQueue()
+        flight_recorder.add_gauge("log_queue", self._queue.qsize)
+        self._writer         = None
+        self._writer_lock    = threading.Lock()
+
+        if self.logging_enabled and LOG_STRUCTURED:
+            # JSONL-Segmente mit Rotation/Kompression statt einer wachsenden .txt-Datei
+            self._sink = StructuredLogSink()
+        elif self.logging_enabled:
             base_log_dir = os.path.join(os.getcwd(), "log", "debug")
             os.makedirs(base_log_dir, exist_ok=True)
             fname = datetime.now().strftime("%Y%m%d_%H%M%S") + ".txt"
-            self._log_fp = open(os.path.join(base_log_dir, fname), "a", encoding="utf-8", buffering=1)
-            atexit.register(self._close_log)
+            # Im Async-Modus wird gepuffert und periodisch vom Writer geflusht
+            buffering = -1 if self.async_enabled else 1
+            self._log_fp = open(os.path.join(base_log_dir, fname), "a", encoding="utf-8", buffering=buffering)
+        atexit.register(self._close_log)
+        self._install_resize_handler()
+
+    @staticmethod
+    def _parse_level(value) -> int:
+        if isinstance(value, int):
+            return value
+        return _LEVELS.get(str(value).upper(), DEBUG)
+
+    def set_level(self, value) -> None:
+        self.level = self._parse_level(value)
+
+    def is_enabled(self, level: int = DEBUG) -> bool:
+        """Günstige Vorab-Prüfung, ob ein Eintrag dieses Levels überhaupt ausgegeben würde."""
+        return self.debug_enabled and level >= self.level
+
+    def _install_resize_handler(self):
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None or threading.current_thread() is not threading.main_thread():
+            return
+        try:
+            previous = signal.getsignal(sigwinch)
+
+            def _on_resize(signum, frame):
+                self._width = None
+                if callable(previous):
+                    previous(signum, frame)
+
+            signal.signal(sigwinch, _on_resize)
+        except (ValueError, OSError):
+            pass
 
     def _close_log(self):
+        self.flush()
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join(timeout=2.0)
         if self._log_fp:
             self._log_fp.close()
             self._log_fp = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
 
     def _strip_ansi(self, text: str) -> str:
+        if "\x1b" not in text:
+            return text
         return _ANSI_ESCAPE_RE.sub("", text)
 
     def _log_line(self, line: str):
@@ -52,50 +140,197 @@ class DebugConsole:
             self._log_fp.write(self._strip_ansi(line) + "\n")
             self._log_fp.flush()
 
-    def _print_message(self, level_name: str, count: int, fn: str, msg: str, color: str):
-        if not self.debug_enabled:
-            return
+    def _terminal_width(self) -> int:
+        now = time.monotonic()
+        if self._width is None or now - self._width_checked > _WIDTH_REFRESH:
+            width = shutil.get_terminal_size((80, 20)).columns
+            if width != self._width:
+                self._wrapper = None
+            self._width = width
+            self._width_checked = now
+        return self._width
 
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _format(self, level_name: str, count: int, fn: str, msg: str, color: str, ts: str):
         header = f"{_TS_COLOR}{ts}{_RESET}"
         tag    = f"{color}[{level_name}#{count}]{_RESET}"
         fncol  = f"{_DEBUG_COLOR}{fn}{_RESET}"
         raw    = f"{ts} [{level_name}#{count}] {fn}"
 
-        width  = shutil.get_terminal_size((80, 20)).columns
+        width  = self._terminal_width()
         if len(raw) > width - 4:
             raw = raw[: width - 4]
 
         pad       = " " * (len(raw) - len(raw.rstrip()))
         arrow     = " → "
         prefix    = f"{header} {tag} {fncol}{pad}{arrow}"
-        indent    = len(self._strip_ansi(prefix))
+        # Länge des Präfix ohne ANSI-Codes: ts + " [" + level + "#" + count + "] " + fn + pad + " → "
+        indent    = len(ts) + len(level_name) + len(str(count)) + len(fn) + len(pad) + 8
 
-        wrapper = textwrap.TextWrapper(
-            width=width,
-            initial_indent=prefix,
-            subsequent_indent=" " * indent,
-            replace_whitespace=False,
-            drop_whitespace=False
-        )
+        wrapper = self._wrapper
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(
+                width=width,
+                replace_whitespace=False,
+                drop_whitespace=False
+            )
+            self._wrapper = wrapper
+        wrapper.initial_indent = prefix
+        wrapper.subsequent_indent = " " * indent
 
+        lines = []
         for paragraph in msg.split("\n"):
-            for line in wrapper.wrap(paragraph):
-                print(line)
-                self._log_line(line)
+            lines.extend(wrapper.wrap(paragraph))
+        return lines
+
+    def _print_message(self, level_name: str, count: int, fn: str, msg: str, color: str, trace_id=None):
+        if not self.debug_enabled:
+            return
+
+        now = time.time()
+        if trace_id is None:
+            trace_id = current_trace_id()
+        if self.async_enabled:
+            self._ensure_writer()
+            self._queue.put((level_name, count, fn, msg, color, now, trace_id))
+            return
+
+        ts = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        with self._wrap_lock:
+            lines = self._format(level_name, count, fn, msg, color, ts)
+        for line in lines:
+            print(line)
+            self._log_line(line)
+        sink = self._sink
+        if sink is not None:
+            sink.write(now, _LEVEL_KEYS.get(level_name, level_name), count, fn, self._strip_ansi(msg), trace_id)
+
+    # --- Hintergrund-Writer --------------------------------------------------
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name='debug-log-writer', daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                item = _EMPTY
+            batch = [] if item is _EMPTY else [item]
+            # Alles, was bereits wartet, in einem Rutsch mitnehmen
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
 
-    def debug(self, fn: str, msg: str):
+            stop = False
+            markers = []
+            console = []
+            filelines = []
+            jsonlines = []
+            sink = self._sink
+            for record in batch:
+                if record is None:
+                    stop = True
+                    continue
+                if isinstance(record, threading.Event):
+                    markers.append(record)
+                    continue
+                level_name, count, fn, msg, color, now, trace_id = record
+                try:
+                    ts = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+                    lines = self._format(level_name, count, fn, msg, color, ts)
+                    if sink is not None:
+                        jsonlines.append(sink.encode(
+                            now, _LEVEL_KEYS.get(level_name, level_name), count, fn, self._strip_ansi(msg), trace_id
+                        ))
+                except Exception as e:
+                    lines = [f"[LOGGER] Formatierung fehlgeschlagen: {e}"]
+                console.extend(lines)
+                if self._log_fp:
+                    filelines.extend(self._strip_ansi(line) for line in lines)
+
+            try:
+                if console:
+                    sys.stdout.write("\n".join(console) + "\n")
+                    sys.stdout.flush()
+                if filelines and self.logging_enabled and self._log_fp:
+                    self._log_fp.write("\n".join(filelines) + "\n")
+                if jsonlines and sink is not None:
+                    sink.write_many(jsonlines)
+                now = time.monotonic()
+                if markers or stop or now - last_flush >= LOG_FLUSH_INTERVAL:
+                    if self._log_fp:
+                        self._log_fp.flush()
+                    if sink is not None:
+                        sink.flush()
+                    last_flush = now
+            except (OSError, ValueError):
+                # stdout/Datei bereits geschlossen (Interpreter-Shutdown)
+                pass
+
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Wartet, bis alle bis jetzt eingereihten Log-Einträge geschrieben sind."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        marker = threading.Event()
+        self._queue.put(marker)
+        marker.wait(timeout)
+
+    def _render(self, msg, args, exc_info: bool) -> str:
+        # Formatierung passiert erst hier, also nur für Einträge, die auch ausgegeben werden
+        if callable(msg):
+            msg = msg()
+        if args:
+            try:
+                msg = msg % args
+            except (TypeError, ValueError) as e:
+                msg = f"{msg} {args!r} [Formatfehler: {e}]"
+        if exc_info:
+            tb = traceback.format_exc()
+            if tb and not tb.startswith("NoneType: None"):
+                return f"{msg}\n{tb.rstrip()}"
+        return str(msg)
+
+    def debug(self, fn: str, msg, *args, exc_info: bool = False, trace_id: str = None):
         self._debug_count += 1
-        self._print_message("DEBUG", self._debug_count, fn, msg, _DEBUG_COLOR)
+        if not self.is_enabled(DEBUG):
+            self._record("DEBUG", fn, msg, args)
+            return
+        text = self._render(msg, args, exc_info)
+        self._record("DEBUG", fn, text, ())
+        self._print_message("DEBUG", self._debug_count, fn, text, _DEBUG_COLOR, trace_id)
 
-    def warning(self, fn: str, msg: str):
+    def warning(self, fn: str, msg, *args, exc_info: bool = False, trace_id: str = None):
         self._warn_count += 1
-        self._print_message("WARNUNG", self._warn_count, fn, msg, _WARN_COLOR)
+        if not self.is_enabled(WARNING):
+            self._record("WARNUNG", fn, msg, args)
+            return
+        text = self._render(msg, args, exc_info)
+        self._record("WARNUNG", fn, text, ())
+        self._print_message("WARNUNG", self._warn_count, fn, text, _WARN_COLOR, trace_id)
 
     warn = warning
 
-    def error(self, fn: str, msg: str):
+    def error(self, fn: str, msg, *args, exc_info: bool = False, trace_id: str = None):
         self._error_count += 1
-        self._print_message("FEHLER", self._error_count, fn, msg, _ERROR_COLOR)
+        if not self.is_enabled(ERROR):
+            self._record("FEHLER", fn, msg, args)
+            return
+        text = self._render(msg, args, exc_info)
+        self._record("FEHLER", fn, text, ())
+        self._print_message("FEHLER", self._error_count, fn, text, _ERROR_COLOR, trace_id)
 
 logger = DebugConsole()
@@ -7,6 +7,8 @@ import sys
 import time
 from datetime import datetime
 
+from src.core.animation.console_renderer import renderer
+
 try:
     import settings
 except ImportError:
@@ -51,28 +53,29 @@ def pretty_banner(
     frame_bottom = f"╚{'═'*width}╝"
     frames = [frame_top, frame_mid, frame_bottom]
 
-    sys.stdout.write("\033[?25l")
-    sys.stdout.flush()
-    try:
-        for _ in range(pulse_cycles):
-            for color in (CYAN, BLUE):
-                for line in frames:
-                    print(f"{color}{line}{RESET}")
-                time.sleep(pulse_delay)
-                sys.stdout.write("\033[F" * len(frames))
+    def render(r):
+        r.write("\033[?25l")
+        try:
+            # Pulsieren nur, solange keine weitere Ausgabe wartet
+            for _ in range(pulse_cycles):
+                if r.hurry():
+                    break
+                for color in (CYAN, BLUE):
+                    r.write("".join(f"{color}{line}{RESET}\n" for line in frames))
+                    interrupted = not r.pause(pulse_delay)
+                    r.write("\033[F" * len(frames))
+                    if interrupted:
+                        break
 
-        for line in frames:
-            print(f"{CYAN}{line}{RESET}")
-        print() 
+            r.write("".join(f"{CYAN}{line}{RESET}\n" for line in frames) + "\n")
 
-        border = "═" * (len(completion_title) + 4)
-        print(f"\n╔{border}╗")
-        print(f"║  {CYAN}{completion_title}{RESET}  ║")
-        print(f"╚{border}╝")
+            border = "═" * (len(completion_title) + 4)
+            r.write(f"\n╔{border}╗\n║  {CYAN}{completion_title}{RESET}  ║\n╚{border}╝\n")
 
-        info = f"   ↳ {YELLOW}{ts}{RESET} | {BLUE}{completion_message}{RESET}"
-        typewriter_print(info, delay=type_delay)
+            info = f"   ↳ {YELLOW}{ts}{RESET} | {BLUE}{completion_message}{RESET}"
+            r.typewrite(info, type_delay)
+        finally:
+            r.write("\033[?25h")
 
-    finally:
-        sys.stdout.write("\033[?25h")
-        sys.stdout.flush()
+    # Kehrt sofort zurück, die Animation läuft im Renderer-Thread
+    renderer.submit(render)
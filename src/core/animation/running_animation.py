@@ -7,6 +7,8 @@ import sys
 import time
 from datetime import datetime
 
+from src.core.animation.console_renderer import renderer
+
 try:
     import settings
 except ImportError:
@@ -31,17 +33,17 @@ def print_banner(text: str) -> None:
         frame_top    = f"\n╔{'═' * width}╗"
         frame_middle = f"║ {text} ║"
         frame_bottom = f"╚{'═' * width}╝"
-
-        print(f"{COLOR_MAIN}{frame_top}{RESET}")
-        print(f"{COLOR_MAIN}{frame_middle}{RESET}")
-        print(f"{COLOR_MAIN}{frame_bottom}{RESET}")
+        block = f"{COLOR_MAIN}{frame_top}{RESET}\n{COLOR_MAIN}{frame_middle}{RESET}\n{COLOR_MAIN}{frame_bottom}{RESET}\n"
+        renderer.submit(lambda r: r.write(block))
     else:
         return
 
-def append_message(message: str) -> None:
+def append_message(message: str, delay: float = 0.01) -> None:
+    """Kehrt sofort zurück, die Zeile wird im Hintergrund getippt (siehe console_renderer.py)."""
     if settings.DEBUG is False:
+        # Zeitstempel beim Aufruf, nicht bei der Ausgabe
         ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         info = f"   ↳ {TIME_COLOR}{ts}{RESET} | {SECOND_COLOR}{message}{RESET}"
-        typewriter_print(info)
+        renderer.submit(lambda r: r.typewrite(info, delay))
     else:
-        return
\ No newline at end of file
+        return
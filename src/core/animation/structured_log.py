@@ -0,0 +1,234 @@
+# ---------------------------------------------------------------------------
+# \src\core\animation\structured_log.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import re
+import gzip
+import json
+import time
+import queue
+import shutil
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+LOG_STRUCTURED_DIR  = getattr(settings, "LOG_STRUCTURED_DIR", None) or os.path.join(os.getcwd(), "log", "structured")
+LOG_ROTATE_BYTES    = getattr(settings, "LOG_ROTATE_BYTES", 10 * 1024 * 1024)
+LOG_ROTATE_AGE      = getattr(settings, "LOG_ROTATE_AGE", 24 * 60 * 60)
+LOG_MAX_TOTAL_BYTES = getattr(settings, "LOG_MAX_TOTAL_BYTES", 200 * 1024 * 1024)
+
+_SEGMENT_RE = re.compile(r"^\d{8}_\d{6}_\d+_\d+\.jsonl(\.gz)?$")
+
+# Aktuelle Trace-ID des laufenden Befehls. contextvars statt threading.local,
+# damit die ID auch in Coroutines auf dem Bot-Loop korrekt zugeordnet wird.
+_trace_id: contextvars.ContextVar = contextvars.ContextVar("trace_id", default=None)
+
+
+def current_trace_id() -> Optional[str]:
+    return _trace_id.get()
+
+
+@contextmanager
+def trace(trace_id: Optional[str]) -> Iterator[None]:
+    """Setzt die Trace-ID für alle Log-Einträge innerhalb des Blocks."""
+    token = _trace_id.set(trace_id)
+    try:
+        yield
+    finally:
+        _trace_id.reset(token)
+
+
+class StructuredLogSink:
+    """
+    Schreibt Log-Einträge als JSON Lines in Segmente unter `directory`.
+    Ein Segment wird bei Erreichen von `max_bytes` oder `max_age` Sekunden abgeschlossen,
+    im Hintergrund mit gzip komprimiert und die ältesten Segmente werden gelöscht,
+    sobald alle zusammen mehr als `max_total_bytes` belegen.
+    Ein Verzeichnis entspricht einer Instanz; mehrere Bots brauchen eigene Verzeichnisse.
+    """
+
+    def __init__(
+        self,
+        directory: str = LOG_STRUCTURED_DIR,
+        max_bytes: int = LOG_ROTATE_BYTES,
+        max_age: float = LOG_ROTATE_AGE,
+        max_total_bytes: int = LOG_MAX_TOTAL_BYTES
+    ):
+        self.directory = directory
+        self.max_bytes = max(1024, int(max_bytes))
+        self.max_age = max_age or None
+        self.max_total_bytes = max_total_bytes or None
+        self._lock = threading.Lock()
+        self._fp = None
+        self._path: Optional[str] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._seq = 0
+        self._closed = False
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._jobs: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._compressor = threading.Thread(target=self._compress_loop, name='log-compressor', daemon=True)
+        self._compressor.start()
+        # Unkomprimierte Segmente eines vorherigen Laufs (z. B. nach Absturz) nachholen
+        for path in self._segments(compressed=False):
+            self._jobs.put(path)
+        self._jobs.put("")
+        self._open_segment()
+
+    # --- Segmente ------------------------------------------------------------
+
+    def _segments(self, compressed: Optional[bool] = None) -> List[str]:
+        try:
+            names = sorted(n for n in os.listdir(self.directory) if _SEGMENT_RE.match(n))
+        except OSError:
+            return []
+        paths = []
+        for name in names:
+            if compressed is not None and name.endswith(".gz") != compressed:
+                continue
+            paths.append(os.path.join(self.directory, name))
+        return paths
+
+    def _open_segment(self) -> None:
+        self._seq += 1
+        name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{self._seq:04d}.jsonl"
+        self._path = os.path.join(self.directory, name)
+        self._fp = open(self._path, "ab")
+        self._size = self._fp.tell()
+        self._opened_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        old = self._path
+        try:
+            self._fp.close()
+        except OSError:
+            pass
+        self._fp = None
+        self._jobs.put(old)
+        self._open_segment()
+
+    def _due(self) -> bool:
+        if self._size >= self.max_bytes:
+            return True
+        return bool(self.max_age) and time.monotonic() - self._opened_at >= self.max_age
+
+    # --- Schreiben -----------------------------------------------------------
+
+    @staticmethod
+    def encode(ts: float, level: str, count: int, fn: str, msg: str, trace_id: Optional[str] = None) -> bytes:
+        record = {
+            "ts": datetime.fromtimestamp(ts).isoformat(timespec="milliseconds"),
+            "level": level,
+            "n": count,
+            "fn": fn,
+            "msg": msg,
+        }
+        if trace_id is not None:
+            record["trace_id"] = trace_id
+        return (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+    def write_many(self, lines: List[bytes]) -> None:
+        """Schreibt bereits kodierte Zeilen. Rotiert höchstens zwischen zwei Zeilen, nie mitten in einem Eintrag."""
+        if not lines:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            chunk: List[bytes] = []
+            for line in lines:
+                chunk.append(line)
+                self._size += len(line)
+                if self._due():
+                    self._fp.write(b"".join(chunk))
+                    chunk = []
+                    self._rotate()
+            if chunk:
+                self._fp.write(b"".join(chunk))
+
+    def write(self, ts: float, level: str, count: int, fn: str, msg: str, trace_id: Optional[str] = None) -> None:
+        self.write_many([self.encode(ts, level, count, fn, msg, trace_id)])
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.flush()
+            # Alterslimit auch in ruhigen Phasen einhalten
+            if self._fp is not None and not self._closed and self._size and self._due():
+                self._rotate()
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+                if self._size:
+                    self._jobs.put(self._path)
+                else:
+                    try:
+                        os.remove(self._path)
+                    except OSError:
+                        pass
+        self._jobs.put(None)
+        self._compressor.join(timeout)
+
+    # --- Hintergrund: Komprimieren & Aufräumen -------------------------------
+
+    def _compress_loop(self) -> None:
+        while True:
+            path = self._jobs.get()
+            if path is None:
+                return
+            if path:
+                self._compress(path)
+            self._enforce_cap()
+
+    @staticmethod
+    def _compress(path: str) -> None:
+        tmp = path + ".gz.tmp"
+        try:
+            with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(tmp, path + ".gz")
+            os.remove(path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _enforce_cap(self) -> None:
+        if not self.max_total_bytes:
+            return
+        active = self._path
+        sized: List[Tuple[str, int]] = []
+        total = 0
+        for path in self._segments():
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            sized.append((path, size))
+            total += size
+        # Älteste zuerst löschen (Dateinamen beginnen mit Zeitstempel), das aktive Segment nie
+        for path, size in sized:
+            if total <= self.max_total_bytes:
+                break
+            if path == active:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
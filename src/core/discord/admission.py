@@ -0,0 +1,147 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\admission.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+# (Anzahl, Sekunden) oder None = unbegrenzt
+RATE_LIMIT_GLOBAL     = getattr(settings, 'RATE_LIMIT_GLOBAL', None)
+RATE_LIMIT_USER       = getattr(settings, 'RATE_LIMIT_USER', None)
+RATE_LIMIT_COMMAND    = getattr(settings, 'RATE_LIMIT_COMMAND', None)
+RATE_LIMIT_DROP_AFTER = getattr(settings, 'RATE_LIMIT_DROP_AFTER', 3)
+
+Limit = Optional[Tuple[float, float]]
+
+# Ab so vielen Buckets werden volle (seit längerem ungenutzte) entfernt
+_PRUNE_THRESHOLD = 1024
+
+
+def parse_limit(value) -> Limit:
+    """(Anzahl, Sekunden) aus settings/Modul normalisieren. None, 0 oder leere Werte = unbegrenzt."""
+    if not value:
+        return None
+    count, per = value
+    if not count or count <= 0 or not per or per <= 0:
+        return None
+    return float(count), float(per)
+
+
+class TokenBucket:
+    """`capacity` Tokens, die mit `capacity / per` Tokens pro Sekunde nachlaufen."""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, limit: Tuple[float, float], now: float):
+        self.capacity = limit[0]
+        self.rate = limit[0] / limit[1]
+        self.tokens = self.capacity
+        self.updated = now
+
+    def refill(self, now: float) -> float:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        return self.tokens
+
+    def wait_time(self) -> float:
+        """Sekunden bis zum nächsten ganzen Token (nach `refill`)."""
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+
+class Decision:
+    __slots__ = ("admitted", "drop", "retry_after", "scope")
+
+    def __init__(self, admitted: bool, drop: bool = False, retry_after: float = 0.0, scope: str = ""):
+        self.admitted = admitted
+        self.drop = drop
+        self.retry_after = retry_after
+        self.scope = scope
+
+
+ADMITTED = Decision(True)
+
+
+class AdmissionControl:
+    """
+    Token-Buckets global, pro User und pro Befehl. Ein Aufruf wird nur angenommen,
+    wenn alle beteiligten Buckets ein Token haben; erst dann wird aus allen abgebucht.
+    Abgelehnte Aufrufe bekommen bis zu `drop_after` Hinweise, danach werden sie bis zum
+    nächsten angenommenen Aufruf des Users stillschweigend verworfen.
+    """
+
+    def __init__(
+        self,
+        global_limit=RATE_LIMIT_GLOBAL,
+        user_limit=RATE_LIMIT_USER,
+        command_limit=RATE_LIMIT_COMMAND,
+        drop_after: int = RATE_LIMIT_DROP_AFTER
+    ):
+        self.global_limit = parse_limit(global_limit)
+        self.user_limit = parse_limit(user_limit)
+        self.command_limit = parse_limit(command_limit)
+        self.drop_after = max(0, int(drop_after or 0))
+        self._lock = threading.Lock()
+        self._global: Optional[TokenBucket] = None
+        self._users: Dict[str, TokenBucket] = {}
+        self._commands: Dict[str, TokenBucket] = {}
+        self._strikes: Dict[str, int] = {}
+
+    def _bucket(self, table: Dict[str, TokenBucket], key: str, limit: Tuple[float, float], now: float) -> TokenBucket:
+        bucket = table.get(key)
+        if bucket is None or bucket.capacity != limit[0] or bucket.rate != limit[0] / limit[1]:
+            if len(table) >= _PRUNE_THRESHOLD:
+                self._prune(table, now)
+            bucket = table[key] = TokenBucket(limit, now)
+        return bucket
+
+    @staticmethod
+    def _prune(table: Dict[str, TokenBucket], now: float) -> None:
+        for key in [k for k, b in table.items() if b.refill(now) >= b.capacity]:
+            del table[key]
+
+    def check(self, user_id: str, command: str, command_limit=None) -> Decision:
+        """`command_limit` (vom Command) ersetzt das Standardlimit pro Befehl."""
+        cmd_limit = parse_limit(command_limit) if command_limit is not None else self.command_limit
+        now = time.monotonic()
+        with self._lock:
+            scopes: List[Tuple[str, TokenBucket]] = []
+            if self.global_limit is not None:
+                if self._global is None:
+                    self._global = TokenBucket(self.global_limit, now)
+                scopes.append(("global", self._global))
+            if self.user_limit is not None:
+                scopes.append(("user", self._bucket(self._users, user_id, self.user_limit, now)))
+            if cmd_limit is not None:
+                scopes.append(("command", self._bucket(self._commands, command, cmd_limit, now)))
+
+            blocked = None
+            for scope, bucket in scopes:
+                if bucket.refill(now) < 1.0:
+                    wait = bucket.wait_time()
+                    if blocked is None or wait > blocked[1]:
+                        blocked = (scope, wait)
+            if blocked is None:
+                for _, bucket in scopes:
+                    bucket.tokens -= 1.0
+                self._strikes.pop(user_id, None)
+                return ADMITTED
+
+            strikes = self._strikes.get(user_id, 0) + 1
+            self._strikes[user_id] = strikes
+            if len(self._strikes) > _PRUNE_THRESHOLD:
+                self._strikes = {user_id: strikes}
+        return Decision(False, drop=strikes > self.drop_after, retry_after=blocked[1], scope=blocked[0])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._global = None
+            self._users.clear()
+            self._commands.clear()
+            self._strikes.clear()
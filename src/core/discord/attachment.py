@@ -0,0 +1,187 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\attachment.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import io
+import os
+import gzip
+import json
+import uuid
+import shutil
+import tempfile
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+ATTACHMENT_THRESHOLD = getattr(settings, 'ATTACHMENT_THRESHOLD', 8000)
+ATTACHMENT_MAX_SIZE  = getattr(settings, 'ATTACHMENT_MAX_SIZE', 10 * 1024 * 1024)
+
+API_BASE = "https://discord.com/api/v9/"
+# Blockgröße beim Spoolen und Hochladen; so viel liegt höchstens gleichzeitig im Speicher
+_BLOCK = 64 * 1024
+
+
+class FileResponse:
+    """
+    Datei als Command-Ergebnis. Der Inhalt liegt immer in einer Datei auf der Festplatte
+    und wird erst beim Hochladen blockweise gelesen. `delete=True` entfernt die Datei nach
+    dem Senden (gilt für alle über `from_*` gespoolten Dateien). Lässt sich pickeln, kann
+    also auch aus einem `cpu_bound`-Command kommen.
+    """
+
+    __slots__ = ("path", "filename", "content", "delete")
+
+    def __init__(self, path: str, filename: Optional[str] = None, content: str = "", delete: bool = False):
+        self.path = path
+        self.filename = filename or os.path.basename(path)
+        # Begleittext der Nachricht, darf leer sein
+        self.content = content
+        self.delete = delete
+
+    def __repr__(self) -> str:
+        return f"<FileResponse {self.filename!r} ({self.size} Byte)>"
+
+    @property
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    @classmethod
+    def from_text(
+        cls,
+        text: Union[str, Iterable[str]],
+        filename: str = "ausgabe.txt",
+        content: str = "",
+        compress: bool = True
+    ) -> "FileResponse":
+        """String oder Generator von Textstücken als (standardmäßig gzip-komprimierte) Textdatei."""
+        pieces = (text,) if isinstance(text, str) else text
+
+        def write(out: BinaryIO) -> None:
+            for piece in pieces:
+                out.write(piece.encode("utf-8"))
+
+        return cls._spool(write, filename, content, compress)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, filename: str, content: str = "", compress: bool = False) -> "FileResponse":
+        return cls._spool(lambda out: out.write(data), filename, content, compress)
+
+    @classmethod
+    def from_fileobj(cls, fileobj: BinaryIO, filename: str, content: str = "", compress: bool = False) -> "FileResponse":
+        """Kopiert einen binären Stream blockweise in eine temporäre Datei (z. B. einen erzeugten PDF-Puffer)."""
+        return cls._spool(lambda out: shutil.copyfileobj(fileobj, out, _BLOCK), filename, content, compress)
+
+    @classmethod
+    def _spool(cls, write, filename: str, content: str, compress: bool) -> "FileResponse":
+        if compress and not filename.endswith(".gz"):
+            filename += ".gz"
+        fd, path = tempfile.mkstemp(prefix="selfbot-", suffix="-" + os.path.basename(filename))
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                if compress:
+                    # Dateiname und Zeitstempel nicht in den Header schreiben
+                    with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as out:
+                        write(out)
+                else:
+                    write(raw)
+        except BaseException:
+            _remove(path)
+            raise
+        return cls(path, filename, content, delete=True)
+
+    def open(self) -> BinaryIO:
+        return open(self.path, "rb")
+
+    def close(self) -> None:
+        """Entfernt eine gespoolte Datei. Mehrfacher Aufruf ist unschädlich."""
+        if self.delete:
+            _remove(self.path)
+            self.delete = False
+
+
+class MultipartBody:
+    """
+    `multipart/form-data`-Body für requests, der sich wie eine Datei verhält. Die Datei wird
+    erst beim Senden in Blöcken gelesen. Weil die Länge vorab bekannt ist, schickt requests
+    `Content-Length` statt Chunked-Encoding.
+    """
+
+    def __init__(self, payload: Dict, attachment: FileResponse):
+        self.boundary = uuid.uuid4().hex
+        filename = attachment.filename.replace('"', "'").replace("\r", "").replace("\n", "")
+        head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="payload_json"\r\n'
+            f"Content-Type: application/json\r\n\r\n"
+            f"{json.dumps(payload)}\r\n"
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="files[0]"; filename="{filename}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._parts: List[BinaryIO] = [io.BytesIO(head), attachment.open(), io.BytesIO(tail)]
+        self._length = len(head) + attachment.size + len(tail)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = _BLOCK
+        while self._parts:
+            block = self._parts[0].read(size)
+            if block:
+                return block
+            self._parts.pop(0).close()
+        return b""
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.close()
+        self._parts = []
+
+
+def upload(bot, channel: str, attachment: FileResponse, content: str = "", reply_to: Optional[str] = None):
+    """
+    Sendet eine Nachricht mit Anhang über die `requests.Session` von discum. Liefert die
+    Response wie `sendMessage`. Ohne Session (z. B. Test-Clients) wird `sendFile` benutzt.
+    """
+    session = getattr(bot, 's', None)
+    if session is None or not hasattr(session, 'post'):
+        send_file = getattr(bot, 'sendFile', None)
+        if send_file is None:
+            raise RuntimeError("Client unterstützt keine Dateianhänge")
+        reference = {"channel_id": channel, "message_id": reply_to} if reply_to else None
+        return send_file(channel, attachment.path, False, content, False, reference)
+
+    payload: Dict = {"content": content, "attachments": [{"id": 0, "filename": attachment.filename}]}
+    if reply_to is not None:
+        payload["message_reference"] = {"channel_id": channel, "message_id": reply_to}
+    body = MultipartBody(payload, attachment)
+    url = f"{getattr(bot, 'discord', API_BASE)}channels/{channel}/messages"
+    debug_logger.debug('attachment.upload', "Lade %s (%s Byte) in channel=%s hoch", attachment.filename, len(body), channel)
+    try:
+        return session.post(url, data=body, headers={"Content-Type": body.content_type})
+    finally:
+        body.close()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        debug_logger.warning('FileResponse.close', "Temporäre Datei %s nicht entfernt: %s", path, e)
@@ -4,7 +4,6 @@
 # ---------------------------------------------------------------------------
 
 import random
-import threading
 import time
 import datetime
  
@@ -19,18 +18,17 @@ except ImportError:
     DEBUG = False
 
 
-def _get_sleep_segment():
-    hour = datetime.datetime.now().hour
-    if 8 <= hour < 20:
-        return random.uniform(0.2, 0.6)
-    else:
-        return random.uniform(0.05, 0.3)
+def _next_delay(setting: str, default) -> float:
+    # Exponentialverteilte Wartezeit um einen zufälligen Mittelwert, mit ±10 % Jitter
+    low, high = getattr(settings, setting, default)
+    mean = random.uniform(low, high)
+    wait = random.expovariate(1 / mean)
+    jitter = random.uniform(-mean * 0.1, mean * 0.1)
+    return max(1, wait + jitter)
 
 
-def _presence_loop(self):
-    initial_delay = random.uniform(1, 10)
-    debug_logger.debug('chameleon', f'Initiale Präsenz-Pause: {initial_delay:.2f}s')
-    time.sleep(initial_delay)
+def _presence_once(self) -> bool:
+    """Sendet ein zufälliges Presence-Update. False, wenn die Gateway-Verbindung geschlossen ist."""
     base_statuses = getattr(settings, 'PRESENCE_STATUSES', ['online', 'idle', 'dnd'])
     base_activities = getattr(settings, 'PRESENCE_ACTIVITIES', [
         [],
@@ -38,45 +36,43 @@ def _presence_loop(self):
         [{'name': 'Lesen', 'type': 0}],
         [{'name': 'Musik hören', 'type': 2}]
     ])
-    debug_logger.debug('chameleon', 'Presence-Loop gestartet')
-    while not self._stop_event.is_set():
-        statuses = list(base_statuses)
-        activities = list(base_activities)
-        hour = datetime.datetime.now().hour
-        if hour >= 20 or hour < 6:
-            statuses.extend(['idle', 'dnd'] * 2)
-        inner = [
-            ('since', 0),
-            ('activities', random.choice(activities)),
-            ('status', random.choice(statuses)),
-            ('afk', False)
-        ]
-        random.shuffle(inner)
-        d_payload = {k: v for k, v in inner}
-        outer = [('op', 3), ('d', d_payload)]
-        random.shuffle(outer)
-        payload = {k: v for k, v in outer}
-        debug_logger.debug('chameleon', f"Prepared Presence payload fields order: {list(payload.keys())}")
-        try:
-            self.bot.gateway.send(payload)
-            debug_logger.debug('chameleon', f"Presence-Update gesendet: {payload['d']}")
-        except Exception as e:
-            debug_logger.error('chameleon', f"Presence-Update fehlgeschlagen: {e}")
-            if 'closed' in str(e).lower():
-                debug_logger.warn('chameleon', 'Gateway-Verbindung geschlossen, Presence-Loop endet')
-                break
-        min_m, max_m = getattr(settings, 'PRESENCE_MEAN_RANGE', (120, 300))
-        mean = random.uniform(min_m, max_m)
-        wait = random.expovariate(1 / mean)
-        jitter = random.uniform(-mean * 0.1, mean * 0.1)
-        total = max(1, wait + jitter)
-        debug_logger.debug('chameleon', f"Nächste Presence-Update in {total:.2f}s")
-        rem = total
-        while rem > 0 and not self._stop_event.is_set():
-            seg = _get_sleep_segment()
-            t = min(seg, rem)
-            time.sleep(t)
-            rem -= t
+    statuses = list(base_statuses)
+    activities = list(base_activities)
+    hour = datetime.datetime.now().hour
+    if hour >= 20 or hour < 6:
+        statuses.extend(['idle', 'dnd'] * 2)
+    inner = [
+        ('since', 0),
+        ('activities', random.choice(activities)),
+        ('status', random.choice(statuses)),
+        ('afk', False)
+    ]
+    random.shuffle(inner)
+    d_payload = {k: v for k, v in inner}
+    outer = [('op', 3), ('d', d_payload)]
+    random.shuffle(outer)
+    payload = {k: v for k, v in outer}
+    debug_logger.debug('chameleon', "Prepared Presence payload fields order: %s", list(payload.keys()))
+    try:
+        self.bot.gateway.send(payload)
+        debug_logger.debug('chameleon', "Presence-Update gesendet: %s", payload['d'])
+    except Exception as e:
+        debug_logger.error('chameleon', "Presence-Update fehlgeschlagen: %s", e)
+        if 'closed' in str(e).lower():
+            debug_logger.warn('chameleon', 'Gateway-Verbindung geschlossen, Presence-Updates enden')
+            return False
+    return True
+
+
+def _schedule_presence(self, scheduler, delay: float) -> None:
+    # Jeder Lauf plant den nächsten mit neuer Zufallswartezeit (einmalige Jobs im zentralen Timer-Rad)
+    def _job():
+        if _presence_once(self):
+            total = _next_delay('PRESENCE_MEAN_RANGE', (120, 300))
+            debug_logger.debug('chameleon', "Nächste Presence-Update in %.2fs", total)
+            _schedule_presence(self, scheduler, total)
+
+    scheduler.once(delay, _job, name="chameleon-presence")
 
 
 def _activity_once(self):
@@ -91,9 +87,9 @@ def _activity_once(self):
     fn = random.choice(actions)
     try:
         res = fn()
-        debug_logger.debug('chameleon', f"Warm-up Aktion {fn.__name__} erfolgreich: {res}")
+        debug_logger.debug('chameleon', "Warm-up Aktion %s erfolgreich: %s", fn.__name__, res)
     except Exception as e:
-        debug_logger.error('chameleon', f"Warm-up Aktion {fn.__name__} fehlgeschlagen: {e}")
+        debug_logger.error('chameleon', "Warm-up Aktion %s fehlgeschlagen: %s", fn.__name__, e)
     for dummy in ['getChannel', 'getGuildRoles']:
         fn_dummy = getattr(self.bot, dummy, None)
         if callable(fn_dummy):
@@ -105,9 +101,9 @@ def _activity_once(self):
                     gid = first.get('id') if isinstance(first, dict) else first
                 if gid:
                     fn_dummy(gid)
-                    debug_logger.debug('chameleon', f"Dummy-Interaktion {dummy} ausgeführt: {gid}")
+                    debug_logger.debug('chameleon', "Dummy-Interaktion %s ausgeführt: %s", dummy, gid)
             except Exception as e:
-                debug_logger.error('chameleon', f"Dummy-Interaktion {dummy} fehlgeschlagen: {e}")
+                debug_logger.error('chameleon', "Dummy-Interaktion %s fehlgeschlagen: %s", dummy, e)
     try:
         guilds = self.bot.getGuilds()
         if isinstance(guilds, list) and guilds:
@@ -119,30 +115,19 @@ def _activity_once(self):
                 for m in random.sample(data, min(2, len(data))):
                     mid = m.get('id')
                     self.bot.ackMessage(gid, mid)
-                    debug_logger.debug('chameleon', f"AckMessage für Nachricht {mid} in Channel {gid}")
+                    debug_logger.debug('chameleon', "AckMessage für Nachricht %s in Channel %s", mid, gid)
     except Exception as e:
-        debug_logger.error('chameleon', f"Lesebestätigung fehlgeschlagen: {e}")
+        debug_logger.error('chameleon', "Lesebestätigung fehlgeschlagen: %s", e)
 
 
-def _random_activity_loop(self):
-    initial_delay = random.uniform(1, 10)
-    debug_logger.debug('chameleon', f'Initiale Activity-Pause: {initial_delay:.2f}s')
-    time.sleep(initial_delay)
-    debug_logger.debug('chameleon', 'Random-Activity-Loop gestartet')
-    while not self._stop_event.is_set():
+def _schedule_activity(self, scheduler, delay: float) -> None:
+    def _job():
         _activity_once(self)
-        min_a, max_a = getattr(settings, 'ACTIVITY_MEAN_RANGE', (60, 180))
-        mean_a = random.uniform(min_a, max_a)
-        w = random.expovariate(1 / mean_a)
-        jit = random.uniform(-mean_a * 0.1, mean_a * 0.1)
-        tot = max(1, w + jit)
-        debug_logger.debug('chameleon', f"Nächste Random-Activity in {tot:.2f}s")
-        rem = tot
-        while rem > 0 and not self._stop_event.is_set():
-            seg = _get_sleep_segment()
-            t = min(seg, rem)
-            time.sleep(t)
-            rem -= t
+        total = _next_delay('ACTIVITY_MEAN_RANGE', (60, 180))
+        debug_logger.debug('chameleon', "Nächste Random-Activity in %.2fs", total)
+        _schedule_activity(self, scheduler, total)
+
+    scheduler.once(delay, _job, name="chameleon-activity")
 
 
 def mask(self):
@@ -151,23 +136,25 @@ def mask(self):
             print_banner("Verschleierung wird gestartet")
             append_message("Warm-up Phase: Präsenz und Aktivität werden initialisiert.")
         except Exception as e:
-            debug_logger.error('chameleon', f"Fehler bei Statusanzeige: {e}")
+            debug_logger.error('chameleon', "Fehler bei Statusanzeige: %s", e)
     phases = ['presence', 'activity']
     random.shuffle(phases)
     for phase in phases:
         if phase == 'presence':
-            _presence_loop(self)
+            _presence_once(self)
         else:
             _activity_once(self)
         p = random.uniform(1, 3)
-        debug_logger.debug('chameleon', f"Warm-up Pause: {p:.2f}s")
+        debug_logger.debug('chameleon', "Warm-up Pause: %.2fs", p)
         time.sleep(p)
     if not DEBUG:
         append_message("Alle Verschleierungen angewendet.")
-    t1 = threading.Thread(target=_presence_loop, args=(self,), daemon=True)
-    t1.start()
-    debug_logger.debug('chameleon', 'Presence-Loop Thread gestartet')
-    t2 = threading.Thread(target=_random_activity_loop, args=(self,), daemon=True)
-    t2.start()
-    debug_logger.debug('chameleon', 'Random-Activity-Loop Thread gestartet')
+    # Statt zweier Threads mit Sleep-Schleifen: Jobs im Scheduler des CommandTree, die beim Stop-Event enden
+    scheduler = self.commands.scheduler
+    initial = random.uniform(1, 10)
+    debug_logger.debug('chameleon', "Initiale Präsenz-Pause: %.2fs", initial)
+    _schedule_presence(self, scheduler, initial)
+    initial = random.uniform(1, 10)
+    debug_logger.debug('chameleon', "Initiale Activity-Pause: %.2fs", initial)
+    _schedule_activity(self, scheduler, initial)
     debug_logger.debug('chameleon', 'Alle Masking-Routinen gestartet')
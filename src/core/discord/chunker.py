@@ -0,0 +1,141 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\chunker.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import unicodedata
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+MAX_CHUNK_SIZE = getattr(settings, 'MAX_CHUNK_SIZE', 2000)
+
+FENCE = "```"
+_CLOSE = "\n" + FENCE
+
+Output = Union[str, Iterable[str]]
+
+
+def is_streaming(result) -> bool:
+    """True, wenn ein Command-Ergebnis ein Iterator/Generator statt eines Strings ist."""
+    return not isinstance(result, (str, bytes)) and hasattr(result, "__iter__")
+
+
+def _is_joiner(ch: str) -> bool:
+    # Nicht zwischen Basiszeichen und Kombinationszeichen, ZWJ oder Variantenselektor trennen
+    return unicodedata.combining(ch) != 0 or ch in "\u200d\ufe0e\ufe0f"
+
+
+def _safe_cut(text: str, limit: int) -> int:
+    """Schnittposition <= limit: bevorzugt nach einem Leerzeichen, nie mitten in einem Graphem."""
+    if len(text) <= limit:
+        return len(text)
+    space = text.rfind(" ", limit // 2, limit)
+    cut = space + 1 if space >= 0 else limit
+    while cut > 1 and _is_joiner(text[cut]):
+        cut -= 1
+    return cut
+
+
+def _lines(source: Output, limit: int) -> Iterator[Tuple[str, bool]]:
+    """
+    Zerlegt die Ausgabe in (Text, Zeile_vollständig). Überlange Zeilen ohne Umbruch
+    werden schon hier in Fragmente geteilt, damit nie mehr als ~limit Zeichen gepuffert werden.
+    """
+    pieces = (source,) if isinstance(source, str) else source
+    pending = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        if not isinstance(piece, str):
+            piece = str(piece)
+        pending += piece
+        start = 0
+        while True:
+            nl = pending.find("\n", start)
+            if nl < 0:
+                break
+            yield pending[start:nl], True
+            start = nl + 1
+        pending = pending[start:]
+        while len(pending) > limit:
+            cut = _safe_cut(pending, limit)
+            yield pending[:cut], False
+            pending = pending[cut:]
+    if pending:
+        yield pending, True
+
+
+def iter_chunks(source: Output, limit: int = MAX_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Packt einen String oder einen Iterator von Textstücken in Nachrichten mit höchstens
+    `limit` Zeichen. Getrennt wird an Zeilengrenzen. Ist beim Trennen ein Code-Block offen,
+    wird er am Ende des Chunks geschlossen und im nächsten mit derselben Sprache wieder geöffnet.
+    Der Speicherbedarf ist unabhängig von der Gesamtlänge der Ausgabe.
+    """
+    buf: List[str] = []
+    size = 0
+    has_content = False
+    fence: Optional[str] = None  # öffnende Zeile des aktuell offenen Code-Blocks
+
+    def flush() -> Optional[str]:
+        nonlocal buf, size, has_content
+        if not has_content:
+            return None
+        text = "".join(buf)
+        if text.endswith("\n"):
+            text = text[:-1]
+        if fence is not None:
+            text += _CLOSE
+        buf, size, has_content = [], 0, False
+        if fence is not None:
+            header = fence + "\n"
+            buf.append(header)
+            size = len(header)
+        # Discord lehnt leere Nachrichten ab
+        return text if text.strip() else None
+
+    try:
+        for line, complete in _lines(source, max(16, limit - len(FENCE) * 2 - 8)):
+            toggles = complete and line.lstrip().startswith(FENCE)
+            closing = toggles and fence is not None
+            fence_after = (None if closing else line.strip()) if toggles else fence
+            piece = line + "\n" if complete else line
+            # Solange nach dieser Zeile ein Block offen ist, Platz für das schließende ``` freihalten
+            budget = limit - (len(_CLOSE) if fence_after is not None else 0)
+
+            if size + len(piece) > budget and has_content:
+                chunk = flush()
+                if chunk is not None:
+                    yield chunk
+
+            while size + len(piece) > budget:
+                # Zeile passt nicht einmal in einen leeren Chunk: hart teilen
+                room = max(1, budget - size)
+                cut = _safe_cut(piece, room)
+                buf.append(piece[:cut])
+                size += cut
+                has_content = True
+                piece = piece[cut:]
+                chunk = flush()
+                if chunk is not None:
+                    yield chunk
+
+            if piece:
+                buf.append(piece)
+                size += len(piece)
+                has_content = True
+            fence = fence_after
+    except Exception:
+        # Bereits Erzeugtes noch ausliefern, dann den Fehler weiterreichen
+        chunk = flush()
+        if chunk is not None:
+            yield chunk
+        raise
+
+    if has_content:
+        chunk = flush()
+        if chunk is not None:
+            yield chunk
@@ -0,0 +1,220 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\command_cache.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from src.core.discord.chunker import is_streaming
+from src.core.discord.attachment import FileResponse
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+COMMAND_CACHE_TTL  = getattr(settings, 'COMMAND_CACHE_TTL', 60)
+COMMAND_CACHE_SIZE = getattr(settings, 'COMMAND_CACHE_SIZE', 256)
+
+# Erlaubte Werte für `vary`: zusätzliche Bestandteile des Cache-Keys neben Befehl + Argumenten
+_VARY = {
+    "author": lambda ctx: ctx.get("author_id"),
+    "channel": lambda ctx: ctx.get("channel_id"),
+}
+
+
+class _Flight:
+    """Eine laufende Berechnung, auf die gleichzeitige identische Aufrufe warten."""
+
+    __slots__ = ("event", "future", "value", "error", "shareable")
+
+    def __init__(self, future: Optional[asyncio.Future] = None):
+        self.event = threading.Event()
+        self.future = future
+        self.value = None
+        self.error: Optional[BaseException] = None
+        self.shareable = True
+
+
+class CommandCache:
+    """
+    TTL- und LRU-begrenzter Ergebnis-Cache für einen Command.
+
+    Gleichzeitige Aufrufe mit demselben Key werden zusammengelegt (Single-Flight):
+    nur der erste rechnet, alle anderen warten auf sein Ergebnis. Fehler,
+    Streaming-Ergebnisse (Generatoren) und Dateien werden nie gespeichert.
+    """
+
+    def __init__(
+        self,
+        ttl: float = COMMAND_CACHE_TTL,
+        maxsize: int = COMMAND_CACHE_SIZE,
+        vary: Iterable[str] = (),
+        key: Optional[Callable[[Dict, List[str]], Hashable]] = None
+    ):
+        self.ttl = float(ttl)
+        self.maxsize = max(1, int(maxsize))
+        self.vary = tuple(vary)
+        unknown = [v for v in self.vary if v not in _VARY]
+        if unknown:
+            raise ValueError(f"Unbekannte vary-Angabe: {', '.join(unknown)} (erlaubt: {', '.join(_VARY)})")
+        self.key_fn = key
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    def make_key(self, name: str, ctx: Dict, args: List[str]) -> Hashable:
+        if self.key_fn is not None:
+            return name, self.key_fn(ctx, args)
+        return (name, tuple(args)) + tuple(_VARY[v](ctx) for v in self.vary)
+
+    def describe(self) -> str:
+        """Kurzer Hinweis für die Hilfe, z. B. "Ergebnis 60s zwischengespeichert (pro User)"."""
+        scope = {"author": "User", "channel": "Channel"}
+        per = ", ".join(f"pro {scope[v]}" for v in self.vary)
+        return f"Ergebnis {self.ttl:g}s zwischengespeichert" + (f" ({per})" if per else "")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits, "misses": self.misses, "shared": self.shared,
+                "evictions": self.evictions, "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # --- Lookup --------------------------------------------------------------
+
+    def _lookup(self, key: Hashable, new_flight: Callable[[], _Flight]) -> Tuple[bool, object, Optional[_Flight], bool]:
+        """Liefert (Treffer, Wert, Flight, ist_Leader). Muss unter `_lock` laufen."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1], None, False
+            del self._entries[key]
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.shared += 1
+            return False, None, flight, False
+        self.misses += 1
+        flight = self._flights[key] = new_flight()
+        return False, None, flight, True
+
+    def _store(self, key: Hashable, flight: _Flight, value) -> None:
+        flight.value = value
+        flight.shareable = isinstance(value, str)
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if flight.shareable and self.ttl > 0:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+    def _abandon(self, key: Hashable, flight: _Flight, error: BaseException) -> None:
+        flight.error = error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        with self._lock:
+            hit, value, flight, leader = self._lookup(key, _Flight)
+        if hit:
+            return value
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.shareable:
+                return flight.value
+            # Generatoren lassen sich nicht teilen: selbst ausführen
+            return compute()
+        try:
+            value = compute()
+        except BaseException as e:
+            self._abandon(key, flight, e)
+            raise
+        else:
+            if not _shareable(value):
+                flight.shareable = False
+                self._abandon(key, flight, None)
+            else:
+                self._store(key, flight, value)
+            return value
+        finally:
+            flight.event.set()
+
+    async def get_or_compute_async(self, key: Hashable, compute: Callable[[], Awaitable[object]]):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            hit, value, flight, leader = self._lookup(key, lambda: _Flight(loop.create_future()))
+        if hit:
+            return value
+        if not leader:
+            # shield: wird ein Wartender abgebrochen, läuft die Berechnung für die anderen weiter
+            value = await asyncio.shield(flight.future)
+            if flight.shareable:
+                return value
+            return await compute()
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            error = RuntimeError("Berechnung wurde abgebrochen")
+            self._abandon(key, flight, error)
+            _fail(flight.future, error)
+            raise
+        except Exception as e:
+            self._abandon(key, flight, e)
+            _fail(flight.future, e)
+            raise
+        if not _shareable(value):
+            flight.shareable = False
+            self._abandon(key, flight, None)
+        else:
+            self._store(key, flight, value)
+        flight.future.set_result(value)
+        return value
+
+
+def _shareable(value) -> bool:
+    # Generatoren sind nach einem Durchlauf leer, gespoolte Dateien werden nach dem Senden gelöscht
+    return not is_streaming(value) and not isinstance(value, FileResponse)
+
+
+def _fail(future: asyncio.Future, error: BaseException) -> None:
+    future.set_exception(error)
+    # Als abgerufen markieren, sonst meldet asyncio "exception was never retrieved", wenn niemand wartet
+    future.exception()
+
+
+def cached(
+    ttl: float = COMMAND_CACHE_TTL,
+    maxsize: int = COMMAND_CACHE_SIZE,
+    vary: Iterable[str] = (),
+    key: Optional[Callable[[Dict, List[str]], Hashable]] = None
+):
+    """
+    Markiert einen Command-Callback als cachebar. `Command` übernimmt den Cache
+    automatisch, der Callback selbst bleibt unverändert.
+
+        @cached(ttl=300, vary=("author",))
+        def wetter_callback(ctx, args): ...
+    """
+    def decorator(callback):
+        callback.__command_cache__ = CommandCache(ttl=ttl, maxsize=maxsize, vary=vary, key=key)
+        return callback
+    return decorator
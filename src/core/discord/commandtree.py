@@ -2,13 +2,34 @@
 # \src\core\discord\commandtree.py
 # \author @bastiix
 # ---------------------------------------------------------------------------
+import os
+import sys
+import math
+import time
+import uuid
 import pkgutil
 import importlib
 import inspect
-from typing import Callable, Dict, List, Tuple
+import pickle
+import asyncio
+import threading
+import contextvars
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from src.core.discord.message import boxed_message_with_title
+from src.core.discord.message import MessageBuilder, boxed_message_with_title, error_message, warning_message
+from src.core.discord.module_index import ModuleIndex, MODULE_INDEX_PATH, scan_modules
+from src.core.discord.metrics import Metrics
+from src.core.discord.chunker import is_streaming
+from src.core.discord.command_cache import CommandCache
+from src.core.discord.admission import AdmissionControl
+from src.core.discord.events import EventDispatcher, Subscription
+from src.core.discord.state import StateCache
+from src.core.discord.rest import RestClient
+from src.core.discord.scheduler import Job, Scheduler
+from src.core.discord import process_pool
+from src.core.system.store import KVStore, Namespace
 from src.core.animation.debug_animation import logger as debug_logger
+from src.core.animation.structured_log import trace
 
 try:
     import settings
@@ -31,59 +52,240 @@ if _raw_allowed:
 else:
     ALLOWED_USERS = None
 
+LAZY_MODULES = getattr(settings, 'LAZY_MODULES', True)
+MODULE_RELOAD_INTERVAL = getattr(settings, 'MODULE_RELOAD_INTERVAL', 0)
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_note(cmd) -> Optional[str]:
+    if getattr(cmd, "cache", None) is not None:
+        return cmd.cache.describe()
+    return getattr(cmd, "cache_note", None)
+
 
 class Command:
     def __init__(
         self,
         name: str,
-        callback: Callable[[Dict, List[str]], str],
+        callback: Callable[[Dict, List[str]], Union[str, Iterable[str], Awaitable[str]]],
         help_description_short: str,
-        help_description_long: str
+        help_description_long: str,
+        timeout: Optional[float] = None,
+        cache: Optional[CommandCache] = None,
+        rate_limit: Optional[Tuple[float, float]] = None,
+        cpu_bound: bool = False
     ):
         debug_logger.debug(
             'Command.__init__',
-            f"Initialisiere Command: name={name}, callback={callback}, help_short={help_description_short}"
+            "Initialisiere Command: name=%s, callback=%s, help_short=%s", name, callback, help_description_short
         )
         self.name = name
         self.callback = callback
         self.help_short = help_description_short
         self.help_long = help_description_long
+        self.timeout = timeout
+        # (Anzahl, Sekunden) für diesen Befehl über alle User, ersetzt settings.RATE_LIMIT_COMMAND
+        self.rate_limit = tuple(rate_limit) if rate_limit else None
+        self.module: Optional[str] = None
+        # Opt-in: explizit übergeben oder per @cached am Callback deklariert
+        self.cache: Optional[CommandCache] = cache if cache is not None else getattr(callback, "__command_cache__", None)
+        # `async def`-Callbacks laufen auf dem asyncio-Loop des Bots statt in einem Worker-Thread
+        self.is_async = inspect.iscoroutinefunction(callback)
+        # Rechenintensive Callbacks laufen im Prozess-Pool statt im Worker-Thread (siehe process_pool.md)
+        self.cpu_bound = bool(cpu_bound)
+
+    def execute(self, ctx: Dict, args: List[str], loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
+        if self.is_async:
+            coro = self.execute_async(ctx, args)
+            if loop is not None and loop.is_running():
+                return asyncio.run_coroutine_threadsafe(coro, loop).result()
+            return asyncio.run(coro)
+        if self.cache is not None:
+            key = self.cache.make_key(self.name, ctx, args)
+            return self.cache.get_or_compute(key, lambda: self._call(ctx, args))
+        return self._call(ctx, args)
 
-    def execute(self, ctx: Dict, args: List[str]) -> str:
+    def _call(self, ctx: Dict, args: List[str]) -> str:
         debug_logger.debug(
             'Command.execute',
-            f"Führe Command '{self.name}' aus mit ctx={ctx} und args={args}"
+            "Führe Command '%s' aus mit ctx=%s und args=%s", self.name, ctx, args
         )
         try:
-            result = self.callback(ctx, args) or ""
+            if self.cpu_bound and process_pool.pool.enabled:
+                result = process_pool.pool.run(
+                    self.callback, ctx, args, timeout=self.timeout, cancel_event=ctx.get("cancel_event")
+                )
+            else:
+                result = self.callback(ctx, args) or ""
             debug_logger.debug(
                 'Command.execute',
-                f"Command '{self.name}' erfolgreich ausgeführt, Ergebnis={result!r}"
+                "Command '%s' erfolgreich ausgeführt, Ergebnis=%r", self.name, result
             )
             return result
         except Exception as e:
             debug_logger.error(
                 'Command.execute',
-                f"Fehler im Command '{self.name}': {e}",
+                "Fehler im Command '%s': %s", self.name, e,
+                exc_info=True
+            )
+            raise RuntimeError(f"Fehler im Command '{self.name}': {e}") from e
+
+    async def execute_async(self, ctx: Dict, args: List[str]) -> str:
+        if self.cache is not None:
+            key = self.cache.make_key(self.name, ctx, args)
+            return await self.cache.get_or_compute_async(key, lambda: self._call_async(ctx, args))
+        return await self._call_async(ctx, args)
+
+    async def _call_async(self, ctx: Dict, args: List[str]) -> str:
+        debug_logger.debug(
+            'Command.execute_async',
+            "Führe async Command '%s' aus mit ctx=%s und args=%s", self.name, ctx, args
+        )
+        try:
+            result = await self.callback(ctx, args) or ""
+            debug_logger.debug(
+                'Command.execute_async',
+                "Command '%s' erfolgreich ausgeführt, Ergebnis=%r", self.name, result
+            )
+            return result
+        except asyncio.CancelledError:
+            debug_logger.warning('Command.execute_async', "Command '%s' wurde abgebrochen", self.name)
+            raise
+        except Exception as e:
+            debug_logger.error(
+                'Command.execute_async',
+                "Fehler im Command '%s': %s", self.name, e,
                 exc_info=True
             )
             raise RuntimeError(f"Fehler im Command '{self.name}': {e}") from e
 
 
+class LazyCommand(Command):
+    """
+    Platzhalter aus dem Modul-Index. Das eigentliche Modul wird erst beim ersten
+    Aufruf importiert, danach wird an den echten Command delegiert.
+    """
+
+    def __init__(self, tree, module_name: str, entry: Dict):
+        super().__init__(
+            name=entry["name"],
+            callback=self._unresolved,
+            help_description_short=entry.get("help_short", ""),
+            help_description_long=entry.get("help_long", ""),
+            timeout=entry.get("timeout"),
+            rate_limit=entry.get("rate_limit")
+        )
+        self.is_async = bool(entry.get("is_async", False))
+        self.cpu_bound = bool(entry.get("cpu_bound", False))
+        self.cache_note: Optional[str] = entry.get("cache")
+        self.module_name = module_name
+        self._tree = tree
+
+    def _unresolved(self, ctx, args):
+        return self._resolve().execute(ctx, args, loop=self._tree.loop)
+
+    def _resolve(self) -> Command:
+        return self._tree._load_lazy_command(self.module_name, self.name.lower())
+
+    def execute(self, ctx: Dict, args: List[str], loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
+        return self._resolve().execute(ctx, args, loop=loop)
+
+    async def execute_async(self, ctx: Dict, args: List[str]) -> str:
+        # Import blockiert, daher nicht auf dem Loop-Thread selbst
+        running = asyncio.get_running_loop()
+        cmd = await running.run_in_executor(None, self._resolve)
+        if cmd.is_async:
+            return await cmd.execute_async(ctx, args)
+        # Kontext (Trace-ID) in den Executor-Thread mitnehmen
+        return await running.run_in_executor(None, contextvars.copy_context().run, cmd.execute, ctx, args)
+
+
+class Invocation:
+    """Geparster Befehlsaufruf, der unabhängig vom Gateway-Thread ausgeführt werden kann."""
+
+    __slots__ = ("cmd", "name", "args", "ctx", "cancel_event", "trace_id")
+
+    def __init__(self, cmd: Command, name: str, args: List[str], ctx: Dict):
+        self.cmd = cmd
+        self.name = name
+        self.args = args
+        self.ctx = ctx
+        self.cancel_event = threading.Event()
+        # Callbacks mit langer Laufzeit können ctx["cancel_event"] prüfen und sich selbst beenden
+        self.ctx["cancel_event"] = self.cancel_event
+        # Verknüpft alle Log-Einträge dieses Aufrufs im strukturierten Log
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.ctx["trace_id"] = self.trace_id
+
+    @property
+    def channel_id(self) -> str:
+        return self.ctx["channel_id"]
+
+
 class CommandTree:
-    def __init__(self, bot, prefix, logger=None):
+    def __init__(
+        self,
+        bot,
+        prefix,
+        logger=None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        modules_package: str = "src.modules",
+        lazy_modules: bool = LAZY_MODULES,
+        index_path: str = MODULE_INDEX_PATH
+    ):
         debug_logger.debug(
             'CommandTree.__init__',
-            f"Initialisiere CommandTree mit prefix={prefix}, bot={bot}"
+            "Initialisiere CommandTree mit prefix=%s, bot=%s", prefix, bot
         )
         self.bot = bot
         self.prefix = prefix
         self.logger = logger or debug_logger
+        self.loop = loop
         self.commands: Dict[str, Command] = {}
         self.allowed_users = ALLOWED_USERS
+        self.modules_package = modules_package
+        self.lazy_modules = lazy_modules
+        self.index_path = index_path
+        # Modulname -> registrierte Command-Keys
+        self.module_commands: Dict[str, List[str]] = {}
+        self.loaded_modules: Dict[str, object] = {}
+        self._loading_module: Optional[str] = None
+        self._load_lock = threading.RLock()
+        # Während eines Reloads schreibt register() in diese Kopie, die danach atomar getauscht wird
+        self._staging: Optional[Dict[str, Command]] = None
+        self._module_stamps: Dict[str, Tuple[int, int]] = {}
+        self._index: Optional[ModuleIndex] = None
+        self.metrics = Metrics()
+        self.admission = AdmissionControl()
+        # Gateway-Events nach Typ; Module registrieren ihre Handler über on_event()
+        self.events = EventDispatcher(logger=self.logger)
+        # REST-Fassade um den aktuellen Client, für Module als command_tree.rest bzw. ctx["rest"]
+        self.rest = RestClient(lambda: self.bot, metrics=self.metrics, logger=self.logger)
+        # Guilds/Channels/Rollen aus dem Gateway, für Commands als ctx["state"]; Fehlzugriffe über self.rest
+        self.state = StateCache(client=lambda: self.rest, logger=self.logger)
+        self.state.attach(self.events)
+        # Persistenter Key-Value-Speicher, für Module über storage() in setup(); öffnet die Datei erst bei Bedarf
+        self.store = KVStore(logger=self.logger)
+        # Periodische und einmalige Jobs, für Module über schedule() in setup(); main.py startet das Rad
+        self.scheduler = Scheduler(logger=self.logger)
+        # Unterseiten von `$stats`: Name -> (Titel, Funktion, die den Text liefert); siehe add_stats_view()
+        self.stats_views: Dict[str, Tuple[str, Callable[[], str]]] = {}
+        # Gerenderte Hilfe: (prefix, Seiten) bzw. Command-Key -> Text. Ungültig nach register/unregister/reload.
+        self._help_pages: Optional[Tuple[str, List[str]]] = None
+        self._help_details: Dict[str, str] = {}
+        self._help_version = 0
 
         self.logger.debug('CommandTree.__init__', "Registriere Help-Command")
         self._register_help()
+        self._register_stats()
+        self._register_reload()
         self.logger.debug('CommandTree.__init__', "Suche automatisch nach Commands")
         self._autodiscover_commands()
         self.logger.debug('CommandTree.__init__', "CommandTree-Initialisierung abgeschlossen")
@@ -92,11 +294,13 @@ class CommandTree:
         debug_logger.debug('_register_help', "Help-Command wird eingerichtet")
 
         def help_callback(ctx, args):
-            debug_logger.debug('help_callback', f"Help aufgerufen mit args={args}")
+            debug_logger.debug('help_callback', "Help aufgerufen mit args=%s", args)
             if not args:
                 debug_logger.debug('help_callback', "Keine Argumente, generiere Übersicht aller Befehle")
                 return self.format_all_help()
-            debug_logger.debug('help_callback', f"Argument vorhanden, generiere Hilfe für Command {args[0]}")
+            if args[0].isdigit():
+                return self.format_all_help(int(args[0]))
+            debug_logger.debug('help_callback', "Argument vorhanden, generiere Hilfe für Command %s", args[0])
             return self.format_command_help(args[0])
 
         help_cmd = Command(
@@ -105,6 +309,7 @@ class CommandTree:
             help_description_short="Zeigt Übersicht aller Befehle",
             help_description_long=(
                 "Ohne Argument zeigt `!help` alle Befehle mit kurzer Beschreibung.\n"
+                "Passen nicht alle auf eine Nachricht, zeigt `!help <Seite>` die weiteren Seiten.\n"
                 "Mit `!help <Befehl>` Details zu genau diesem Befehl."
             )
         )
@@ -112,126 +317,695 @@ class CommandTree:
             self.register(help_cmd)
             debug_logger.debug('_register_help', "Help-Command erfolgreich registriert")
         except Exception as e:
-            debug_logger.error('_register_help', f"Help-Registration fehlgeschlagen: {e}", exc_info=True)
+            debug_logger.error('_register_help', "Help-Registration fehlgeschlagen: %s", e, exc_info=True)
+
+    def _register_stats(self):
+        def stats_callback(ctx, args):
+            debug_logger.debug('stats_callback', "Stats aufgerufen mit args=%s", args)
+            if not args:
+                s = self.state.stats()
+                state = (
+                    f"\n\nState-Cache: {s['guilds']} Guilds, {s['channels']} Channels, {s['roles']} Rollen, "
+                    f"{s['hits']} Treffer, {s['misses']} Fehlzugriffe (REST)"
+                )
+                k = self.store.stats()
+                if k["reads"] or k["writes"]:
+                    state += (
+                        f"\nStore: {k['reads']} Lesezugriffe ({k['cache_hits']} aus dem Cache), "
+                        f"{k['writes']} Schreibzugriffe in {k['commits']} Commits, {k['pending']} ausstehend"
+                    )
+                return boxed_message_with_title("Statistik", self.metrics.format_table() + state)
+            name = args[0].lower()
+            if name == "reset":
+                self.metrics.reset()
+                return boxed_message_with_title("Statistik", "Alle Zähler wurden zurückgesetzt.")
+            view = self.stats_views.get(name)
+            if view is not None:
+                title, render = view
+                return boxed_message_with_title(f"Statistik: {title}", render())
+            # `$stats $rest`: Befehl, dessen Name mit einer Unterseite übereinstimmt
+            if name.startswith(self.prefix):
+                name = name[len(self.prefix):]
+            details = self.metrics.format_command(name)
+            if details is None:
+                return error_message(f"Für `{self.prefix}{name}` liegen keine Daten vor.")
+            cmd = self.commands.get(name)
+            if cmd is not None and cmd.cache is not None:
+                c = cmd.cache.stats()
+                details += (
+                    f"\n\nCache: {c['hits']} Treffer, {c['misses']} Fehlzugriffe, {c['shared']} geteilt, "
+                    f"{c['size']}/{cmd.cache.maxsize} Einträge, {c['evictions']} verdrängt"
+                )
+            return boxed_message_with_title(f"Statistik: {self.prefix}{name}", details)
+
+        try:
+            self.register(Command(
+                name="stats",
+                callback=stats_callback,
+                help_description_short="Zeigt Aufrufe, Fehler und Latenzen der Befehle",
+                help_description_long=(
+                    "Ohne Argument zeigt `!stats` Aufrufe, Fehler und p50/p95/p99 pro Befehl.\n"
+                    "Mit `!stats <Befehl>` die Latenzverteilung dieses Befehls.\n"
+                    "`!stats rest` zeigt Requests, Fehler, Retries und Latenzen pro REST-Route.\n"
+                    "`!stats jobs` zeigt die geplanten Jobs mit Läufen, Fehlern und Laufzeit.\n"
+                    "`!stats reset` setzt alle Zähler zurück.\n"
+                    "Heißt ein Befehl wie eine Unterseite, zeigt `!stats !<Befehl>` seine Latenzen."
+                )
+            ))
+        except Exception as e:
+            debug_logger.error('_register_stats', "Stats-Registration fehlgeschlagen: %s", e, exc_info=True)
+        self.add_stats_view("rest", "REST", self.metrics.format_routes)
+        self.add_stats_view("jobs", "Jobs", self.scheduler.format_table)
+
+    def add_stats_view(self, name: str, title: str, render: Callable[[], str]) -> None:
+        """
+        Unterseite `$stats <name>`, `render()` liefert den Text. Unterseiten haben Vorrang vor
+        gleichnamigen Befehlen; deren Latenzen zeigt `$stats <prefix><name>`.
+        """
+        key = name.lower()
+        if key == "reset":
+            raise ValueError("'reset' ist für das Zurücksetzen der Zähler reserviert")
+        self.stats_views[key] = (title, render)
+
+    def _register_reload(self):
+        def reload_callback(ctx, args):
+            debug_logger.debug('reload_callback', "Reload aufgerufen mit args=%s", args)
+            if args and self._resolve_group(args[0]) is None:
+                return error_message(f"Modul `{args[0]}` nicht gefunden.")
+            summary = self.reload_modules(only=args[0] if args else None)
+            return self.format_reload_summary(summary)
+
+        try:
+            self.register(Command(
+                name="reload",
+                callback=reload_callback,
+                help_description_short="Lädt geänderte Module neu",
+                help_description_long=(
+                    "Ohne Argument lädt `!reload` alle Module neu, deren Dateien sich geändert haben.\n"
+                    "Mit `!reload <Modul>` wird genau dieses Modul neu geladen.\n"
+                    "Die Gateway-Sitzung bleibt dabei bestehen."
+                )
+            ))
+        except Exception as e:
+            debug_logger.error('_register_reload', "Reload-Registration fehlgeschlagen: %s", e, exc_info=True)
 
     def register(self, cmd: Command) -> None:
         key = cmd.name.lower()
-        debug_logger.debug('CommandTree.register', f"Versuche, Command '{key}' zu registrieren")
-        if key in self.commands:
-            debug_logger.error('CommandTree.register', f"Command '{key}' ist bereits registriert")
+        debug_logger.debug('CommandTree.register', "Versuche, Command '%s' zu registrieren", key)
+        if cmd.cpu_bound and not isinstance(cmd, LazyCommand):
+            self._check_cpu_bound(cmd)
+        target = self._staging if self._staging is not None else self.commands
+        existing = target.get(key)
+        # Ein Platzhalter darf vom echten Command desselben Moduls ersetzt werden
+        replaces_stub = (
+            isinstance(existing, LazyCommand)
+            and self._loading_module is not None
+            and existing.module_name == self._loading_module
+        )
+        if existing is not None and not replaces_stub:
+            debug_logger.error('CommandTree.register', "Command '%s' ist bereits registriert", key)
             raise ValueError(f"Command '{key}' bereits registriert")
-        self.commands[key] = cmd
-        debug_logger.debug('CommandTree.register', f"'{key}' registriert (Kurzbeschreibung: {cmd.help_short})")
+        if self._loading_module is not None:
+            cmd.module = self._loading_module
+            keys = self.module_commands.setdefault(self._loading_module, [])
+            if key not in keys:
+                keys.append(key)
+        target[key] = cmd
+        self.invalidate_help()
+        debug_logger.debug('CommandTree.register', "'%s' registriert (Kurzbeschreibung: %s)", key, cmd.help_short)
 
-    def handle(
+    @staticmethod
+    def _check_cpu_bound(cmd: Command) -> None:
+        # Früh scheitern: im Prozess-Pool fiele der Fehler erst beim ersten Aufruf auf
+        if cmd.is_async:
+            raise ValueError(f"Command '{cmd.name}': cpu_bound ist nur für synchrone Callbacks möglich")
+        try:
+            pickle.dumps(cmd.callback)
+        except Exception as e:
+            raise ValueError(
+                f"Command '{cmd.name}': cpu_bound braucht eine Funktion auf Modulebene als Callback ({e})"
+            ) from e
+
+    def storage(self, name: Optional[str] = None) -> Namespace:
+        """
+        Namespace im gemeinsamen Store. Aus setup() ohne Argument aufgerufen, heißt er wie das
+        Modul (`src/modules/<name>/`), bleibt also über Reloads und Neustarts gleich.
+        """
+        if name is None:
+            if self._loading_module is None:
+                raise ValueError("storage() ohne Namen geht nur aus setup()")
+            name = self._group_of(self._loading_module).rsplit(".", 1)[-1]
+        return self.store.namespace(name)
+
+    def cpu_bound_modules(self) -> List[str]:
+        """Module mit cpu_bound-Commands; der Prozess-Pool importiert sie beim Start vorab."""
+        return sorted({cmd.module for cmd in self.commands.values() if cmd.cpu_bound and cmd.module})
+
+    def on_event(self, event: str, handler: Callable[[Dict], None], accept: Optional[Callable[[Dict], bool]] = None) -> Subscription:
+        """
+        Registriert einen Handler für ein Gateway-Event (z. B. "MESSAGE_REACTION_ADD").
+        Aus setup() aufgerufen, gehört der Handler dem Modul und wird beim Reload ersetzt.
+        """
+        return self.events.on(event, handler, accept=accept, owner=self._loading_module)
+
+    def schedule(
+        self,
+        func: Callable[[], None],
+        *,
+        every: Optional[float] = None,
+        cron: Optional[str] = None,
+        delay: Optional[float] = None,
+        name: Optional[str] = None,
+        first: Optional[float] = None
+    ) -> Job:
+        """
+        Plant einen Job: `every=<Sekunden>`, `cron="<Ausdruck>"` oder einmalig `delay=<Sekunden>`.
+        Aus setup() aufgerufen, gehört der Job dem Modul und wird beim Reload ersetzt.
+        """
+        if sum(x is not None for x in (every, cron, delay)) != 1:
+            raise ValueError("schedule() braucht genau eines von every, cron oder delay")
+        owner = self._loading_module
+        if every is not None:
+            return self.scheduler.every(every, func, name=name, owner=owner, first=first)
+        if cron is not None:
+            return self.scheduler.cron(cron, func, name=name, owner=owner)
+        return self.scheduler.once(delay, func, name=name, owner=owner)
+
+    def unregister(self, name: str) -> Optional[Command]:
+        key = name.lower()
+        with self._load_lock:
+            target = self._staging if self._staging is not None else self.commands
+            cmd = target.pop(key, None)
+            if cmd is not None and cmd.module in self.module_commands:
+                keys = self.module_commands[cmd.module]
+                if key in keys:
+                    keys.remove(key)
+        if cmd is not None:
+            self.invalidate_help()
+        debug_logger.debug('CommandTree.unregister', "'%s' entfernt: %s", key, cmd is not None)
+        return cmd
+
+    def prepare(
         self,
         channel_id: str,
         author: Dict,
         content: str
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, Optional[Invocation], str]:
         debug_logger.debug(
-            'CommandTree.handle',
-            f"Verarbeite Nachricht in channel={channel_id} von author={author} -> content={content!r}"
+            'CommandTree.prepare',
+            "Verarbeite Nachricht in channel=%s von author=%s -> content=%r", channel_id, author, content
         )
         name = None
         try:
             if not content.startswith(self.prefix):
-                debug_logger.debug('CommandTree.handle', "Nachricht beginnt nicht mit Prefix, ignoriere")
-                return False, ""
+                debug_logger.debug('CommandTree.prepare', "Nachricht beginnt nicht mit Prefix, ignoriere")
+                return False, None, ""
 
             author_id = str(author.get("id"))
             if self.allowed_users is not None and author_id not in self.allowed_users:
                 debug_logger.debug(
-                    'CommandTree.handle',
-                    f"Author {author_id} nicht in erlaubten Benutzern, ignoriere"
+                    'CommandTree.prepare',
+                    "Author %s nicht in erlaubten Benutzern, ignoriere", author_id
                 )
-                return False, ""
+                return False, None, ""
 
             parts = content[len(self.prefix):].split()
-            debug_logger.debug('CommandTree.handle', f"Geparste Teile: {parts}")
+            debug_logger.debug('CommandTree.prepare', "Geparste Teile: %s", parts)
             if not parts:
-                debug_logger.debug('CommandTree.handle', "Kein Command nach Prefix, ignoriere")
-                return False, ""
+                debug_logger.debug('CommandTree.prepare', "Kein Command nach Prefix, ignoriere")
+                return False, None, ""
 
             name = parts[0].lower()
             args = parts[1:]
-            debug_logger.debug('CommandTree.handle', f"Command-Name='{name}', args={args}")
+            debug_logger.debug('CommandTree.prepare', "Command-Name='%s', args=%s", name, args)
 
             cmd = self.commands.get(name)
             if not cmd:
-                debug_logger.warning('CommandTree.handle', f"Unbekannter Befehl: {name}")
-                return True, f"Unbekannter Befehl: `{self.prefix}{name}`. Probiere `{self.prefix}help`"
+                debug_logger.warning('CommandTree.prepare', "Unbekannter Befehl: %s", name)
+                return True, None, f"Unbekannter Befehl: `{self.prefix}{name}`. Probiere `{self.prefix}help`"
+
+            decision = self.admission.check(author_id, name, cmd.rate_limit)
+            if not decision.admitted:
+                self.metrics.observe_throttled(decision.drop)
+                if decision.drop:
+                    debug_logger.debug('CommandTree.prepare', "Limit (%s) für %s überschritten, verwerfe `%s`", decision.scope, author_id, name)
+                    return False, None, ""
+                debug_logger.warning('CommandTree.prepare', "Limit (%s) für %s überschritten bei `%s`", decision.scope, author_id, name)
+                return True, None, self._throttle_message(name, decision)
 
             ctx = {
                 "channel_id": channel_id,
                 "author_id": author_id,
-                "author_username": author.get("username", "unknown")
+                "author_username": author.get("username", "unknown"),
+                "state": self.state,
+                "rest": self.rest
             }
-            debug_logger.debug('CommandTree.handle', f"Ausführungskontext: {ctx}")
-
-            result = cmd.execute(ctx, args)
-            debug_logger.debug('CommandTree.handle', f"Command '{name}' lieferte Ergebnis: {result!r}")
-            return True, result
+            debug_logger.debug('CommandTree.prepare', "Ausführungskontext: %s", ctx)
+            return True, Invocation(cmd, name, args, ctx), ""
 
         except Exception as e:
-            debug_logger.error('CommandTree.handle', f"Ausnahme bei `{self.prefix}{name}`: {e}", exc_info=True)
-            return True, f"Fehler beim Ausführen von `{self.prefix}{name}`: {e}"
+            debug_logger.error('CommandTree.prepare', "Ausnahme bei `%s%s`: %s", self.prefix, name, e, exc_info=True)
+            return True, None, f"Fehler beim Ausführen von `{self.prefix}{name}`: {e}"
+
+    def _throttle_message(self, name: str, decision) -> str:
+        scope = {
+            "global": "Zu viele Befehle insgesamt",
+            "user": "Du sendest zu viele Befehle",
+            "command": f"`{self.prefix}{name}` wird gerade zu oft aufgerufen",
+        }.get(decision.scope, "Zu viele Befehle")
+        return warning_message(f"{scope}, bitte in {max(1, math.ceil(decision.retry_after))}s erneut versuchen.")
+
+    def run(self, invocation: Invocation) -> Union[str, Iterator[str]]:
+        name = invocation.name
+        start = time.perf_counter()
+        with trace(invocation.trace_id):
+            try:
+                result = invocation.cmd.execute(invocation.ctx, invocation.args, loop=self.loop)
+                if is_streaming(result):
+                    return self._stream(invocation, result, start)
+                self.metrics.observe_command(name, time.perf_counter() - start)
+                debug_logger.debug('CommandTree.run', "Command '%s' lieferte Ergebnis: %r", name, result)
+                return result
+            except Exception as e:
+                self.metrics.observe_command(name, time.perf_counter() - start, error=True)
+                debug_logger.error('CommandTree.run', "Ausnahme bei `%s%s`: %s", self.prefix, name, e, exc_info=True)
+                return f"Fehler beim Ausführen von `{self.prefix}{name}`: {e}"
+
+    async def run_async(self, invocation: Invocation) -> Union[str, Iterator[str]]:
+        name = invocation.name
+        start = time.perf_counter()
+        with trace(invocation.trace_id):
+            try:
+                result = await invocation.cmd.execute_async(invocation.ctx, invocation.args)
+                if is_streaming(result):
+                    return self._stream(invocation, result, start)
+                self.metrics.observe_command(name, time.perf_counter() - start)
+                debug_logger.debug('CommandTree.run_async', "Command '%s' lieferte Ergebnis: %r", name, result)
+                return result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.observe_command(name, time.perf_counter() - start, error=True)
+                debug_logger.error('CommandTree.run_async', "Ausnahme bei `%s%s`: %s", self.prefix, name, e, exc_info=True)
+                return f"Fehler beim Ausführen von `{self.prefix}{name}`: {e}"
+
+    def _stream(self, invocation: Invocation, result: Iterable[str], start: float) -> Iterator[str]:
+        # Generator-Ergebnisse laufen erst beim Senden; Laufzeit und Fehler werden dann erfasst
+        name = invocation.name
+        error = False
+        with trace(invocation.trace_id):
+            try:
+                yield from result
+            except Exception as e:
+                error = True
+                debug_logger.error('CommandTree.stream', "Ausnahme im Stream von `%s%s`: %s", self.prefix, name, e, exc_info=True)
+                raise
+            finally:
+                self.metrics.observe_command(name, time.perf_counter() - start, error=error)
+
+    def handle(
+        self,
+        channel_id: str,
+        author: Dict,
+        content: str
+    ) -> Tuple[bool, str]:
+        handled, invocation, reply = self.prepare(channel_id, author, content)
+        if invocation is None:
+            return handled, reply
+        return True, self.run(invocation)
+
+    def invalidate_help(self) -> None:
+        self._help_version += 1
+        self._help_pages = None
+        self._help_details = {}
 
-    def format_all_help(self) -> str:
-        debug_logger.debug('format_all_help', "Generiere komplette Hilfeübersicht")
+    def help_pages(self) -> List[str]:
+        """Die Hilfeübersicht, fertig in Seiten <= MAX_CHUNK_SIZE aufgeteilt. Wird nur nach Änderungen neu gerendert."""
+        cached = self._help_pages
+        if cached is not None and cached[0] == self.prefix:
+            return cached[1]
+        version = self._help_version
+        prefix = self.prefix
+        debug_logger.debug('help_pages', "Rendere Hilfeübersicht (%s Befehle)", len(self.commands))
+        def footer(page: int, total: int) -> str:
+            if page < total:
+                return f"Seite {page}/{total}, weiter mit {prefix}help {page + 1}"
+            return f"Seite {page}/{total}"
+
+        builder = MessageBuilder("Hilfe Übersicht", footer=footer)
+        builder.add_line("Verfügbare Befehle:")
+        for name, cmd in sorted(self.commands.items()):
+            marker = " [Cache]" if _cache_note(cmd) else ""
+            builder.add_line(f"- `{prefix}{name}`: {cmd.help_short}{marker}")
+        pages = builder.pages()
+        # Nur übernehmen, wenn sich währenddessen nichts geändert hat
+        if version == self._help_version:
+            self._help_pages = (prefix, pages)
+        return pages
+
+    def format_all_help(self, page: int = 1) -> str:
+        debug_logger.debug('format_all_help', "Hilfeübersicht Seite %s", page)
         try:
-            lines = ["Verfügbare Befehle:"]
-            for name, cmd in sorted(self.commands.items()):
-                debug_logger.debug('format_all_help', f"Füge Hilfeeintrag für '{name}' hinzu")
-                lines.append(f"- `{self.prefix}{name}`: {cmd.help_short}")
-            body = "\n".join(lines)
-            debug_logger.debug('format_all_help', "Hilfeübersicht erstellt")
-            return boxed_message_with_title("Hilfe Übersicht", body)
+            pages = self.help_pages()
+            if not 1 <= page <= len(pages):
+                return error_message(f"Seite {page} gibt es nicht, die Hilfe hat {len(pages)} Seite(n).")
+            return pages[page - 1]
         except Exception as e:
             debug_logger.error('format_all_help', str(e), exc_info=True)
             return boxed_message_with_title("Fehler", "Hilfe konnte nicht generiert werden.")
 
     def format_command_help(self, name: str) -> str:
-        debug_logger.debug('format_command_help', f"Generiere Hilfe für Command '{name}'")
+        debug_logger.debug('format_command_help', "Generiere Hilfe für Command '%s'", name)
         try:
-            cmd = self.commands.get(name.lower())
+            key = name.lower()
+            cached = self._help_details.get(key)
+            if cached is not None:
+                return cached
+            version = self._help_version
+            cmd = self.commands.get(key)
             if not cmd:
-                debug_logger.warning('format_command_help', f"Kein Hilfetext für '{name}' gefunden")
+                debug_logger.warning('format_command_help', "Kein Hilfetext für '%s' gefunden", name)
                 return boxed_message_with_title("Fehler", f"Kein Hilfetext für `{self.prefix}{name}` gefunden.")
-            debug_logger.debug('format_command_help', f"Command '{name}' gefunden, liefere detaillierte Hilfe")
-            return boxed_message_with_title(f"Hilfe: {self.prefix}{cmd.name}", cmd.help_long)
+            debug_logger.debug('format_command_help', "Command '%s' gefunden, liefere detaillierte Hilfe", name)
+            body = cmd.help_long
+            note = _cache_note(cmd)
+            if note:
+                body = f"{body}\n\n{note}"
+            # Überlange Texte teilt der Chunker beim Senden
+            text = boxed_message_with_title(f"Hilfe: {self.prefix}{cmd.name}", body)
+            if version == self._help_version:
+                self._help_details[key] = text
+            return text
         except Exception as e:
             debug_logger.error('format_command_help', str(e), exc_info=True)
             return boxed_message_with_title("Fehler", "Befehls-Hilfe konnte nicht generiert werden.")
 
+    def _setup_module(self, mod_name: str) -> Tuple[object, bool]:
+        debug_logger.debug('_autodiscover_commands', "Lade Modul: %s", mod_name)
+        module = importlib.import_module(mod_name)
+        setup_fn = getattr(module, "setup", None)
+        if not (callable(setup_fn) and inspect.isfunction(setup_fn)):
+            debug_logger.debug('_autodiscover_commands', "Kein setup() in %s, überspringe", mod_name)
+            return module, False
+        debug_logger.debug('_autodiscover_commands', "setup() in %s gefunden, rufe auf", mod_name)
+        with self._load_lock:
+            self._loading_module = mod_name
+            try:
+                setup_fn(self)
+            finally:
+                self._loading_module = None
+                self.loaded_modules[mod_name] = module
+            # Platzhalter, die setup() nicht mehr registriert hat, entfernen
+            target = self._staging if self._staging is not None else self.commands
+            for key in list(self.module_commands.get(mod_name, [])):
+                if isinstance(target.get(key), LazyCommand):
+                    del target[key]
+                    self.module_commands[mod_name].remove(key)
+        debug_logger.debug('_autodiscover_commands', "setup() für %s abgeschlossen", mod_name)
+        return module, True
+
+    def _load_lazy_command(self, mod_name: str, key: str) -> Command:
+        with self._load_lock:
+            cmd = self.commands.get(key)
+            if cmd is not None and not isinstance(cmd, LazyCommand):
+                return cmd
+            if mod_name not in self.loaded_modules:
+                debug_logger.debug('_load_lazy_command', "Erster Aufruf von '%s', lade %s", key, mod_name)
+                self._setup_module(mod_name)
+            cmd = self.commands.get(key)
+            if cmd is None or isinstance(cmd, LazyCommand):
+                raise RuntimeError(f"Command '{key}' wird von {mod_name} nicht mehr registriert")
+            return cmd
+
+    @staticmethod
+    def _describe(cmd: Command) -> Dict:
+        return {
+            "name": cmd.name,
+            "help_short": cmd.help_short,
+            "help_long": cmd.help_long,
+            "timeout": cmd.timeout,
+            "rate_limit": list(cmd.rate_limit) if cmd.rate_limit else None,
+            "is_async": cmd.is_async,
+            "cpu_bound": cmd.cpu_bound,
+            "cache": cmd.cache.describe() if cmd.cache is not None else None,
+        }
+
     def _autodiscover_commands(self):
         debug_logger.debug('_autodiscover_commands', "Starte automatische Entdeckung der Module")
         try:
-            import src.modules as pkg
+            pkg = importlib.import_module(self.modules_package)
         except ModuleNotFoundError:
-            debug_logger.warning('_autodiscover_commands', "Paket src.modules nicht gefunden")
+            debug_logger.warning('_autodiscover_commands', "Paket %s nicht gefunden", self.modules_package)
+            return
+
+        if self.lazy_modules:
+            self._autodiscover_lazy()
+            debug_logger.debug('_autodiscover_commands', "Automatische Command-Entdeckung abgeschlossen")
             return
+        self._snapshot_stamps()
 
         for _, mod_name, _ in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + "."):
-            debug_logger.debug('_autodiscover_commands', f"Untersuche Modul: {mod_name}")
+            debug_logger.debug('_autodiscover_commands', "Untersuche Modul: %s", mod_name)
             if ".inaktiv." in mod_name or mod_name.endswith(".inaktiv"):
-                debug_logger.debug('_autodiscover_commands', f"Überspringe inaktives Modul: {mod_name}")
+                debug_logger.debug('_autodiscover_commands', "Überspringe inaktives Modul: %s", mod_name)
                 continue
             try:
-                debug_logger.debug('_autodiscover_commands', f"Lade Modul: {mod_name}")
-                module = importlib.import_module(mod_name)
-                setup_fn = getattr(module, "setup", None)
-                if callable(setup_fn) and inspect.isfunction(setup_fn):
-                    debug_logger.debug('_autodiscover_commands', f"setup() in {mod_name} gefunden, rufe auf")
-                    setup_fn(self)
-                    debug_logger.debug('_autodiscover_commands', f"setup() für {mod_name} abgeschlossen")
-                else:
-                    debug_logger.debug('_autodiscover_commands', f"Kein setup() in {mod_name}, überspringe")
+                self._setup_module(mod_name)
             except Exception as e:
                 debug_logger.error(
                     '_autodiscover_commands',
-                    f"Fehler beim Import/Setup {mod_name}: {e}",
+                    "Fehler beim Import/Setup %s: %s", mod_name, e,
                     exc_info=True
                 )
 
         debug_logger.debug('_autodiscover_commands', "Automatische Command-Entdeckung abgeschlossen")
+
+    def _snapshot_stamps(self) -> List[Tuple[str, str]]:
+        try:
+            modules = scan_modules(self.modules_package)
+        except Exception as e:
+            debug_logger.warning('_snapshot_stamps', "Module konnten nicht gescannt werden: %s", e)
+            return []
+        for mod_name, path in modules:
+            stamp = _file_stamp(path)
+            if stamp is not None:
+                self._module_stamps[mod_name] = stamp
+        return modules
+
+    def _autodiscover_lazy(self):
+        index = ModuleIndex(self.index_path)
+        self._index = index
+        modules = self._snapshot_stamps()
+        stubs = 0
+        for mod_name, path in modules:
+            entry = index.lookup(mod_name, path)
+            if entry is not None and not entry.get("has_setup"):
+                continue
+            if entry is not None and entry.get("lazy", True) and entry.get("commands"):
+                self._loading_module = mod_name
+                try:
+                    for cmd_entry in entry["commands"]:
+                        self.register(LazyCommand(self, mod_name, cmd_entry))
+                        stubs += 1
+                except Exception as e:
+                    debug_logger.error('_autodiscover_commands', "Platzhalter für %s fehlerhaft: %s", mod_name, e)
+                finally:
+                    self._loading_module = None
+                continue
+            # Neu, geändert oder nicht lazy-fähig: sofort laden und Index aktualisieren
+            try:
+                module, has_setup = self._setup_module(mod_name)
+            except Exception as e:
+                debug_logger.error(
+                    '_autodiscover_commands',
+                    "Fehler beim Import/Setup %s: %s", mod_name, e,
+                    exc_info=True
+                )
+                continue
+            commands = [self._describe(self.commands[k]) for k in self.module_commands.get(mod_name, [])]
+            index.store(mod_name, path, has_setup, self._is_lazy(mod_name, module), commands)
+        index.prune([name for name, _ in modules])
+        index.save()
+        debug_logger.debug(
+            '_autodiscover_commands',
+            "%s Module indiziert, %s Commands als Platzhalter registriert, %s Module geladen",
+            len(modules), stubs, len(self.loaded_modules)
+        )
+
+    def _group_of(self, mod_name: str) -> str:
+        # src.modules.ping.setup -> src.modules.ping
+        base = self.modules_package + "."
+        rest = mod_name[len(base):] if mod_name.startswith(base) else mod_name
+        return base + rest.split(".", 1)[0]
+
+    def _resolve_group(self, name: str) -> Optional[str]:
+        known = {self._group_of(m) for m in self._module_stamps}
+        try:
+            known.update(self._group_of(m) for m, _ in scan_modules(self.modules_package))
+        except Exception:
+            pass
+        for group in known:
+            if group == name or group.rsplit(".", 1)[-1] == name:
+                return group
+        return None
+
+    def reload_modules(self, only: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Lädt geänderte (oder mit `only` angegebene) Module neu und tauscht ihre
+        Commands atomar aus. Ein Modul ist die Gruppe aller Dateien unter
+        `src/modules/<name>/`; ändert sich eine davon, wird die ganze Gruppe neu geladen.
+        """
+        summary: Dict[str, List[str]] = {"reloaded": [], "removed": [], "failed": [], "added": [], "dropped": []}
+        with self._load_lock:
+            scanned = scan_modules(self.modules_package)
+            paths = dict(scanned)
+            groups: Dict[str, List[str]] = {}
+            for mod_name, _ in scanned:
+                groups.setdefault(self._group_of(mod_name), []).append(mod_name)
+
+            if only is not None:
+                target_group = self._resolve_group(only) or (self._group_of(only) if only in paths else None)
+                changed = {target_group} if target_group else set()
+            else:
+                changed = set()
+                for mod_name, path in scanned:
+                    if self._module_stamps.get(mod_name) != _file_stamp(path):
+                        changed.add(self._group_of(mod_name))
+                for mod_name in self._module_stamps:
+                    if mod_name not in paths:
+                        changed.add(self._group_of(mod_name))
+            if not changed:
+                debug_logger.debug('reload_modules', "Keine geänderten Module gefunden")
+                return summary
+
+            old_commands = self.commands
+            old_module_commands = {m: list(k) for m, k in self.module_commands.items()}
+            staging = dict(old_commands)
+            for mod_name, keys in old_module_commands.items():
+                if self._group_of(mod_name) in changed:
+                    for key in keys:
+                        staging.pop(key, None)
+                    self.module_commands.pop(mod_name, None)
+
+            self._staging = staging
+            try:
+                for group in sorted(changed):
+                    members = groups.get(group, [])
+                    gone = [m for m in list(self._module_stamps) if self._group_of(m) == group and m not in paths]
+                    for mod_name in gone:
+                        self._forget_module(mod_name)
+                    if not members:
+                        summary["removed"].append(group)
+                        continue
+                    before = set(staging)
+                    old_handlers = self.events.remove_owners(members)
+                    old_jobs = self.scheduler.remove_owners(members)
+                    try:
+                        self._reload_group(members, paths)
+                        summary["reloaded"].append(group)
+                    except Exception as e:
+                        debug_logger.error('reload_modules', "Reload von %s fehlgeschlagen: %s", group, e, exc_info=True)
+                        summary["failed"].append(f"{group}: {e}")
+                        # Stand merken, damit der Watcher nicht bei jedem Intervall erneut scheitert
+                        for mod_name in members:
+                            stamp = _file_stamp(paths[mod_name])
+                            if stamp is not None:
+                                self._module_stamps[mod_name] = stamp
+                        # Alte Commands und Event-Handler der Gruppe wiederherstellen
+                        self.events.remove_owners(members)
+                        self.events.restore(old_handlers)
+                        self.scheduler.remove_owners(members)
+                        self.scheduler.restore(old_jobs)
+                        for key in set(staging) - before:
+                            staging.pop(key, None)
+                        for mod_name, keys in old_module_commands.items():
+                            if self._group_of(mod_name) == group:
+                                self.module_commands[mod_name] = keys
+                                for key in keys:
+                                    if key in old_commands:
+                                        staging[key] = old_commands[key]
+            finally:
+                self._staging = None
+
+            self.commands = staging
+            self.invalidate_help()
+            if summary["reloaded"]:
+                # Prozesse haben den alten Modul-Code importiert
+                process_pool.pool.recycle()
+            summary["added"] = sorted(set(staging) - set(old_commands))
+            summary["dropped"] = sorted(set(old_commands) - set(staging))
+            if self._index is not None:
+                self._index.prune(list(paths))
+                self._index.save()
+
+        debug_logger.debug('reload_modules', "Reload abgeschlossen: %s", summary)
+        return summary
+
+    def _reload_group(self, members: List[str], paths: Dict[str, str]) -> None:
+        # Hilfsmodule zuerst, damit setup() bereits die neuen Versionen importiert
+        loaded = [m for m in members if m in sys.modules]
+        helpers = [m for m in loaded if not callable(getattr(sys.modules[m], "setup", None))]
+        with_setup = [m for m in loaded if m not in helpers]
+        for mod_name in helpers + with_setup:
+            debug_logger.debug('reload_modules', "Lade %s neu", mod_name)
+            importlib.reload(sys.modules[mod_name])
+        importlib.invalidate_caches()
+        for mod_name in members:
+            module, has_setup = self._setup_module(mod_name)
+            path = paths[mod_name]
+            stamp = _file_stamp(path)
+            if stamp is not None:
+                self._module_stamps[mod_name] = stamp
+            if self._index is not None:
+                target = self._staging if self._staging is not None else self.commands
+                commands = [self._describe(target[k]) for k in self.module_commands.get(mod_name, [])]
+                self._index.store(mod_name, path, has_setup, self._is_lazy(mod_name, module), commands)
+
+    def _is_lazy(self, mod_name: str, module) -> bool:
+        # Event-Handler und Jobs müssen ab dem Start registriert sein, solche Module werden nie verzögert geladen
+        return (
+            bool(getattr(module, "LAZY", True))
+            and not self.events.owned_by(mod_name)
+            and not self.scheduler.owned_by(mod_name)
+        )
+
+    def _forget_module(self, mod_name: str) -> None:
+        debug_logger.debug('reload_modules', "Modul %s wurde entfernt", mod_name)
+        self.events.remove_owners([mod_name])
+        self.scheduler.remove_owners([mod_name])
+        self._module_stamps.pop(mod_name, None)
+        self.loaded_modules.pop(mod_name, None)
+        self.module_commands.pop(mod_name, None)
+        sys.modules.pop(mod_name, None)
+
+    def format_reload_summary(self, summary: Dict[str, List[str]]) -> str:
+        if not any(summary.values()):
+            return boxed_message_with_title("Reload", "Keine Änderungen gefunden.")
+        def short(names):
+            return ", ".join(n.rsplit(".", 1)[-1] for n in names) or "-"
+
+        lines = [
+            f"Neu geladen: {short(summary['reloaded'])}",
+            f"Entfernt: {short(summary['removed'])}",
+            f"Neue Befehle: {', '.join(summary['added']) or '-'}",
+            f"Entfernte Befehle: {', '.join(summary['dropped']) or '-'}",
+        ]
+        if summary["failed"]:
+            lines.append("Fehlgeschlagen:")
+            lines.extend(f"- {entry}" for entry in summary["failed"])
+        return boxed_message_with_title("Reload", "\n".join(lines))
+
+    def start_reload_watcher(self, interval: float = MODULE_RELOAD_INTERVAL) -> Optional[Job]:
+        if not interval or interval <= 0:
+            return None
+
+        def _watch():
+            try:
+                summary = self.reload_modules()
+                if any(summary.values()):
+                    debug_logger.debug('reload_watcher', "Automatischer Reload: %s", summary)
+            except Exception as e:
+                debug_logger.error('reload_watcher', "Automatischer Reload fehlgeschlagen: %s", e)
+
+        debug_logger.debug('reload_watcher', "Modul-Watcher eingeplant (Intervall %ss)", interval)
+        return self.scheduler.every(interval, _watch, name="module-reload")
@@ -0,0 +1,276 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\dispatcher.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import asyncio
+import heapq
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.discord.attachment import FileResponse
+from src.core.system.flight_recorder import flight_recorder
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+DISPATCH_WORKERS     = getattr(settings, 'DISPATCH_WORKERS', 4)
+DISPATCH_QUEUE_LIMIT = getattr(settings, 'DISPATCH_QUEUE_LIMIT', 64)
+COMMAND_TIMEOUT      = getattr(settings, 'COMMAND_TIMEOUT', 60)
+
+
+class _Job:
+    __slots__ = ("invocation", "respond", "timeout", "done", "expired", "timeout_reply", "started_at", "future")
+
+    def __init__(self, invocation, respond: Callable[[str], None], timeout: Optional[float]):
+        self.invocation = invocation
+        self.respond = respond
+        self.timeout = timeout
+        self.done = False
+        # Timeout-Antwort ist raus, der Callback läuft aber noch; der Channel bleibt belegt
+        self.expired = False
+        # Future der Timeout-Antwort; der Channel wird erst freigegeben, wenn sie eingereiht ist
+        self.timeout_reply = None
+        self.started_at = 0.0
+        self.future = None
+
+
+class _Watchdog:
+    """Ein einzelner Thread, der alle Command-Deadlines überwacht (statt eines Timers pro Job)."""
+
+    def __init__(self, on_expire: Callable[[_Job], None]):
+        self._on_expire = on_expire
+        self._heap: List[Tuple[float, int, _Job]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, name='dispatch-watchdog', daemon=True)
+        self._thread.start()
+
+    def watch(self, job: _Job, deadline: float) -> None:
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (deadline, self._seq, job))
+            if self._heap[0][2] is job:
+                self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    # Bereits abgeschlossene Jobs vorne im Heap verwerfen
+                    while self._heap and self._heap[0][2].done:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._stopped:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+            self._on_expire(job)
+
+
+class CommandDispatcher:
+    """
+    Nimmt geparste Invocations vom Gateway-Thread entgegen und führt sie in einem
+    begrenzten Worker-Pool aus. Befehle desselben Channels laufen strikt nacheinander,
+    verschiedene Channels parallel. `async def`-Commands belegen keinen Worker, sondern
+    laufen auf `tree.loop`.
+    """
+
+    def __init__(
+        self,
+        tree,
+        workers: int = DISPATCH_WORKERS,
+        queue_limit: int = DISPATCH_QUEUE_LIMIT,
+        default_timeout: Optional[float] = COMMAND_TIMEOUT,
+        logger=None
+    ):
+        self.tree = tree
+        self.logger = logger or debug_logger
+        self.queue_limit = max(1, int(queue_limit))
+        self.default_timeout = default_timeout or None
+        self.executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix='dispatch')
+        self._lock = threading.Lock()
+        # Channel-ID -> wartende Jobs. Ein vorhandener Key bedeutet: Channel hat einen laufenden Job.
+        self._channels: Dict[str, Deque[_Job]] = {}
+        self._depth = 0
+        self._closed = False
+        self._watchdog = _Watchdog(self._expire)
+        self.logger.debug(
+            'CommandDispatcher.__init__',
+            "Dispatcher gestartet: workers=%s, queue_limit=%s, timeout=%s", workers, self.queue_limit, self.default_timeout
+        )
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def submit(self, invocation, respond: Callable[[str], None]) -> bool:
+        timeout = invocation.cmd.timeout if invocation.cmd.timeout is not None else self.default_timeout
+        job = _Job(invocation, respond, timeout)
+        channel = invocation.channel_id
+        with self._lock:
+            if self._closed or self._depth >= self.queue_limit:
+                flight_recorder.record("BEFEHL", invocation.name, "abgelehnt, channel=%s", channel)
+                self.logger.warning(
+                    'CommandDispatcher.submit',
+                    "Queue voll (%s/%s), lehne `%s` ab", self._depth, self.queue_limit, invocation.name
+                )
+                self.tree.metrics.observe_rejected()
+                return False
+            self._depth += 1
+            flight_recorder.record("BEFEHL", invocation.name, "angenommen, channel=%s, Tiefe %s", channel, self._depth)
+            pending = self._channels.get(channel)
+            if pending is not None:
+                pending.append(job)
+                self.logger.debug(
+                    'CommandDispatcher.submit',
+                    "`%s` in channel=%s eingereiht (Position %s)", invocation.name, channel, len(pending)
+                )
+                return True
+            self._channels[channel] = deque()
+        self._start(job)
+        return True
+
+    def reject_message(self, invocation) -> str:
+        return (
+            f"Zu viele Befehle in Bearbeitung. `{self.tree.prefix}{invocation.name}` wurde abgelehnt, "
+            "bitte später erneut versuchen."
+        )
+
+    def _start(self, job: _Job) -> None:
+        job.started_at = time.monotonic()
+        if job.timeout:
+            self._watchdog.watch(job, job.started_at + job.timeout)
+        loop = self.tree.loop
+        if job.invocation.cmd.is_async and loop is not None and loop.is_running():
+            job.future = asyncio.run_coroutine_threadsafe(self.tree.run_async(job.invocation), loop)
+            job.future.add_done_callback(lambda fut: self._on_async_done(job, fut))
+            return
+        try:
+            self.executor.submit(self._run, job)
+        except RuntimeError as e:
+            # Executor wurde bereits heruntergefahren
+            self.logger.error('CommandDispatcher._start', "Job konnte nicht gestartet werden: %s", e)
+            self._finish(job, None)
+
+    def _run(self, job: _Job) -> None:
+        try:
+            result = self.tree.run(job.invocation)
+        except Exception as e:
+            self.logger.error('CommandDispatcher._run', "Unerwarteter Fehler in `%s`: %s", job.invocation.name, e)
+            result = f"Fehler beim Ausführen von `{self.tree.prefix}{job.invocation.name}`: {e}"
+        self._finish(job, result)
+
+    def _on_async_done(self, job: _Job, fut) -> None:
+        # Läuft im Loop-Thread, nach einem Abbruch durch _expire (future.cancel) aber synchron im
+        # Watchdog-Thread. In beiden Fällen gehören Antwort und Start des nächsten Jobs in den Pool.
+        if fut.cancelled():
+            # Die Timeout-Antwort ist schon unterwegs, _finish gibt nur den Channel frei
+            result = None
+        else:
+            exc = fut.exception()
+            if exc is not None:
+                result = f"Fehler beim Ausführen von `{self.tree.prefix}{job.invocation.name}`: {exc}"
+            else:
+                result = fut.result()
+        try:
+            self.executor.submit(self._finish, job, result)
+        except RuntimeError:
+            self._finish(job, result)
+
+    def _expire(self, job: _Job) -> None:
+        name = job.invocation.name
+        reply = f"Zeitüberschreitung: `{self.tree.prefix}{name}` wurde nach {job.timeout:g}s abgebrochen."
+        with self._lock:
+            if job.done or job.expired:
+                return
+            job.expired = True
+            # Senden ist ein REST-Call und gehört nicht auf den Watchdog-Thread, der alle Deadlines bedient.
+            # Noch unter dem Lock, damit _finish die Future sicher sieht und den Channel erst danach freigibt.
+            try:
+                job.timeout_reply = self.executor.submit(self._respond, job, reply)
+            except RuntimeError:
+                job.timeout_reply = None
+        if job.timeout_reply is None:
+            # Executor beim Shutdown schon beendet
+            self._respond(job, reply)
+        self.logger.warning(
+            'CommandDispatcher._expire',
+            "`%s` hat das Timeout von %ss überschritten, breche ab", name, job.timeout
+        )
+        self.tree.metrics.observe_timeout(name)
+        job.invocation.cancel_event.set()
+        if job.future is not None:
+            # Echter Abbruch: CancelledError im Coroutine-Task. Ruft _on_async_done sofort in diesem Thread auf.
+            job.future.cancel()
+
+    def _respond(self, job: _Job, reply: str) -> None:
+        try:
+            job.respond(reply)
+        except Exception as e:
+            self.logger.error('CommandDispatcher._respond', "Antwort für `%s` fehlgeschlagen: %s", job.invocation.name, e)
+            _discard(reply)
+
+    def _finish(self, job: _Job, reply: Optional[str]) -> None:
+        with self._lock:
+            if job.done:
+                return
+            job.done = True
+            expired = job.expired
+            timeout_reply = job.timeout_reply
+        flight_recorder.record(
+            "BEFEHL", job.invocation.name, "fertig nach %.1f ms", (time.monotonic() - job.started_at) * 1000.0
+        )
+        if reply is not None and not expired:
+            self._respond(job, reply)
+        elif expired:
+            self.logger.debug('CommandDispatcher._finish', "`%s` nach Timeout beendet, Ergebnis verworfen", job.invocation.name)
+            _discard(reply)
+        channel = job.invocation.channel_id
+        if timeout_reply is not None:
+            # Der nächste Befehl des Channels startet erst, wenn die Timeout-Antwort eingereiht ist,
+            # sonst könnte seine Antwort vor "Zeitüberschreitung …" ankommen. Läuft sofort, wenn sie schon raus ist.
+            timeout_reply.add_done_callback(lambda _f: self._advance(channel))
+            return
+        self._advance(channel)
+
+    def _advance(self, channel: str) -> None:
+        with self._lock:
+            self._depth -= 1
+            pending = self._channels.get(channel)
+            if pending:
+                nxt = pending.popleft()
+            else:
+                self._channels.pop(channel, None)
+                nxt = None
+        if nxt is not None:
+            self._start(nxt)
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+        self._watchdog.stop()
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        self.logger.debug('CommandDispatcher.shutdown', "Dispatcher beendet")
+
+
+def _discard(result) -> None:
+    # Verworfene Dateiantworten sofort aufräumen, sonst bleibt die gespoolte Temp-Datei bis zum GC liegen
+    if isinstance(result, FileResponse):
+        result.close()
@@ -0,0 +1,121 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\events.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.system.flight_recorder import flight_recorder
+
+Handler = Callable[[Dict], None]
+Accept = Callable[[Dict], bool]
+
+
+class Subscription:
+    __slots__ = ("event", "handler", "accept", "owner")
+
+    def __init__(self, event: str, handler: Handler, accept: Optional[Accept], owner: Optional[str]):
+        self.event = event
+        self.handler = handler
+        self.accept = accept
+        self.owner = owner
+
+    @property
+    def name(self) -> str:
+        return getattr(self.handler, "__qualname__", repr(self.handler))
+
+
+class EventDispatcher:
+    """
+    Verteilt Gateway-Events nach Typ (`t`) an die dafür registrierten Handler.
+
+    Beim Gateway wird nur ein einziger Callback angemeldet. Für Events ohne Handler
+    kostet ein Event damit nur einen Dict-Lookup, discums Parser (`resp.parsed`)
+    wird nie angefasst. Handler bekommen das rohe `d`-Dict. Ein optionaler
+    `accept`-Filter wird vorher auf denselben Daten geprüft und sollte billig sein
+    (Prefix, Author-ID), damit uninteressante Events früh verworfen werden.
+    Handler laufen im Gateway-Thread: Längere Arbeit gehört in den Dispatcher.
+    """
+
+    def __init__(self, logger=None):
+        self.logger = logger or debug_logger
+        self._lock = threading.Lock()
+        # Event-Typ -> Handler. Tupel werden nur ersetzt, nie verändert: _dispatch liest ohne Lock.
+        self._handlers: Dict[str, Tuple[Subscription, ...]] = {}
+
+    # --- Registrierung -------------------------------------------------------
+
+    def on(self, event: str, handler: Handler, accept: Optional[Accept] = None, owner: Optional[str] = None) -> Subscription:
+        """Registriert `handler` für den Event-Typ `event` (z. B. "MESSAGE_CREATE")."""
+        sub = Subscription(event.upper(), handler, accept, owner)
+        with self._lock:
+            self._handlers[sub.event] = self._handlers.get(sub.event, ()) + (sub,)
+        self.logger.debug('EventDispatcher.on', "Handler %s für %s registriert (owner=%s)", sub.name, sub.event, owner)
+        return sub
+
+    def off(self, sub: Subscription) -> bool:
+        with self._lock:
+            current = self._handlers.get(sub.event, ())
+            if sub not in current:
+                return False
+            self._set(sub.event, tuple(s for s in current if s is not sub))
+        return True
+
+    def remove_owners(self, owners: Iterable[str]) -> List[Subscription]:
+        """Entfernt alle Handler der angegebenen Module und gibt sie zurück (für `restore`)."""
+        owners = set(owners)
+        removed: List[Subscription] = []
+        with self._lock:
+            for event, current in list(self._handlers.items()):
+                keep = tuple(s for s in current if s.owner not in owners)
+                if len(keep) != len(current):
+                    removed.extend(s for s in current if s.owner in owners)
+                    self._set(event, keep)
+        return removed
+
+    def restore(self, subs: Iterable[Subscription]) -> None:
+        with self._lock:
+            for sub in subs:
+                self._handlers[sub.event] = self._handlers.get(sub.event, ()) + (sub,)
+
+    def owned_by(self, owner: str) -> bool:
+        return any(s.owner == owner for subs in self._handlers.values() for s in subs)
+
+    def subscriptions(self) -> Dict[str, Tuple[Subscription, ...]]:
+        return dict(self._handlers)
+
+    def _set(self, event: str, subs: Tuple[Subscription, ...]) -> None:
+        if subs:
+            self._handlers[event] = subs
+        else:
+            self._handlers.pop(event, None)
+
+    # --- Gateway -------------------------------------------------------------
+
+    def attach(self, gateway) -> None:
+        gateway.command(self._dispatch)
+
+    def _dispatch(self, resp) -> None:
+        raw = getattr(resp, 'raw', None)
+        if not isinstance(raw, dict):
+            return
+        flight_recorder.record("GATEWAY", "gateway", "%s op=%s s=%s", raw.get('t'), raw.get('op'), raw.get('s'))
+        subs = self._handlers.get(raw.get('t'))
+        if not subs:
+            return
+        self.dispatch(raw['t'], raw.get('d') or {})
+
+    def dispatch(self, event: str, data: Dict) -> int:
+        """Ruft die Handler für `event` auf. Gibt zurück, wie viele `data` angenommen haben."""
+        called = 0
+        for sub in self._handlers.get(event, ()):
+            try:
+                if sub.accept is not None and not sub.accept(data):
+                    continue
+                called += 1
+                sub.handler(data)
+            except Exception as e:
+                # Ein fehlerhafter Handler darf die übrigen und den Gateway-Thread nicht stören
+                self.logger.error('EventDispatcher.dispatch', "Handler %s für %s fehlgeschlagen: %s", sub.name, event, e, exc_info=True)
+        return called
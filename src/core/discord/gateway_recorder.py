@@ -0,0 +1,84 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\gateway_recorder.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import json
+import time
+import threading
+from typing import Dict, Iterator, Iterable, Optional
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+GATEWAY_RECORD_PATH   = getattr(settings, 'GATEWAY_RECORD_PATH', "")
+GATEWAY_RECORD_EVENTS = tuple(getattr(settings, 'GATEWAY_RECORD_EVENTS', ("MESSAGE_CREATE",)))
+
+
+class GatewayRecorder:
+    """
+    Schreibt eingehende Gateway-Events als JSON Lines mit, um sie später offline
+    wieder einzuspielen (siehe benchmarks/bench_gateway.py).
+    Jede Zeile: {"ts": Sekunden seit Aufnahmebeginn, "op": ..., "t": ..., "d": {...}}
+    """
+
+    def __init__(self, path: str = GATEWAY_RECORD_PATH, events: Iterable[str] = GATEWAY_RECORD_EVENTS):
+        self.path = path
+        self.events = frozenset(events) if events else None
+        self.count = 0
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._fp = open(path, "a", encoding="utf-8")
+        debug_logger.debug('GatewayRecorder.__init__', "Zeichne Gateway-Events nach %s auf", path)
+
+    def attach(self, gateway) -> None:
+        gateway.command(self.on_event)
+
+    def on_event(self, resp) -> None:
+        raw = getattr(resp, 'raw', None)
+        if not isinstance(raw, dict):
+            return
+        event = raw.get('t')
+        if self.events is not None and event not in self.events:
+            return
+        line = json.dumps(
+            {"ts": round(time.monotonic() - self._start, 6), "op": raw.get('op'), "t": event, "d": raw.get('d')},
+            ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        with self._lock:
+            if self._fp is None:
+                return
+            try:
+                self._fp.write(line + "\n")
+                self.count += 1
+            except (OSError, ValueError) as e:
+                debug_logger.error('GatewayRecorder.on_event', "Aufzeichnung fehlgeschlagen: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+        debug_logger.debug('GatewayRecorder.close', "%s Gateway-Events aufgezeichnet", self.count)
+
+
+def load_recording(path: str, events: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+    """Liest eine Aufnahme zeilenweise. Defekte Zeilen (z. B. nach Absturz) werden übersprungen."""
+    wanted = frozenset(events) if events else None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if wanted is None or record.get("t") in wanted:
+                yield record
@@ -2,6 +2,15 @@
 # \src\core\discord\message.py
 # \author @bastiix
 # ---------------------------------------------------------------------------
+from typing import Callable, List, Optional
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+MAX_CHUNK_SIZE = getattr(settings, 'MAX_CHUNK_SIZE', 2000)
+
  
 def boxed_message(title: str, body: str) -> str:
     lines = [title, "=" * len(title)] + body.split("\n")
@@ -128,3 +137,78 @@ def embed_like_message(title: str, description: str, footer: str | None = None)
     if footer:
         lines.append(f"*{footer}*")
     return "\n".join(lines)
+
+
+def _page_footer(page: int, total: int) -> str:
+    return f"Seite {page}/{total}"
+
+
+class MessageBuilder:
+    """
+    Baut einen Block im Stil von `boxed_message` Zeile für Zeile auf und zählt dabei die
+    gerenderte Länge mit. Passt eine Zeile nicht mehr in `limit`, beginnt eine neue Seite
+    mit demselben Kopf. `pages()` fügt die Seiten nur noch zusammen, nichts wird neu gerendert.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        language: str = "",
+        limit: int = MAX_CHUNK_SIZE,
+        footer: Callable[[int, int], str] = _page_footer,
+        footer_reserve: int = 32
+    ):
+        self.title = title
+        self.language = language
+        self.limit = limit
+        self.footer = footer
+        self._head = f"```{language}\n{title}\n{'=' * len(title)}\n"
+        self._tail = "```"
+        # Platz für Fußzeile ("\n" + Text) und schließendes ``` immer freihalten
+        self._room = limit - len(self._head) - len(self._tail) - (footer_reserve + 1)
+        if self._room < 16:
+            raise ValueError(f"limit={limit} ist zu klein für den Titel '{title}'")
+        self._pages: List[List[str]] = [[]]
+        self._size = 0
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def add_line(self, line: str = "") -> "MessageBuilder":
+        for part in line.split("\n"):
+            # Einzelne Zeilen, die länger als eine ganze Seite sind, hart teilen
+            while len(part) + 1 > self._room:
+                self._append(part[:self._room - 1])
+                part = part[self._room - 1:]
+            self._append(part)
+        return self
+
+    def add_lines(self, lines) -> "MessageBuilder":
+        for line in lines:
+            self.add_line(line)
+        return self
+
+    def _append(self, line: str) -> None:
+        needed = len(line) + 1
+        if self._size + needed > self._room and self._pages[-1]:
+            self._pages.append([])
+            self._size = 0
+        self._pages[-1].append(line)
+        self._size += needed
+
+    def pages(self) -> List[str]:
+        total = len(self._pages)
+        out = []
+        for number, lines in enumerate(self._pages, start=1):
+            body = "".join(line + "\n" for line in lines)
+            footer = self.footer(number, total) + "\n" if total > 1 and self.footer else ""
+            out.append(self._head + body + footer + self._tail)
+        return out
+
+    def render(self, page: int = 1) -> Optional[str]:
+        """Eine einzelne Seite (1-basiert) oder `None`, wenn es sie nicht gibt."""
+        pages = self.pages()
+        if 1 <= page <= len(pages):
+            return pages[page - 1]
+        return None
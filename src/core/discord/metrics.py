@@ -0,0 +1,363 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\metrics.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import time
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+METRICS_TEXTFILE_PATH = getattr(settings, 'METRICS_TEXTFILE_PATH', "")
+METRICS_DUMP_INTERVAL = getattr(settings, 'METRICS_DUMP_INTERVAL', 15)
+
+# Obergrenzen der Histogramm-Buckets in Sekunden (+Inf implizit)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+class Histogram:
+    """Festes Bucket-Histogramm: konstanter Speicher, `observe` ist ein bisect + zwei Additionen."""
+
+    __slots__ = ("bounds", "counts", "total", "count", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Schätzt das Quantil durch lineare Interpolation innerhalb des Buckets."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * max(0.0, rank - seen) / n
+            seen += n
+            if i < len(self.bounds):
+                lower = self.bounds[i]
+        return self.max
+
+    def cumulative(self) -> List[int]:
+        out, running = [], 0
+        for n in self.counts:
+            running += n
+            out.append(running)
+        return out
+
+
+class CommandStats:
+    __slots__ = ("calls", "errors", "timeouts", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.latency = Histogram()
+
+
+class RouteStats:
+    __slots__ = ("calls", "errors", "retries", "cached", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.cached = 0
+        self.latency = Histogram()
+
+
+class Metrics:
+    """
+    Zähler und Latenz-Histogramme pro Command und pro REST-Route sowie die Zeit vom
+    Eingang im Gateway bis zur gesendeten Antwort. Alle Methoden sind threadsafe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands: Dict[str, CommandStats] = {}
+        self.routes: Dict[str, RouteStats] = {}
+        self.reply_latency = Histogram()
+        self.rejected = 0
+        self.rate_limited = 0
+        self.coalesced = 0
+        self.throttled = 0
+        self.dropped = 0
+        self.started_at = time.time()
+
+    def _stats(self, name: str) -> CommandStats:
+        stats = self.commands.get(name)
+        if stats is None:
+            stats = self.commands.setdefault(name, CommandStats())
+        return stats
+
+    def observe_command(self, name: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            stats = self._stats(name)
+            stats.calls += 1
+            if error:
+                stats.errors += 1
+            stats.latency.observe(seconds)
+
+    def observe_route(self, route: str, seconds: float, error: bool = False, retry: bool = False) -> None:
+        """Ein HTTP-Versuch auf `route`. `retry`: wird wiederholt, `error`: endgültig fehlgeschlagen."""
+        with self._lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.calls += 1
+            if error:
+                stats.errors += 1
+            if retry:
+                stats.retries += 1
+            stats.latency.observe(seconds)
+
+    def observe_route_cached(self, route: str) -> None:
+        with self._lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.cached += 1
+
+    def observe_timeout(self, name: str) -> None:
+        with self._lock:
+            self._stats(name).timeouts += 1
+
+    def observe_reply(self, seconds: float) -> None:
+        with self._lock:
+            self.reply_latency.observe(seconds)
+
+    def observe_rejected(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def observe_throttled(self, dropped: bool) -> None:
+        with self._lock:
+            if dropped:
+                self.dropped += 1
+            else:
+                self.throttled += 1
+
+    def observe_rate_limit(self) -> None:
+        with self._lock:
+            self.rate_limited += 1
+
+    def observe_coalesced(self, merged: int) -> None:
+        with self._lock:
+            self.coalesced += merged
+
+    def reset(self) -> None:
+        with self._lock:
+            self.commands = {}
+            self.routes = {}
+            self.reply_latency = Histogram()
+            self.rejected = 0
+            self.rate_limited = 0
+            self.coalesced = 0
+            self.throttled = 0
+            self.dropped = 0
+            self.started_at = time.time()
+
+    # --- Ausgabe -------------------------------------------------------------
+
+    def format_table(self) -> str:
+        with self._lock:
+            rows = sorted(self.commands.items(), key=lambda item: item[1].calls, reverse=True)
+            lines = [f"{'Befehl':<16}{'Aufrufe':>8}{'Fehler':>7}{'p50':>9}{'p95':>9}{'p99':>9}"]
+            for name, s in rows:
+                h = s.latency
+                lines.append(
+                    f"{name[:15]:<16}{s.calls:>8}{s.errors + s.timeouts:>7}"
+                    f"{_ms(h.quantile(0.5)):>9}{_ms(h.quantile(0.95)):>9}{_ms(h.quantile(0.99)):>9}"
+                )
+            if not rows:
+                lines.append("Noch keine Befehle ausgeführt.")
+            r = self.reply_latency
+            lines.append("")
+            lines.append(
+                f"Gateway -> Antwort: n={r.count}  p50={_ms(r.quantile(0.5))}  "
+                f"p95={_ms(r.quantile(0.95))}  p99={_ms(r.quantile(0.99))}"
+            )
+            lines.append(f"Abgelehnt (Queue voll): {self.rejected}")
+            lines.append(f"Gedrosselt: {self.throttled}  Verworfen: {self.dropped}")
+            lines.append(f"Rate-Limits (429): {self.rate_limited}  Zusammengefasst: {self.coalesced}")
+            lines.append(f"Seit: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}")
+        return "\n".join(lines)
+
+    def format_routes(self) -> str:
+        with self._lock:
+            rows = sorted(self.routes.items(), key=lambda item: item[1].calls, reverse=True)
+            lines = [f"{'Route':<36}{'Req':>6}{'Fehler':>7}{'Retry':>6}{'Cache':>6}{'p50':>9}{'p95':>9}"]
+            for route, s in rows:
+                h = s.latency
+                lines.append(
+                    f"{_short_route(route):<36}{s.calls:>6}{s.errors:>7}{s.retries:>6}{s.cached:>6}"
+                    f"{_ms(h.quantile(0.5)):>9}{_ms(h.quantile(0.95)):>9}"
+                )
+            if not rows:
+                lines.append("Noch keine REST-Aufrufe.")
+        return "\n".join(lines)
+
+    def format_command(self, name: str) -> Optional[str]:
+        with self._lock:
+            s = self.commands.get(name)
+            if s is None:
+                return None
+            h = s.latency
+            lines = [
+                f"Aufrufe: {s.calls}  Fehler: {s.errors}  Timeouts: {s.timeouts}",
+                f"Mittel: {_ms(h.total / h.count if h.count else 0.0)}  Max: {_ms(h.max)}",
+                "",
+            ]
+            lower = 0.0
+            for i, n in enumerate(h.counts):
+                upper = h.bounds[i] if i < len(h.bounds) else None
+                if n:
+                    label = f"{_ms(lower)} - {_ms(upper)}" if upper is not None else f"> {_ms(lower)}"
+                    bar = "#" * max(1, round(20 * n / h.count))
+                    lines.append(f"{label:>20} {n:>7} {bar}")
+                if upper is not None:
+                    lower = upper
+        return "\n".join(lines)
+
+    def render_textfile(self, namespace: str = "selfbot") -> str:
+        """Prometheus-Textformat, wie es der Textfile-Collector des node_exporter erwartet."""
+        out: List[str] = []
+        with self._lock:
+            items = sorted(self.commands.items())
+            for metric, attr, text in (
+                ("command_calls_total", "calls", "Ausgeführte Befehle"),
+                ("command_errors_total", "errors", "Befehle mit Fehler"),
+                ("command_timeouts_total", "timeouts", "Befehle mit Zeitüberschreitung"),
+            ):
+                out.append(f"# HELP {namespace}_{metric} {text}")
+                out.append(f"# TYPE {namespace}_{metric} counter")
+                for name, s in items:
+                    out.append(f'{namespace}_{metric}{{command="{_label(name)}"}} {getattr(s, attr)}')
+            out.append(f"# HELP {namespace}_command_duration_seconds Laufzeit der Befehle")
+            out.append(f"# TYPE {namespace}_command_duration_seconds histogram")
+            for name, s in items:
+                _histogram_lines(out, f"{namespace}_command_duration_seconds", s.latency, f'command="{_label(name)}"')
+            routes = sorted(self.routes.items())
+            for metric, attr, text in (
+                ("rest_requests_total", "calls", "HTTP-Versuche pro REST-Route"),
+                ("rest_errors_total", "errors", "Endgültig fehlgeschlagene REST-Aufrufe"),
+                ("rest_retries_total", "retries", "Wiederholte REST-Versuche (429, 5xx, Timeout)"),
+                ("rest_cache_hits_total", "cached", "Aus dem GET-Cache beantwortete REST-Aufrufe"),
+            ):
+                out.append(f"# HELP {namespace}_{metric} {text}")
+                out.append(f"# TYPE {namespace}_{metric} counter")
+                for route, s in routes:
+                    out.append(f'{namespace}_{metric}{{route="{_label(route)}"}} {getattr(s, attr)}')
+            out.append(f"# HELP {namespace}_rest_duration_seconds Dauer der HTTP-Versuche pro REST-Route")
+            out.append(f"# TYPE {namespace}_rest_duration_seconds histogram")
+            for route, s in routes:
+                _histogram_lines(out, f"{namespace}_rest_duration_seconds", s.latency, f'route="{_label(route)}"')
+            out.append(f"# HELP {namespace}_reply_latency_seconds Zeit vom Gateway-Event bis zur gesendeten Antwort")
+            out.append(f"# TYPE {namespace}_reply_latency_seconds histogram")
+            _histogram_lines(out, f"{namespace}_reply_latency_seconds", self.reply_latency, "")
+            out.append(f"# HELP {namespace}_rejected_total Wegen voller Queue abgelehnte Befehle")
+            out.append(f"# TYPE {namespace}_rejected_total counter")
+            out.append(f"{namespace}_rejected_total {self.rejected}")
+            out.append(f"# HELP {namespace}_throttled_total Wegen Befehls-Limit abgelehnte Aufrufe")
+            out.append(f"# TYPE {namespace}_throttled_total counter")
+            out.append(f'{namespace}_throttled_total{{action="reply"}} {self.throttled}')
+            out.append(f'{namespace}_throttled_total{{action="drop"}} {self.dropped}')
+            out.append(f"# HELP {namespace}_rate_limited_total Vom Server mit 429 beantwortete Sendeversuche")
+            out.append(f"# TYPE {namespace}_rate_limited_total counter")
+            out.append(f"{namespace}_rate_limited_total {self.rate_limited}")
+            out.append(f"# HELP {namespace}_coalesced_total In eine vorherige Nachricht zusammengefasste Antworten")
+            out.append(f"# TYPE {namespace}_coalesced_total counter")
+            out.append(f"{namespace}_coalesced_total {self.coalesced}")
+        return "\n".join(out) + "\n"
+
+    def dump_textfile(self, path: str) -> None:
+        # Über eine temporäre Datei schreiben, damit der Collector nie eine halbe Datei liest
+        tmp = f"{path}.{os.getpid()}.tmp"
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render_textfile())
+        os.replace(tmp, path)
+
+    def start_textfile_dump(
+        self,
+        scheduler,
+        path: str = METRICS_TEXTFILE_PATH,
+        interval: float = METRICS_DUMP_INTERVAL
+    ):
+        """Plant den Export als Job im übergebenen Scheduler (`CommandTree.scheduler`)."""
+        if not path or not interval or interval <= 0:
+            return None
+
+        def _dump():
+            try:
+                self.dump_textfile(path)
+            except OSError as e:
+                debug_logger.error('metrics_dump', "Metrik-Export fehlgeschlagen: %s", e)
+
+        debug_logger.debug('metrics_dump', "Metrik-Export nach %s alle %ss", path, interval)
+        return scheduler.every(interval, _dump, name="metrics-dump")
+
+
+def _ms(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    ms = seconds * 1000.0
+    if ms >= 1000:
+        return f"{ms / 1000:.2f}s"
+    return f"{ms:.1f}ms" if ms < 100 else f"{ms:.0f}ms"
+
+
+def _short_route(route: str) -> str:
+    # "GET /channels/{channel_id}/messages" -> "GET /channels/{}/messages"
+    out, depth = [], 0
+    for ch in route:
+        if ch == "{":
+            depth += 1
+            if depth == 1:
+                out.append("{}")
+        elif ch == "}":
+            depth = max(0, depth - 1)
+        elif not depth:
+            out.append(ch)
+    short = "".join(out)
+    return short if len(short) <= 35 else short[:34] + "…"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _histogram_lines(out: List[str], name: str, h: Histogram, labels: str) -> None:
+    sep = "," if labels else ""
+    cumulative = h.cumulative()
+    for bound, count in zip(h.bounds, cumulative):
+        out.append(f'{name}_bucket{{{labels}{sep}le="{bound:g}"}} {count}')
+    out.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {h.count}')
+    suffix = f"{{{labels}}}" if labels else ""
+    out.append(f"{name}_sum{suffix} {h.total:.6f}")
+    out.append(f"{name}_count{suffix} {h.count}")
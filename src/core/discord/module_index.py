@@ -0,0 +1,167 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\module_index.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import json
+import hashlib
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+# 2: Pfade relativ zum Projektverzeichnis statt absolut
+INDEX_VERSION = 2
+MODULE_INDEX_PATH = getattr(settings, 'MODULE_INDEX_PATH', None) or os.path.join(
+    os.getcwd(), "cache", "module_index.json"
+)
+# Projektverzeichnis (enthält src/); Bezugspunkt für die Pfade im Index
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _is_inactive(mod_name: str) -> bool:
+    return ".inaktiv." in mod_name or mod_name.endswith(".inaktiv")
+
+
+def scan_modules(package_name: str) -> List[Tuple[str, str]]:
+    """
+    Liefert (Modulname, Dateipfad) aller Module unterhalb von `package_name`,
+    ohne sie zu importieren. Entspricht der Reihenfolge von `pkgutil.walk_packages`.
+    """
+    pkg = importlib.import_module(package_name)
+    found: List[Tuple[str, str]] = []
+
+    def _walk(path: str, prefix: str) -> None:
+        try:
+            entries = sorted(os.listdir(path))
+        except OSError:
+            return
+        for entry in entries:
+            full = os.path.join(path, entry)
+            if os.path.isdir(full):
+                if entry == "__pycache__" or not entry.isidentifier():
+                    continue
+                init = os.path.join(full, "__init__.py")
+                if not os.path.isfile(init):
+                    continue
+                name = prefix + entry
+                found.append((name, init))
+                if not _is_inactive(name):
+                    _walk(full, name + ".")
+            elif entry.endswith(".py") and entry != "__init__.py":
+                stem = entry[:-3]
+                if stem.isidentifier():
+                    found.append((prefix + stem, full))
+
+    for base in pkg.__path__:
+        _walk(base, package_name + ".")
+    return [(n, p) for n, p in found if not _is_inactive(n)]
+
+
+def _relative(path: str) -> str:
+    # Mit "/" auch unter Windows, damit der Index beim Verschieben oder neu Klonen gültig bleibt
+    return os.path.relpath(os.path.abspath(path), _ROOT).replace(os.sep, "/")
+
+
+def _file_hash(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ModuleIndex:
+    """
+    On-Disk-Index aller Module mit ihren Command-Namen und Hilfetexten.
+    Ein Eintrag gilt als aktuell, solange mtime/Größe der Datei übereinstimmen
+    oder - bei abweichender mtime - der Inhalts-Hash gleich geblieben ist.
+    """
+
+    def __init__(self, path: str = MODULE_INDEX_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            debug_logger.debug('ModuleIndex._load', "Kein Modul-Index unter %s, wird neu aufgebaut", self.path)
+            return
+        except (OSError, ValueError) as e:
+            debug_logger.warning('ModuleIndex._load', "Modul-Index unlesbar, wird neu aufgebaut: %s", e)
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            debug_logger.debug('ModuleIndex._load', "Modul-Index hat veraltete Version, wird neu aufgebaut")
+            return
+        self.entries = data.get("modules", {})
+
+    def lookup(self, mod_name: str, path: str) -> Optional[Dict]:
+        entry = self.entries.get(mod_name)
+        if not entry or entry.get("file") != _relative(path):
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry
+        if entry.get("size") != st.st_size:
+            return None
+        # mtime geändert (z. B. checkout/touch), Inhalt evtl. gleich
+        try:
+            digest = _file_hash(path)
+        except OSError:
+            return None
+        if digest != entry.get("hash"):
+            return None
+        entry["mtime_ns"] = st.st_mtime_ns
+        self._dirty = True
+        return entry
+
+    def store(self, mod_name: str, path: str, has_setup: bool, lazy: bool, commands: List[Dict]) -> None:
+        try:
+            st = os.stat(path)
+            digest = _file_hash(path)
+        except OSError as e:
+            debug_logger.warning('ModuleIndex.store', "Konnte %s nicht indizieren: %s", path, e)
+            return
+        self.entries[mod_name] = {
+            "file": _relative(path),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": digest,
+            "has_setup": has_setup,
+            "lazy": lazy,
+            "commands": commands,
+        }
+        self._dirty = True
+
+    def prune(self, known: List[str]) -> None:
+        keep = set(known)
+        for name in list(self.entries):
+            if name not in keep:
+                del self.entries[name]
+                self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "modules": self.entries}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self._dirty = False
+            debug_logger.debug('ModuleIndex.save', "Modul-Index gespeichert (%s Module)", len(self.entries))
+        except OSError as e:
+            debug_logger.warning('ModuleIndex.save', "Modul-Index konnte nicht gespeichert werden: %s", e)
@@ -0,0 +1,316 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\outbound.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.discord.ratelimit import RateLimitTracker
+from src.core.discord.attachment import ATTACHMENT_MAX_SIZE, FileResponse, upload
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+MAX_CHUNK_SIZE        = getattr(settings, 'MAX_CHUNK_SIZE', 2000)
+OUTBOUND_WORKERS      = getattr(settings, 'OUTBOUND_WORKERS', 2)
+OUTBOUND_MAX_RETRIES  = getattr(settings, 'OUTBOUND_MAX_RETRIES', 5)
+OUTBOUND_COALESCE     = getattr(settings, 'OUTBOUND_COALESCE', True)
+
+MESSAGE_ROUTE = "POST /channels/{channel_id}/messages"
+TYPING_ROUTE  = "POST /channels/{channel_id}/typing"
+
+
+class OutboundError(Exception):
+    """Nachricht endgültig nicht zustellbar (z. B. 403, 400 oder Retries erschöpft)."""
+
+    def __init__(self, message: str, status: Optional[int] = None, body=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class _Outgoing:
+    __slots__ = ("channel", "text", "reply_to", "typing", "attachment", "future")
+
+    def __init__(
+        self, channel: str, text: str, reply_to: Optional[str], typing: bool, attachment: Optional[FileResponse] = None
+    ):
+        self.channel = channel
+        self.text = text
+        self.reply_to = reply_to
+        self.typing = typing
+        self.attachment = attachment
+        self.future: Future = Future()
+
+
+class OutboundQueue:
+    """
+    Eine Sende-Queue pro Channel. Nachrichten eines Channels gehen strikt der Reihe nach
+    raus, verschiedene Channels parallel. Vor jedem Request wird das Rate-Limit des Buckets
+    geprüft. Bei 429 wird genau `retry_after` gewartet und erneut gesendet, nichts wird verworfen.
+    Kurze Nachrichten, die sich in der Queue eines Channels angestaut haben, werden zu einer
+    zusammengefasst, solange sie in `limit` Zeichen passen. Die zusammengefasste Nachricht
+    antwortet auf die erste Reply im Batch.
+    """
+
+    def __init__(
+        self,
+        bot,
+        metrics=None,
+        workers: int = OUTBOUND_WORKERS,
+        max_retries: int = OUTBOUND_MAX_RETRIES,
+        coalesce: bool = OUTBOUND_COALESCE,
+        limit: int = MAX_CHUNK_SIZE,
+        logger=None,
+        tracker: Optional[RateLimitTracker] = None,
+        max_attachment_size: int = ATTACHMENT_MAX_SIZE
+    ):
+        self.bot = bot
+        self.metrics = metrics
+        self.max_retries = max(0, int(max_retries))
+        self.coalesce = coalesce
+        self.limit = limit
+        self.max_attachment_size = max_attachment_size
+        self.logger = logger or debug_logger
+        # Mit der REST-Fassade geteilt, damit beide dieselben Buckets sehen
+        self.tracker = tracker or RateLimitTracker()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix='outbound')
+        self._lock = threading.Condition()
+        # Channel-ID -> wartende Nachrichten. Ein vorhandener Key bedeutet: Channel wird gerade abgearbeitet.
+        self._channels: Dict[str, Deque[_Outgoing]] = {}
+        self._depth = 0
+        self._closed = False
+        self._stop = threading.Event()
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    # --- API -----------------------------------------------------------------
+
+    def send(self, channel: str, text: str, reply_to: Optional[str] = None, typing: bool = False) -> Future:
+        """Reiht eine Nachricht ein. Das Future liefert die Antwort von Discord oder `OutboundError`."""
+        return self._enqueue(_Outgoing(str(channel), text, reply_to, typing))
+
+    def send_file(
+        self, channel: str, attachment: FileResponse, reply_to: Optional[str] = None, typing: bool = True
+    ) -> Future:
+        """
+        Reiht eine Nachricht mit Dateianhang ein (`attachment.content` als Text). Der Anhang wird
+        nie mit anderen Nachrichten zusammengefasst und nach dem Senden geschlossen.
+        """
+        item = _Outgoing(str(channel), attachment.content or "", reply_to, typing, attachment)
+        size = attachment.size
+        if self.max_attachment_size and size > self.max_attachment_size:
+            attachment.close()
+            item.future.set_exception(OutboundError(
+                f"Anhang {attachment.filename} ist zu groß ({size} Byte, erlaubt {self.max_attachment_size})"
+            ))
+            return item.future
+        return self._enqueue(item)
+
+    def _enqueue(self, item: _Outgoing) -> Future:
+        with self._lock:
+            if self._closed:
+                if item.attachment is not None:
+                    item.attachment.close()
+                item.future.set_exception(OutboundError("Sende-Queue ist geschlossen"))
+                return item.future
+            self._depth += 1
+            pending = self._channels.get(item.channel)
+            if pending is not None:
+                pending.append(item)
+                return item.future
+            self._channels[item.channel] = deque((item,))
+        self._schedule(item.channel)
+        return item.future
+
+    def reply(self, channel: str, message_id: str, text: str, typing: bool = True) -> Future:
+        return self.send(channel, text, reply_to=message_id, typing=typing)
+
+    def typing(self, channel: str) -> bool:
+        """
+        Löst den Tipp-Indikator aus, sofern dessen Bucket gerade frei ist. Rein kosmetisch:
+        wird bei Rate-Limit oder Fehler übersprungen statt zu warten.
+        """
+        channel = str(channel)
+        if self.tracker.acquire(TYPING_ROUTE, channel) > 0:
+            return False
+        try:
+            resp = self.bot.typingAction(channel)
+        except Exception as e:
+            self.logger.debug('OutboundQueue.typing', "Typing-Event fehlgeschlagen: %s", e)
+            return False
+        status = getattr(resp, 'status_code', 204)
+        self.tracker.update(TYPING_ROUTE, channel, status, getattr(resp, 'headers', None), _body(resp, status))
+        return status < 400
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Nimmt nichts Neues mehr an und wartet höchstens `timeout` Sekunden, bis alles gesendet ist."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._lock:
+            self._closed = True
+            while self._depth > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.logger.warning('OutboundQueue.shutdown', "%s Nachrichten nicht mehr gesendet", self._depth)
+                    break
+                self._lock.wait(remaining)
+        self._stop.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Abgebrochene _drain-Aufträge lassen ihre Nachrichten liegen: Futures auflösen und Anhänge (Temp-Dateien) löschen
+        with self._lock:
+            channels = list(self._channels)
+        for channel in channels:
+            self._fail_all(channel, OutboundError("Sende-Queue wurde beendet"))
+        self.logger.debug('OutboundQueue.shutdown', "Sende-Queue beendet")
+
+    # --- Abarbeitung ---------------------------------------------------------
+
+    def _schedule(self, channel: str) -> None:
+        try:
+            self.executor.submit(self._drain, channel)
+        except RuntimeError as e:
+            # Executor wurde bereits heruntergefahren
+            self.logger.error('OutboundQueue._schedule', "Channel %s kann nicht abgearbeitet werden: %s", channel, e)
+            self._fail_all(channel, OutboundError("Sende-Queue ist geschlossen"))
+
+    def _drain(self, channel: str) -> None:
+        while True:
+            # Erst auf das Rate-Limit warten, dann den Batch bilden: so werden auch
+            # Nachrichten zusammengefasst, die während der Wartezeit eingetroffen sind.
+            self._wait_for(MESSAGE_ROUTE, channel, reserve=False)
+            with self._lock:
+                pending = self._channels.get(channel)
+                if not pending:
+                    self._channels.pop(channel, None)
+                    return
+                batch = self._take_batch(pending)
+            self._deliver(channel, batch)
+            with self._lock:
+                self._depth -= len(batch)
+                self._lock.notify_all()
+
+    def _take_batch(self, pending: Deque[_Outgoing]) -> List[_Outgoing]:
+        first = pending.popleft()
+        batch = [first]
+        if not self.coalesce or first.attachment is not None:
+            return batch
+        size = len(first.text)
+        while pending:
+            nxt = pending[0]
+            if not nxt.text or nxt.attachment is not None or size + 1 + len(nxt.text) > self.limit:
+                break
+            # Eine Nachricht antwortet auf höchstens eine andere: Antworten an verschiedene Nachrichten nie mischen
+            if nxt.reply_to is not None and nxt.reply_to != first.reply_to:
+                break
+            batch.append(pending.popleft())
+            size += 1 + len(nxt.text)
+        return batch
+
+    def _deliver(self, channel: str, batch: List[_Outgoing]) -> None:
+        text = "\n".join(item.text for item in batch)
+        # _take_batch fasst nur Einträge ohne oder mit demselben reply_to wie der erste zusammen
+        reply_to = batch[0].reply_to
+        if len(batch) > 1:
+            self.logger.debug('OutboundQueue._deliver', "%s Nachrichten für channel=%s zusammengefasst", len(batch), channel)
+            if self.metrics is not None:
+                self.metrics.observe_coalesced(len(batch) - 1)
+        if any(item.typing for item in batch):
+            self.typing(channel)
+        attachment = batch[0].attachment
+        try:
+            resp = self._request(channel, reply_to, text, attachment)
+        except Exception as e:
+            self.logger.error('OutboundQueue._deliver', "Nachricht an channel=%s verworfen: %s", channel, e)
+            for item in batch:
+                item.future.set_exception(e)
+            return
+        finally:
+            if attachment is not None:
+                attachment.close()
+        for item in batch:
+            item.future.set_result(resp)
+
+    def _request(self, channel: str, reply_to: Optional[str], text: str, attachment: Optional[FileResponse] = None):
+        failures = 0
+        while True:
+            self._wait_for(MESSAGE_ROUTE, channel, reserve=True)
+            if self._stop.is_set():
+                raise OutboundError("Sende-Queue wurde beendet")
+            try:
+                if attachment is not None:
+                    # Jeder Versuch liest die Datei neu, es liegt nie der ganze Anhang im Speicher
+                    resp = upload(self.bot, channel, attachment, text, reply_to)
+                elif reply_to is not None:
+                    resp = self.bot.reply(channel, reply_to, text)
+                else:
+                    resp = self.bot.sendMessage(channel, text)
+            except Exception as e:
+                # Netzwerkfehler o. Ä.: vorübergehend, mit Backoff erneut versuchen
+                failures += 1
+                if failures > self.max_retries:
+                    raise OutboundError(f"Senden nach {failures} Versuchen fehlgeschlagen: {e}") from e
+                self._backoff(failures, e)
+                continue
+
+            status = getattr(resp, 'status_code', 200)
+            body = _body(resp, status)
+            retry_after = self.tracker.update(MESSAGE_ROUTE, channel, status, getattr(resp, 'headers', None), body)
+            if retry_after is not None:
+                self.logger.warning(
+                    'OutboundQueue._request', "Rate-Limit für channel=%s, warte %.2fs", channel, retry_after
+                )
+                if self.metrics is not None:
+                    self.metrics.observe_rate_limit()
+                continue
+            if status >= 500:
+                failures += 1
+                if failures > self.max_retries:
+                    raise OutboundError(f"Discord antwortet mit {status}", status, body)
+                self._backoff(failures, status)
+                continue
+            if status >= 400:
+                raise OutboundError(f"Discord lehnt die Nachricht ab ({status}): {body}", status, body)
+            return resp
+
+    def _wait_for(self, route: str, channel: str, reserve: bool) -> None:
+        while not self._stop.is_set():
+            wait = self.tracker.acquire(route, channel) if reserve else self.tracker.delay(route, channel)
+            if wait <= 0:
+                return
+            self._stop.wait(wait)
+
+    def _backoff(self, failures: int, reason) -> None:
+        delay = min(30.0, 0.5 * 2 ** (failures - 1))
+        self.logger.warning(
+            'OutboundQueue._request', "Senden fehlgeschlagen (%s), Versuch %s/%s in %.1fs",
+            reason, failures, self.max_retries, delay
+        )
+        self._stop.wait(delay)
+
+    def _fail_all(self, channel: str, error: Exception) -> None:
+        with self._lock:
+            pending = self._channels.pop(channel, None) or ()
+            self._depth -= len(pending)
+            self._lock.notify_all()
+        for item in pending:
+            if item.attachment is not None:
+                item.attachment.close()
+            item.future.set_exception(error)
+
+
+def _body(resp, status: int):
+    # Der Body wird nur für Fehler gebraucht (retry_after, global, Fehlermeldung)
+    if status < 400:
+        return None
+    try:
+        return resp.json()
+    except Exception:
+        return None
@@ -0,0 +1,374 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\process_pool.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import sys
+import time
+import atexit
+import pickle
+import itertools
+import threading
+import subprocess
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.discord.process_worker import QUIET_ENV, read_message, write_message
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+PROCESS_POOL_SIZE      = getattr(settings, 'PROCESS_POOL_SIZE', 2)
+PROCESS_POOL_MAX_TASKS = getattr(settings, 'PROCESS_POOL_MAX_TASKS', 100)
+
+# Projektwurzel, damit `src.*` und `settings` im Kindprozess importierbar sind
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+_WORKER_MODULE = "src.core.discord.process_worker"
+# Intervall, in dem ein wartender Aufruf Abbruch und Deadline prüft
+_POLL = 0.05
+
+
+class ProcessPoolError(Exception):
+    """Basis für Fehler bei der Ausführung im Prozess-Pool."""
+
+
+class ProcessTimeout(ProcessPoolError):
+    """Zeit überschritten oder abgebrochen; der Prozess wurde beendet."""
+
+
+class WorkerCrashed(ProcessPoolError):
+    """Der Prozess ist während des Auftrags abgestürzt (z. B. Segfault, Speicher)."""
+
+
+class ProcessTaskError(ProcessPoolError):
+    """Der Callback hat im Prozess eine Exception geworfen."""
+
+    def __init__(self, message: str, remote_type: str, remote_traceback: str):
+        super().__init__(message)
+        self.remote_type = remote_type
+        self.remote_traceback = remote_traceback
+
+
+class _Task:
+    __slots__ = ("id", "event", "result", "error")
+
+    def __init__(self, task_id: int):
+        self.id = task_id
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _Worker:
+    __slots__ = ("proc", "generation", "tasks", "task", "retired", "_write_lock")
+
+    def __init__(self, proc: subprocess.Popen, generation: int):
+        self.proc = proc
+        self.generation = generation
+        self.tasks = 0
+        self.task: Optional[_Task] = None
+        self.retired = False
+        self._write_lock = threading.Lock()
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    def send(self, payload: bytes) -> None:
+        with self._write_lock:
+            write_message(self.proc.stdin, payload)
+
+
+class ProcessPool:
+    """
+    Feste Anzahl Python-Prozesse für CPU-lastige Commands (PDF, Bilder, Reports).
+
+    Jeder Auftrag läuft in einem eigenen Interpreter und damit ohne GIL-Konkurrenz
+    zu Gateway, Dispatcher und Sende-Queue. Argumente werden im aufrufenden
+    Worker-Thread gepickelt, Ergebnisse im Lese-Thread des Prozesses entpickelt.
+    Überschreitet ein Auftrag sein Timeout oder wird er abgebrochen, wird genau
+    sein Prozess beendet und ersetzt. Stürzt ein Prozess ab, scheitert nur dieser
+    Auftrag. Nach `max_tasks` Aufträgen wird ein Prozess durch einen frischen ersetzt.
+    """
+
+    def __init__(self, size: int = PROCESS_POOL_SIZE, max_tasks: int = PROCESS_POOL_MAX_TASKS, logger=None):
+        self.size = max(0, int(size or 0))
+        self.max_tasks = max(0, int(max_tasks or 0))
+        self.logger = logger or debug_logger
+        self._cond = threading.Condition()
+        self._idle: Deque[_Worker] = deque()
+        self._workers: Set[_Worker] = set()
+        self._preload: Set[str] = set()
+        self._generation = 0
+        self._ids = itertools.count(1)
+        self._started = False
+        self._closed = False
+        self.completed = 0
+        self.crashed = 0
+        self.killed = 0
+        self.recycled = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size, "alive": len(self._workers), "idle": len(self._idle),
+                "completed": self.completed, "crashed": self.crashed, "killed": self.killed, "recycled": self.recycled,
+            }
+
+    # --- Lebenszyklus --------------------------------------------------------
+
+    def preload(self, modules: Iterable[str]) -> None:
+        """Module, die neue Prozesse vorab importieren (die Module der CPU-Commands)."""
+        with self._cond:
+            self._preload.update(modules)
+
+    def start(self, preload: Iterable[str] = ()) -> None:
+        """Startet die Prozesse. Kehrt sofort zurück, die Imports laufen in den Prozessen."""
+        self.preload(preload)
+        with self._cond:
+            if self._started or self._closed or not self.enabled:
+                return
+            self._started = True
+            missing = self.size - len(self._workers)
+        for _ in range(missing):
+            self._spawn()
+        atexit.register(self.shutdown)
+        self.logger.debug('ProcessPool.start', "Prozess-Pool gestartet: %s Prozesse, Recycling nach %s Aufträgen", self.size, self.max_tasks or "-")
+
+    def recycle(self) -> None:
+        """Ersetzt alle Prozesse, z. B. nach `$reload`, damit neuer Modul-Code geladen wird."""
+        with self._cond:
+            if not self._started:
+                return
+            self._generation += 1
+            idle = list(self._idle)
+            self._idle.clear()
+        for worker in idle:
+            self._retire(worker, replace=True)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            self._idle.clear()
+            self._cond.notify_all()
+        for worker in workers:
+            worker.retired = True
+            try:
+                worker.proc.stdin.close()
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            try:
+                worker.proc.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                worker.proc.kill()
+        self.logger.debug('ProcessPool.shutdown', "Prozess-Pool beendet")
+
+    # --- Ausführung ----------------------------------------------------------
+
+    def run(
+        self,
+        func: Callable,
+        ctx: Dict,
+        args: List[str],
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None
+    ):
+        """
+        Führt `func(ctx, args)` in einem Prozess aus und blockiert bis zum Ergebnis.
+        `func` muss eine Funktion auf Modulebene sein. Aus `ctx` werden nur einfache
+        Werte übertragen (IDs, Namen, Trace-ID).
+        """
+        if not self._started:
+            self.start()
+        try:
+            func_payload = pickle.dumps(func, protocol=pickle.HIGHEST_PROTOCOL)
+            task = _Task(next(self._ids))
+            payload = pickle.dumps(("run", task.id, func_payload, _plain(ctx), list(args)), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise ProcessPoolError(f"Auftrag nicht übertragbar: {e}") from e
+
+        deadline = time.monotonic() + timeout if timeout else None
+        worker = self._acquire(deadline, cancel_event)
+        worker.task = task
+        try:
+            worker.send(payload)
+        except (OSError, ValueError):
+            # Prozess ist zwischen Auswahl und Senden gestorben; der Lese-Thread meldet den Absturz
+            pass
+
+        while not task.event.wait(_POLL):
+            expired = deadline is not None and time.monotonic() >= deadline
+            if expired or (cancel_event is not None and cancel_event.is_set()):
+                if task.event.is_set():
+                    break
+                self._kill(worker, "Zeitüberschreitung" if expired else "abgebrochen")
+                raise ProcessTimeout(
+                    f"Prozess {worker.pid} nach {timeout:g}s beendet" if expired else f"Prozess {worker.pid} abgebrochen"
+                )
+
+        if isinstance(task.error, WorkerCrashed):
+            raise task.error
+        # Eine Exception im Callback lässt den Prozess intakt, er geht zurück in den Pool
+        self._release(worker)
+        if task.error is not None:
+            raise task.error
+        return task.result
+
+    def _acquire(self, deadline: Optional[float], cancel_event: Optional[threading.Event]) -> _Worker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ProcessPoolError("Prozess-Pool ist beendet")
+                if not self._workers:
+                    raise ProcessPoolError("Kein Prozess verfügbar (Start fehlgeschlagen)")
+                while self._idle:
+                    worker = self._idle.popleft()
+                    if worker.proc.poll() is None and not worker.retired:
+                        return worker
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ProcessTimeout("Abgebrochen, bevor ein Prozess frei wurde")
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ProcessTimeout("Kein Prozess rechtzeitig frei geworden")
+                self._cond.wait(_POLL)
+
+    def _release(self, worker: _Worker) -> None:
+        worker.task = None
+        worker.tasks += 1
+        with self._cond:
+            self.completed += 1
+            stale = worker.generation != self._generation
+            exhausted = self.max_tasks and worker.tasks >= self.max_tasks
+            if not (stale or exhausted or self._closed):
+                self._idle.append(worker)
+                self._cond.notify()
+                return
+        self._retire(worker, replace=True)
+
+    # --- Prozesse ------------------------------------------------------------
+
+    def _spawn(self) -> Optional[_Worker]:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = _ROOT + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+        # Kein eigenes Debug-Log pro Prozess; Fehler kommen als Antwort zurück, print geht auf stderr
+        env[QUIET_ENV] = "1"
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-m", _WORKER_MODULE],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=os.getcwd(), env=env
+            )
+        except OSError as e:
+            self.logger.error('ProcessPool._spawn', "Prozess konnte nicht gestartet werden: %s", e)
+            return None
+        with self._cond:
+            worker = _Worker(proc, self._generation)
+            preload = sorted(self._preload)
+            self._workers.add(worker)
+        if preload:
+            try:
+                worker.send(pickle.dumps(("warm", preload), protocol=pickle.HIGHEST_PROTOCOL))
+            except OSError:
+                pass
+        threading.Thread(target=self._read, args=(worker,), name=f'process-pool-{proc.pid}', daemon=True).start()
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+        self.logger.debug('ProcessPool._spawn', "Prozess %s gestartet", proc.pid)
+        return worker
+
+    def _read(self, worker: _Worker) -> None:
+        """Lese-Thread pro Prozess: entpickelt Ergebnisse und erkennt Abstürze (EOF)."""
+        stream = worker.proc.stdout
+        while True:
+            try:
+                msg = read_message(stream)
+            except Exception as e:
+                self.logger.error('ProcessPool._read', "Antwort von Prozess %s nicht lesbar: %s", worker.pid, e)
+                msg = None
+            if msg is None:
+                break
+            task = worker.task
+            if task is None or msg[1] != task.id:
+                continue
+            if msg[0] == "error":
+                _, _, remote_type, message, remote_tb = msg
+                task.error = ProcessTaskError(f"{remote_type}: {message}", remote_type, remote_tb)
+                self.logger.debug('ProcessPool._read', "Auftrag %s in Prozess %s fehlgeschlagen:\n%s", task.id, worker.pid, remote_tb)
+            else:
+                task.result = msg[2]
+            task.event.set()
+
+        try:
+            code = worker.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            worker.proc.kill()
+            code = worker.proc.wait()
+        task = worker.task
+        if worker.retired:
+            return
+        # Unerwartetes Ende: nur der laufende Auftrag scheitert, der Prozess wird ersetzt
+        worker.retired = True
+        with self._cond:
+            self.crashed += 1
+        self.logger.error('ProcessPool._read', "Prozess %s unerwartet beendet (Exit-Code %s)", worker.pid, code)
+        if task is not None and not task.event.is_set():
+            task.error = WorkerCrashed(f"Prozess {worker.pid} abgestürzt (Exit-Code {code})")
+            task.event.set()
+        self._remove(worker, replace=True)
+
+    def _kill(self, worker: _Worker, reason: str) -> None:
+        worker.retired = True
+        with self._cond:
+            self.killed += 1
+        self.logger.warning('ProcessPool._kill', "Beende Prozess %s (%s)", worker.pid, reason)
+        try:
+            worker.proc.kill()
+        except OSError:
+            pass
+        self._remove(worker, replace=True)
+
+    def _retire(self, worker: _Worker, replace: bool) -> None:
+        worker.retired = True
+        with self._cond:
+            self.recycled += 1
+        try:
+            worker.proc.stdin.close()
+        except OSError:
+            pass
+        self._remove(worker, replace)
+
+    def _remove(self, worker: _Worker, replace: bool) -> None:
+        with self._cond:
+            if worker not in self._workers:
+                return
+            self._workers.discard(worker)
+            try:
+                self._idle.remove(worker)
+            except ValueError:
+                pass
+            replace = replace and not self._closed and len(self._workers) < self.size
+        if replace:
+            self._spawn()
+
+
+def _plain(ctx: Dict) -> Dict:
+    # cancel_event, state, rest usw. leben nur im Hauptprozess
+    return {k: v for k, v in ctx.items() if isinstance(v, (str, int, float, bool)) or v is None}
+
+
+pool = ProcessPool()
@@ -0,0 +1,100 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\process_worker.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+"""
+Kindprozess des `ProcessPool` (`python -m src.core.discord.process_worker`).
+
+Liest Aufträge als längenpräfixierte Pickles von stdin und schreibt die Ergebnisse
+auf den ursprünglichen stdout. `print` im Callback landet auf stderr, damit das
+Protokoll nicht gestört wird. Nur stdlib-Imports: der Prozess soll schnell bereit sein.
+"""
+import os
+import sys
+import pickle
+import struct
+import importlib
+import traceback
+
+_HEADER = struct.Struct(">I")
+# Von ProcessPool._spawn gesetzt: Logger im Kind still schalten
+QUIET_ENV = "SELFBOT_PROCESS_WORKER"
+
+
+def read_message(stream):
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (size,) = _HEADER.unpack(header)
+    payload = stream.read(size)
+    if len(payload) < size:
+        return None
+    return pickle.loads(payload)
+
+
+def write_message(stream, payload: bytes) -> None:
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _run(func_payload: bytes, ctx, args):
+    # Erst hier entpickeln: ein fehlendes Modul wird so zur Fehlerantwort statt zum Absturz
+    func = pickle.loads(func_payload)
+    result = func(ctx, args)
+    if result is not None and not isinstance(result, (str, bytes)) and hasattr(result, "__iter__"):
+        # Generatoren lassen sich nicht übertragen: im Prozess vollständig erzeugen
+        result = list(result)
+    return result or ""
+
+
+def _quiet_logging() -> None:
+    # Vor jedem Modul-Import: debug_animation legt beim Import einen DebugConsole an, der sonst
+    # pro Prozess (und nach jedem Recycle) eine eigene Datei unter log/debug/ öffnet
+    try:
+        import settings
+    except ImportError:
+        return
+    settings.LOGGING = False
+    settings.DEBUG = False
+    settings.LOG_STRUCTURED = False
+
+
+def main() -> None:
+    if os.environ.get(QUIET_ENV):
+        _quiet_logging()
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    inp = sys.stdin.buffer
+    while True:
+        try:
+            msg = read_message(inp)
+        except Exception as e:
+            # Auftrag nicht lesbar (z. B. Modul des Callbacks fehlt): Prozess ist danach nicht mehr synchron
+            sys.stderr.write(f"process_worker: Auftrag nicht lesbar: {e}\n")
+            return
+        if msg is None:
+            return
+        kind = msg[0]
+        if kind == "warm":
+            for name in msg[1]:
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    sys.stderr.write(f"process_worker: {name} nicht importierbar: {e}\n")
+            continue
+        if kind != "run":
+            continue
+        _, task_id, func_payload, ctx, args = msg
+        try:
+            reply = ("ok", task_id, _run(func_payload, ctx, args))
+            payload = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException as e:
+            if isinstance(e, (KeyboardInterrupt, SystemExit)):
+                raise
+            reply = ("error", task_id, type(e).__name__, str(e), traceback.format_exc())
+            payload = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        write_message(out, payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\ratelimit.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import time
+import threading
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class _Bucket:
+    __slots__ = ("limit", "remaining", "reset_at")
+
+    def __init__(self):
+        self.limit = 0
+        self.remaining = 1
+        self.reset_at = 0.0
+
+
+class RateLimitTracker:
+    """
+    Merkt sich Discords Rate-Limit-Buckets aus den Antwort-Headern.
+
+    Eine Route (z. B. "POST /channels/{id}/messages") wird über `X-RateLimit-Bucket`
+    einem Bucket zugeordnet, das Limit gilt pro Bucket und Major-Parameter
+    (Channel-/Guild-ID). Globale Limits (`X-RateLimit-Global`) blockieren alle Routen.
+    Alle Zeiten sind `time.monotonic()`-basiert, alle Methoden threadsafe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._global_until = 0.0
+
+    def _key(self, route: str, major: str) -> Tuple[str, str]:
+        return self._routes.get(route, route), major
+
+    def delay(self, route: str, major: str = "") -> float:
+        """Sekunden, die vor dem nächsten Request auf dieser Route gewartet werden müssen."""
+        now = time.monotonic()
+        with self._lock:
+            wait = self._global_until - now
+            bucket = self._buckets.get(self._key(route, major))
+            if bucket is not None and bucket.remaining <= 0:
+                wait = max(wait, bucket.reset_at - now)
+        return max(0.0, wait)
+
+    def acquire(self, route: str, major: str = "") -> float:
+        """
+        Wie `delay`, reserviert aber bei freiem Bucket direkt einen Request, damit
+        parallele Sender nicht gemeinsam das letzte Kontingent verbrauchen.
+        """
+        now = time.monotonic()
+        with self._lock:
+            wait = self._global_until - now
+            bucket = self._buckets.get(self._key(route, major))
+            if bucket is not None:
+                if bucket.reset_at <= now:
+                    bucket.remaining = max(bucket.remaining, bucket.limit or 1)
+                if bucket.remaining <= 0:
+                    wait = max(wait, bucket.reset_at - now)
+                elif wait <= 0:
+                    bucket.remaining -= 1
+        return max(0.0, wait)
+
+    def update(self, route: str, major: str, status: int, headers: Optional[Mapping] = None, body=None) -> Optional[float]:
+        """
+        Übernimmt die Header einer Antwort. Gibt bei 429 die Wartezeit in Sekunden zurück,
+        sonst `None`.
+        """
+        h = {str(k).lower(): v for k, v in (headers or {}).items()}
+        now = time.monotonic()
+        retry_after = None
+        if status == 429:
+            retry_after = _float(h.get("retry-after"))
+            if isinstance(body, dict) and body.get("retry_after") is not None:
+                retry_after = _float(body.get("retry_after"))
+            if retry_after is None:
+                retry_after = 1.0
+        is_global = str(h.get("x-ratelimit-global", "")).lower() == "true" or (
+            isinstance(body, dict) and bool(body.get("global"))
+        )
+
+        with self._lock:
+            bucket_id = h.get("x-ratelimit-bucket")
+            if bucket_id:
+                previous = self._routes.get(route)
+                self._routes[route] = bucket_id
+                if previous is None and (route, major) in self._buckets:
+                    # Bisher unter dem Routennamen geführten Zustand auf den echten Bucket umziehen
+                    self._buckets[(bucket_id, major)] = self._buckets.pop((route, major))
+            if retry_after is not None and is_global:
+                self._global_until = max(self._global_until, now + retry_after)
+                return retry_after
+
+            key = self._key(route, major)
+            bucket = self._buckets.get(key)
+            remaining = _int(h.get("x-ratelimit-remaining"))
+            reset_after = _float(h.get("x-ratelimit-reset-after"))
+            if bucket is None and (remaining is not None or retry_after is not None):
+                bucket = self._buckets[key] = _Bucket()
+            if bucket is None:
+                return None
+            limit = _int(h.get("x-ratelimit-limit"))
+            if limit is not None:
+                bucket.limit = limit
+            if remaining is not None:
+                bucket.remaining = remaining
+            if reset_after is not None:
+                bucket.reset_at = now + reset_after
+            if retry_after is not None:
+                bucket.remaining = 0
+                bucket.reset_at = max(bucket.reset_at, now + retry_after)
+        return retry_after
+
+
+def _float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,296 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\rest.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.discord.ratelimit import RateLimitTracker
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+REST_MAX_RETRIES = getattr(settings, 'REST_MAX_RETRIES', 3)
+REST_TIMEOUT     = getattr(settings, 'REST_TIMEOUT', 15)
+REST_POOL_SIZE   = getattr(settings, 'REST_POOL_SIZE', 16)
+REST_CACHE_TTL   = getattr(settings, 'REST_CACHE_TTL', 0)
+REST_CACHE_SIZE  = getattr(settings, 'REST_CACHE_SIZE', 512)
+
+# discum-Methode -> (Route, Index des Major-Parameters in den Argumenten oder None).
+# Die Route bestimmt Rate-Limit-Bucket, Metrik-Label und ob ein Request wiederholt werden darf.
+ROUTES: Dict[str, Tuple[str, Optional[int]]] = {
+    "info":             ("GET /users/@me", None),
+    "getGuilds":        ("GET /users/@me/guilds", None),
+    "getGuild":         ("GET /guilds/{guild_id}", 0),
+    "getGuildChannels": ("GET /guilds/{guild_id}/channels", 0),
+    "getGuildRoles":    ("GET /guilds/{guild_id}/roles", 0),
+    "getGuildMember":   ("GET /guilds/{guild_id}/members/{user_id}", 0),
+    "getChannel":       ("GET /channels/{channel_id}", 0),
+    "getMessages":      ("GET /channels/{channel_id}/messages", 0),
+    "getMessage":       ("GET /channels/{channel_id}/messages/{message_id}", 0),
+    "getProfile":       ("GET /users/{user_id}/profile", None),
+    "sendMessage":      ("POST /channels/{channel_id}/messages", 0),
+    "reply":            ("POST /channels/{channel_id}/messages", 0),
+    "typingAction":     ("POST /channels/{channel_id}/typing", 0),
+    "editMessage":      ("PATCH /channels/{channel_id}/messages/{message_id}", 0),
+    "deleteMessage":    ("DELETE /channels/{channel_id}/messages/{message_id}", 0),
+    "addReaction":      ("PUT /channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me", 0),
+    "removeReaction":   ("DELETE /channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me", 0),
+}
+
+# Nur diese Verben werden nach 5xx/Timeout wiederholt; unbekannte Methoden gelten als nicht idempotent
+_IDEMPOTENT = frozenset(("GET", "PUT", "PATCH", "DELETE"))
+
+# Statuscodes, die auf ein vorübergehendes Problem bei Discord hindeuten
+_RETRY_STATUS = frozenset((500, 502, 503, 504))
+
+
+class RestError(Exception):
+    """
+    REST-Aufruf fehlgeschlagen. `retryable` ist True, wenn der Fehler vorübergehend war
+    (429, 5xx, Timeout) und nur die Wiederholungen erschöpft sind.
+    """
+
+    def __init__(self, message: str, route: str, status: Optional[int] = None, body=None, retryable: bool = False):
+        super().__init__(message)
+        self.route = route
+        self.status = status
+        self.body = body
+        self.retryable = retryable
+
+
+class RestClient:
+    """
+    Fassade um `discum.Client` mit gemeinsamer Richtlinie für alle REST-Aufrufe.
+
+    Methoden werden unter ihrem discum-Namen aufgerufen (`rest.getChannel(id)`) und
+    liefern bei Erfolg dieselbe Response wie discum. Vor jedem Request wird der
+    Rate-Limit-Bucket der Route geprüft (`RateLimitTracker`, geteilt mit der
+    Sende-Queue). 429 wird immer nach `retry_after` wiederholt, 5xx und Netzwerkfehler
+    nur bei idempotenten Routen (GET, PUT, PATCH, DELETE). Alle übrigen 4xx werfen sofort
+    `RestError`. GET-Antworten können für `cache_ttl` Sekunden zwischengespeichert werden.
+    """
+
+    def __init__(
+        self,
+        client: Callable[[], object],
+        metrics=None,
+        tracker: Optional[RateLimitTracker] = None,
+        max_retries: int = REST_MAX_RETRIES,
+        timeout: float = REST_TIMEOUT,
+        pool_size: int = REST_POOL_SIZE,
+        cache_ttl: float = REST_CACHE_TTL,
+        cache_size: int = REST_CACHE_SIZE,
+        logger=None
+    ):
+        self.client = client
+        self.metrics = metrics
+        self.tracker = tracker or RateLimitTracker()
+        self.max_retries = max(0, int(max_retries))
+        self.timeout = timeout
+        self.pool_size = max(1, int(pool_size))
+        self.cache_ttl = float(cache_ttl or 0)
+        self.cache_size = max(1, int(cache_size))
+        self.logger = logger or debug_logger
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Hashable, Tuple[float, str, object]]" = OrderedDict()
+        self._session = None
+
+    def __getattr__(self, method: str):
+        # Nur für discum-Methoden; fehlt die Methode am Client, verhält sich die Fassade wie discum
+        client = self.__dict__.get("client")
+        if method.startswith("_") or client is None or not callable(getattr(client(), method, None)):
+            raise AttributeError(method)
+
+        def call(*args, **kwargs):
+            return self.call(method, *args, **kwargs)
+        call.__name__ = method
+        return call
+
+    def __repr__(self) -> str:
+        return f"<RestClient cache={len(self._cache)}>"
+
+    # --- Aufruf --------------------------------------------------------------
+
+    def call(self, method: str, *args, cache_ttl: Optional[float] = None, **kwargs):
+        """
+        Ruft `client.<method>(*args, **kwargs)` mit Rate-Limit, Retries und Metriken auf.
+        `cache_ttl` überschreibt die Standard-Cachedauer für diesen GET-Aufruf.
+        """
+        bot = self.client()
+        fn = getattr(bot, method, None)
+        if fn is None:
+            raise AttributeError(f"discum.Client hat keine Methode {method!r}")
+        self._configure_session(bot)
+        route, major = self.route(method, args)
+        verb = route.split(" ", 1)[0]
+        ttl = self.cache_ttl if cache_ttl is None else float(cache_ttl)
+
+        key = None
+        if verb == "GET" and ttl > 0:
+            key = _cache_key(method, args, kwargs)
+        if key is not None:
+            resp = self._cached(key)
+            if resp is not None:
+                if self.metrics is not None:
+                    self.metrics.observe_route_cached(route)
+                return resp
+
+        resp = self._request(fn, route, major, verb in _IDEMPOTENT, args, kwargs)
+        if key is not None:
+            self._store(key, major, resp, ttl)
+        elif verb != "GET" and major:
+            # Eine Änderung macht gecachte GETs desselben Channels/Guild ungültig
+            self.invalidate(major)
+        return resp
+
+    def route(self, method: str, args: Tuple) -> Tuple[str, str]:
+        route, index = ROUTES.get(method, (f"CALL {method}", None))
+        major = str(args[index]) if index is not None and len(args) > index else ""
+        return route, major
+
+    def _request(self, fn, route: str, major: str, idempotent: bool, args: Tuple, kwargs: Dict):
+        failures = 0
+        while True:
+            wait = self.tracker.acquire(route, major)
+            if wait > 0:
+                time.sleep(wait)
+                continue
+            start = time.perf_counter()
+            try:
+                resp = fn(*args, **kwargs)
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                if not _transient(e) or not idempotent or failures >= self.max_retries:
+                    self._observe(route, elapsed, error=True)
+                    if _transient(e):
+                        raise RestError(f"{route}: {e}", route, retryable=True) from e
+                    raise
+                failures += 1
+                self._observe(route, elapsed, retry=True)
+                self._backoff(route, failures, e)
+                continue
+            elapsed = time.perf_counter() - start
+
+            status = getattr(resp, 'status_code', 200)
+            body = _body(resp, status)
+            retry_after = self.tracker.update(route, major, status, getattr(resp, 'headers', None), body)
+            if retry_after is not None:
+                # 429: der Request wurde nicht ausgeführt, Wiederholen ist immer sicher
+                self._observe(route, elapsed, retry=True)
+                if self.metrics is not None:
+                    self.metrics.observe_rate_limit()
+                if failures >= self.max_retries:
+                    raise RestError(f"{route}: Rate-Limit, {failures} Wiederholungen erschöpft", route, status, body, True)
+                failures += 1
+                self.logger.warning('RestClient', "Rate-Limit auf %s, warte %.2fs", route, retry_after)
+                time.sleep(retry_after)
+                continue
+            if status in _RETRY_STATUS and idempotent and failures < self.max_retries:
+                failures += 1
+                self._observe(route, elapsed, retry=True)
+                self._backoff(route, failures, status)
+                continue
+            if status >= 400:
+                self._observe(route, elapsed, error=True)
+                raise RestError(f"{route}: Discord antwortet mit {status}: {body}", route, status, body, status in _RETRY_STATUS)
+            self._observe(route, elapsed)
+            return resp
+
+    def _backoff(self, route: str, failures: int, reason) -> None:
+        delay = min(10.0, 0.5 * 2 ** (failures - 1))
+        self.logger.warning(
+            'RestClient', "%s fehlgeschlagen (%s), Versuch %s/%s in %.1fs", route, reason, failures, self.max_retries, delay
+        )
+        time.sleep(delay)
+
+    def _observe(self, route: str, seconds: float, error: bool = False, retry: bool = False) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_route(route, seconds, error=error, retry=retry)
+
+    # --- GET-Cache -----------------------------------------------------------
+
+    def _cached(self, key: Hashable):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[2]
+
+    def _store(self, key: Hashable, major: str, resp, ttl: float) -> None:
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, major, resp)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, major: Optional[str] = None) -> None:
+        """Verwirft gecachte GETs eines Channels/einer Guild oder, ohne Angabe, alle."""
+        with self._lock:
+            if major is None:
+                self._cache.clear()
+                return
+            for key in [k for k, e in self._cache.items() if e[1] == major]:
+                del self._cache[key]
+
+    # --- Verbindungen --------------------------------------------------------
+
+    def _configure_session(self, bot) -> None:
+        """
+        Hängt einmalig einen Adapter mit größerem Keep-Alive-Pool und Standard-Timeout an
+        die `requests.Session` von discum. requests hält sonst nur 10 Verbindungen pro Host
+        offen und wartet ohne Timeout unbegrenzt auf eine Antwort.
+        """
+        session = getattr(bot, 's', None)
+        if session is None or session is self._session or not hasattr(session, 'mount'):
+            return
+        with self._lock:
+            if session is self._session:
+                return
+            self._session = session
+            try:
+                from requests.adapters import HTTPAdapter
+            except ImportError:
+                return
+            timeout = self.timeout
+
+            class _Adapter(HTTPAdapter):
+                def send(self, request, **kwargs):
+                    if kwargs.get("timeout") is None:
+                        kwargs["timeout"] = timeout
+                    return super().send(request, **kwargs)
+
+            session.mount("https://", _Adapter(pool_connections=4, pool_maxsize=self.pool_size))
+        self.logger.debug('RestClient', "HTTP-Pool: %s Verbindungen, Timeout %ss", self.pool_size, timeout)
+
+
+def _cache_key(method: str, args: Tuple, kwargs: Dict) -> Optional[Hashable]:
+    key = (method, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _transient(error: Exception) -> bool:
+    # requests' Timeout/ConnectionError sind OSError; MissingSchema u. Ä. zusätzlich ValueError
+    return isinstance(error, OSError) and not isinstance(error, ValueError)
+
+
+def _body(resp, status: int):
+    if status < 400:
+        return None
+    try:
+        return resp.json()
+    except Exception:
+        return None
@@ -0,0 +1,409 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\scheduler.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import math
+import time
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Set
+
+from src.core.animation.debug_animation import logger as debug_logger
+from src.core.discord.metrics import Histogram, _ms
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+SCHEDULER_TICK = getattr(settings, 'SCHEDULER_TICK', 0.25)
+SCHEDULER_WORKERS = getattr(settings, 'SCHEDULER_WORKERS', 2)
+
+# Slots des Rads; Jobs weiter als SLOTS * TICK in der Zukunft liegen im selben Slot wie nähere
+_SLOTS = 512
+# Längste Wartezeit am Stück, damit ein gesetztes Stop-Event spätestens dann bemerkt wird
+_MAX_WAIT = 1.0
+
+# (min, max) für Minute, Stunde, Tag, Monat, Wochentag (0 = Sonntag)
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+
+class CronSchedule:
+    """
+    Cron-Ausdruck mit fünf Feldern (`Minute Stunde Tag Monat Wochentag`) in lokaler Zeit.
+    Erlaubt sind `*`, Zahlen, Bereiche `a-b`, Listen `a,b` und Schritte `*/n` bzw. `a-b/n`.
+    Sind Tag und Wochentag beide eingeschränkt, genügt wie bei cron einer von beiden.
+    """
+
+    __slots__ = ("expr", "minutes", "hours", "days", "months", "weekdays", "_any_day", "_any_weekday")
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron-Ausdruck braucht 5 Felder, nicht {len(parts)}: {expr!r}")
+        self.expr = " ".join(parts)
+        fields = [_parse_field(part, lo, hi if i != 4 else 7) for i, (part, (lo, hi)) in enumerate(zip(parts, _CRON_FIELDS))]
+        self.minutes, self.hours, self.days, self.months, weekdays = fields
+        self.weekdays = frozenset(d % 7 for d in weekdays)
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+        # Frühzeitig prüfen, ob der Ausdruck überhaupt je zutrifft (z. B. 31. Februar)
+        self.next_after(datetime(2000, 1, 1))
+
+    def _day_matches(self, t: datetime) -> bool:
+        dom = t.day in self.days
+        dow = t.isoweekday() % 7 in self.weekdays
+        if self._any_day and self._any_weekday:
+            return True
+        if self._any_day:
+            return dow
+        if self._any_weekday:
+            return dom
+        return dom or dow
+
+    def next_after(self, after: datetime) -> datetime:
+        """Erster passender Zeitpunkt echt nach `after` (auf die Minute genau)."""
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Vier Jahre decken jeden 29. Februar ab
+        limit = t + timedelta(days=4 * 366)
+        while t < limit:
+            if t.month not in self.months:
+                year, month = (t.year + 1, 1) if t.month == 12 else (t.year, t.month + 1)
+                t = t.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron-Ausdruck trifft nie zu: {self.expr!r}")
+
+
+class Job:
+    """Ein geplanter Job. Die Zähler werden vom Scheduler gepflegt und sind nur zum Lesen gedacht."""
+
+    __slots__ = (
+        "name", "func", "owner", "interval", "cron", "due", "due_tick", "running", "cancelled",
+        "runs", "errors", "missed", "duration", "last_error", "_scheduler"
+    )
+
+    def __init__(
+        self, scheduler: "Scheduler", name: str, func: Callable[[], None], owner: Optional[str],
+        interval: Optional[float] = None, cron: Optional[CronSchedule] = None
+    ):
+        self._scheduler = scheduler
+        self.name = name
+        self.func = func
+        self.owner = owner
+        self.interval = interval
+        self.cron = cron
+        # Geplanter Zeitpunkt (time.monotonic) und zugehöriger Tick im Rad
+        self.due = 0.0
+        self.due_tick = 0
+        self.running = False
+        self.cancelled = False
+        self.runs = 0
+        self.errors = 0
+        self.missed = 0
+        self.duration = Histogram()
+        self.last_error: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<Job {self.name!r} {self.schedule}>"
+
+    @property
+    def schedule(self) -> str:
+        if self.cron is not None:
+            return f"cron {self.cron.expr}"
+        if self.interval is not None:
+            return f"alle {self.interval:g}s"
+        return "einmalig"
+
+    def cancel(self) -> None:
+        self._scheduler.cancel(self)
+
+
+class Scheduler:
+    """
+    Zentraler Scheduler für wiederkehrende und einmalige Jobs.
+
+    Alle Jobs liegen in einem einzigen Timer-Rad (Hashed Wheel, `SCHEDULER_TICK` pro Slot),
+    das ein Thread abarbeitet. Er wartet immer bis zum nächsten fälligen Tick statt in festen
+    Schritten. Fällige Jobs laufen in einem eigenen kleinen Executor (`SCHEDULER_WORKERS`
+    Threads), nicht in den Workern des Dispatchers: lange Jobs belegen so keine Befehls-Worker
+    an der Admission Control vorbei, sondern stauen sich nur untereinander. Ein Job läuft
+    nie parallel zu sich selbst: ist er bei Fälligkeit noch beschäftigt, oder kommt der
+    Scheduler so spät, dass ganze Intervalle übersprungen wurden, zählt das als verpasst.
+    Nachgeholt wird nicht.
+    """
+
+    def __init__(self, tick: float = SCHEDULER_TICK, slots: int = _SLOTS, executor: Optional[Executor] = None,
+                 workers: int = SCHEDULER_WORKERS, logger=None):
+        self.tick = max(0.01, float(tick))
+        self.executor = executor
+        self.workers = max(1, int(workers))
+        self.logger = logger or debug_logger
+        self._lock = threading.Lock()
+        self._slots: List[List[Job]] = [[] for _ in range(max(1, int(slots)))]
+        self._jobs: Set[Job] = set()
+        self._t0 = time.monotonic()
+        self._tick_no = 0
+        self._wake = threading.Event()
+        self._stop_event: Optional[threading.Event] = None
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._own_executor: Optional[ThreadPoolExecutor] = None
+
+    # --- Registrierung -------------------------------------------------------
+
+    def every(
+        self, seconds: float, func: Callable[[], None], name: Optional[str] = None,
+        owner: Optional[str] = None, first: Optional[float] = None
+    ) -> Job:
+        """Alle `seconds` Sekunden, erstmals nach `first` (Standard: nach einem Intervall)."""
+        if seconds <= 0:
+            raise ValueError("Intervall muss größer als 0 sein")
+        job = Job(self, name or _name_of(func), func, owner, interval=float(seconds))
+        job.due = time.monotonic() + (seconds if first is None else max(0.0, first))
+        return self._add(job)
+
+    def cron(self, expr: str, func: Callable[[], None], name: Optional[str] = None, owner: Optional[str] = None) -> Job:
+        """Nach Cron-Ausdruck, z. B. `"*/15 * * * *"` (alle 15 Minuten) oder `"0 3 * * 1"` (montags 3 Uhr)."""
+        job = Job(self, name or _name_of(func), func, owner, cron=CronSchedule(expr))
+        job.due = _cron_due(job.cron, time.monotonic())
+        return self._add(job)
+
+    def once(self, delay: float, func: Callable[[], None], name: Optional[str] = None, owner: Optional[str] = None) -> Job:
+        """Einmal nach `delay` Sekunden."""
+        job = Job(self, name or _name_of(func), func, owner)
+        job.due = time.monotonic() + max(0.0, delay)
+        return self._add(job)
+
+    def cancel(self, job: Job) -> None:
+        with self._lock:
+            job.cancelled = True
+            self._unlink(job)
+
+    def remove_owners(self, owners: Iterable[str]) -> List[Job]:
+        """Entfernt alle Jobs der angegebenen Module und gibt sie zurück (für `restore`)."""
+        owners = set(owners)
+        with self._lock:
+            removed = [job for job in self._jobs if job.owner in owners]
+            for job in removed:
+                job.cancelled = True
+                self._unlink(job)
+        return removed
+
+    def restore(self, jobs: Iterable[Job]) -> None:
+        now = time.monotonic()
+        for job in jobs:
+            job.cancelled = False
+            # Die Zeit außerhalb des Rads zählt nicht als verpasst
+            if job.interval is not None and job.due < now:
+                job.due += job.interval * math.ceil((now - job.due) / job.interval)
+            elif job.cron is not None:
+                job.due = _cron_due(job.cron, now)
+            self._add(job)
+
+    def owned_by(self, owner: str) -> bool:
+        with self._lock:
+            return any(job.owner == owner for job in self._jobs)
+
+    def jobs(self) -> List[Job]:
+        with self._lock:
+            return sorted(self._jobs, key=lambda job: job.due)
+
+    # --- Lebenszyklus --------------------------------------------------------
+
+    def start(self, stop_event: Optional[threading.Event] = None, executor: Optional[Executor] = None) -> None:
+        if executor is not None:
+            self.executor = executor
+        if self.executor is None:
+            self._own_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scheduler-job')
+            self.executor = self._own_executor
+        self._stop_event = stop_event
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='scheduler', daemon=True)
+        self._thread.start()
+        self.logger.debug('Scheduler.start', "Scheduler gestartet: %s Jobs, Tick %ss", len(self._jobs), self.tick)
+
+    def stop(self) -> None:
+        """Keine neuen Läufe mehr. Bereits gestartete Jobs laufen im Executor zu Ende."""
+        self._stopped = True
+        self._wake.set()
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- Rad -----------------------------------------------------------------
+
+    def _add(self, job: Job, log: bool = True) -> Job:
+        with self._lock:
+            if job.cancelled:
+                # cancel()/remove_owners() kam zwischen Fälligkeit und Neuplanung
+                return job
+            job.due_tick = max(self._tick_no + 1, math.ceil((job.due - self._t0) / self.tick))
+            self._slots[job.due_tick % len(self._slots)].append(job)
+            self._jobs.add(job)
+        self._wake.set()
+        if log:
+            self.logger.debug('Scheduler', "Job %s geplant (%s, owner=%s)", job.name, job.schedule, job.owner)
+        return job
+
+    def _unlink(self, job: Job) -> None:
+        if job not in self._jobs:
+            return
+        self._jobs.discard(job)
+        bucket = self._slots[job.due_tick % len(self._slots)]
+        try:
+            bucket.remove(job)
+        except ValueError:
+            pass
+
+    def _advance(self, target: int) -> List[Job]:
+        """Bewegt das Rad bis Tick `target` und liefert alle fälligen Jobs. Aufruf unter `_lock`."""
+        due: List[Job] = []
+        n = len(self._slots)
+        if target - self._tick_no >= n:
+            # Lange Pause (Standby, blockierter Prozess): jeder Slot einmal reicht
+            slots = range(n)
+        else:
+            slots = [t % n for t in range(self._tick_no + 1, target + 1)]
+        for index in slots:
+            bucket = self._slots[index]
+            if not bucket:
+                continue
+            keep = [job for job in bucket if job.due_tick > target]
+            if len(keep) != len(bucket):
+                due.extend(job for job in bucket if job.due_tick <= target)
+                self._slots[index] = keep
+        self._tick_no = max(self._tick_no, target)
+        for job in due:
+            self._jobs.discard(job)
+        return due
+
+    def _loop(self) -> None:
+        while not self._stopped and not (self._stop_event is not None and self._stop_event.is_set()):
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                due = self._advance(int((now - self._t0) / self.tick))
+            for job in due:
+                self._fire(job, now)
+            with self._lock:
+                next_tick = min((job.due_tick for job in self._jobs), default=None)
+            timeout = _MAX_WAIT
+            if next_tick is not None:
+                timeout = min(timeout, self._t0 + next_tick * self.tick - time.monotonic())
+            if timeout > 0:
+                self._wake.wait(timeout)
+        self.logger.debug('Scheduler', "Scheduler beendet")
+
+    # --- Ausführung ----------------------------------------------------------
+
+    def _fire(self, job: Job, now: float) -> None:
+        if job.cancelled:
+            return
+        late = max(0.0, now - job.due)
+        skipped = 0
+        if job.interval is not None:
+            # Ganze Intervalle, die der Scheduler zu spät dran ist, gelten als verpasst
+            skipped = int(late // job.interval)
+            job.due += job.interval * (skipped + 1)
+        elif job.cron is not None:
+            skipped = _cron_missed(job.cron, late)
+            job.due = _cron_due(job.cron, now)
+        if job.running:
+            # Der vorige Lauf ist noch nicht fertig: dieser entfällt
+            skipped += 1
+            self.logger.warning('Scheduler', "Job %s läuft noch, Lauf entfällt", job.name)
+        elif skipped:
+            self.logger.warning('Scheduler', "Job %s ist %.1fs verspätet, %s Lauf/Läufe verpasst", job.name, late, skipped)
+        job.missed += skipped
+        if job.interval is not None or job.cron is not None:
+            self._add(job, log=False)
+        if job.running:
+            return
+        job.running = True
+        try:
+            self.executor.submit(self._run, job)
+        except RuntimeError as e:
+            # Executor bereits heruntergefahren (Shutdown)
+            job.running = False
+            self.logger.debug('Scheduler', "Job %s nicht gestartet: %s", job.name, e)
+
+    def _run(self, job: Job) -> None:
+        start = time.perf_counter()
+        try:
+            job.func()
+        except Exception as e:
+            job.errors += 1
+            job.last_error = f"{type(e).__name__}: {e}"
+            self.logger.error('Scheduler', "Job %s fehlgeschlagen: %s", job.name, e, exc_info=True)
+        finally:
+            job.duration.observe(time.perf_counter() - start)
+            job.runs += 1
+            job.running = False
+
+    # --- Ausgabe -------------------------------------------------------------
+
+    def format_table(self) -> str:
+        now = time.monotonic()
+        lines = [f"{'Job':<22}{'Plan':<18}{'Läufe':>6}{'Fehler':>7}{'Verp.':>6}{'p50':>9}{'max':>9}{'in':>8}"]
+        for job in self.jobs():
+            h = job.duration
+            lines.append(
+                f"{job.name[:21]:<22}{job.schedule[:17]:<18}{job.runs:>6}{job.errors:>7}{job.missed:>6}"
+                f"{_ms(h.quantile(0.5) if h.count else None):>9}{_ms(h.max if h.count else None):>9}"
+                f"{max(0.0, job.due - now):>7.0f}s"
+            )
+        if len(lines) == 1:
+            lines.append("Keine Jobs geplant.")
+        return "\n".join(lines)
+
+
+def _parse_field(field: str, lo: int, hi: int) -> frozenset:
+    values = set()
+    for part in field.split(","):
+        rng, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if rng == "*":
+            start, end = lo, hi
+        elif "-" in rng:
+            a, b = rng.split("-", 1)
+            start, end = int(a), int(b)
+        else:
+            start = int(rng)
+            end = hi if step_text else start
+        if step < 1 or start < lo or end > hi or start > end:
+            raise ValueError(f"Ungültiges Cron-Feld {field!r} (erlaubt {lo}-{hi})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+def _cron_due(cron: CronSchedule, now: float) -> float:
+    # Cron rechnet in Wanduhrzeit, das Rad in time.monotonic()
+    wall = datetime.now()
+    return now + (cron.next_after(wall) - wall).total_seconds()
+
+
+def _cron_missed(cron: CronSchedule, late: float) -> int:
+    if late < 60:
+        return 0
+    # Cron-Zeitpunkte zwischen geplantem und tatsächlichem Lauf zählen (gedeckelt)
+    t = datetime.now() - timedelta(seconds=late)
+    end = datetime.now()
+    missed = 0
+    while missed < 1000:
+        t = cron.next_after(t)
+        if t >= end:
+            break
+        missed += 1
+    return missed
+
+
+def _name_of(func: Callable) -> str:
+    return getattr(func, "__qualname__", None) or repr(func)
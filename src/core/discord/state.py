@@ -0,0 +1,427 @@
+# ---------------------------------------------------------------------------
+# \src\core\discord\state.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+STATE_CACHE_MAX_ENTRIES = getattr(settings, 'STATE_CACHE_MAX_ENTRIES', 20000)
+
+
+class GuildState:
+    __slots__ = ("id", "name", "owner_id", "icon", "member_count", "channel_ids", "role_ids")
+
+    def __init__(self, id: str, name: str, owner_id: Optional[str], icon: Optional[str], member_count: Optional[int]):
+        self.id = id
+        self.name = name
+        self.owner_id = owner_id
+        self.icon = icon
+        self.member_count = member_count
+        # Werden nur unter dem Lock des StateCache ersetzt, nie verändert
+        self.channel_ids: Tuple[str, ...] = ()
+        self.role_ids: Tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        return f"<Guild {self.id} {self.name!r}>"
+
+
+class ChannelState:
+    __slots__ = ("id", "guild_id", "type", "name", "parent_id", "position", "topic", "recipient_ids")
+
+    def __init__(
+        self,
+        id: str,
+        guild_id: Optional[str],
+        type: int,
+        name: Optional[str],
+        parent_id: Optional[str],
+        position: int,
+        topic: Optional[str],
+        recipient_ids: Tuple[str, ...]
+    ):
+        self.id = id
+        self.guild_id = guild_id
+        self.type = type
+        self.name = name
+        self.parent_id = parent_id
+        self.position = position
+        self.topic = topic
+        self.recipient_ids = recipient_ids
+
+    def __repr__(self) -> str:
+        return f"<Channel {self.id} {self.name!r} guild={self.guild_id}>"
+
+
+class RoleState:
+    __slots__ = ("id", "guild_id", "name", "color", "position", "permissions")
+
+    def __init__(self, id: str, guild_id: str, name: str, color: int, position: int, permissions: int):
+        self.id = id
+        self.guild_id = guild_id
+        self.name = name
+        self.color = color
+        self.position = position
+        self.permissions = permissions
+
+    def __repr__(self) -> str:
+        return f"<Role {self.id} {self.name!r} guild={self.guild_id}>"
+
+
+def _guild(data: Dict) -> GuildState:
+    # Benutzer-Accounts bekommen in READY das neue Format mit "properties", Events das klassische
+    props = data.get("properties") or data
+    return GuildState(
+        str(data["id"]), props.get("name") or "", _opt_str(props.get("owner_id")),
+        props.get("icon"), data.get("member_count")
+    )
+
+
+def _channel(data: Dict, guild_id: Optional[str] = None) -> ChannelState:
+    recipients = data.get("recipient_ids") or [u.get("id") for u in data.get("recipients") or () if u.get("id")]
+    return ChannelState(
+        str(data["id"]), _opt_str(data.get("guild_id") or guild_id), int(data.get("type") or 0),
+        data.get("name"), _opt_str(data.get("parent_id")), int(data.get("position") or 0),
+        data.get("topic"), tuple(str(r) for r in recipients)
+    )
+
+
+def _role(data: Dict, guild_id: str) -> RoleState:
+    return RoleState(
+        str(data["id"]), str(guild_id), data.get("name") or "", int(data.get("color") or 0),
+        int(data.get("position") or 0), int(data.get("permissions") or 0)
+    )
+
+
+def _opt_str(value) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _json(resp):
+    """discum liefert `requests.Response`; alles außer 2xx gilt als Fehlzugriff."""
+    status = getattr(resp, 'status_code', 200)
+    if not 200 <= status < 300:
+        return None
+    return resp.json() if hasattr(resp, 'json') else resp
+
+
+class StateCache:
+    """
+    Guilds, Channels und Rollen aus dem Gateway, nach ID abrufbar.
+
+    Befüllt aus `READY` und aktuell gehalten über die Create/Update/Delete-Events.
+    Records verwenden `__slots__` und werden bei Updates ersetzt statt verändert,
+    nur die ID-Tupel einer Guild werden neu zugewiesen.
+    Der Speicher ist auf `max_entries` Records begrenzt. Darüber werden die am
+    längsten nicht abgefragten Guilds samt Channels und Rollen verdrängt.
+    Fehlt etwas, wird es einmalig per REST geholt und eingetragen.
+    """
+
+    def __init__(self, client: Callable[[], object] = lambda: None, max_entries: int = STATE_CACHE_MAX_ENTRIES, logger=None):
+        self.client = client
+        self.max_entries = max(0, int(max_entries or 0))
+        self.logger = logger or debug_logger
+        self._lock = threading.RLock()
+        self._guilds: "OrderedDict[str, GuildState]" = OrderedDict()
+        # DMs und Gruppen-DMs, eigene LRU-Reihenfolge
+        self._private: "OrderedDict[str, ChannelState]" = OrderedDict()
+        self._channels: Dict[str, ChannelState] = {}
+        self._roles: Dict[str, RoleState] = {}
+        self.ready = False
+        self.hits = 0
+        self.misses = 0
+        self.rest_errors = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._guilds) + len(self._channels) + len(self._roles)
+
+    def __repr__(self) -> str:
+        return f"<StateCache guilds={len(self._guilds)} channels={len(self._channels)} roles={len(self._roles)}>"
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "guilds": len(self._guilds), "channels": len(self._channels), "roles": len(self._roles),
+                "hits": self.hits, "misses": self.misses, "rest_errors": self.rest_errors,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._guilds.clear()
+            self._private.clear()
+            self._channels.clear()
+            self._roles.clear()
+            self.ready = False
+
+    # --- Abfragen ------------------------------------------------------------
+
+    def guild(self, guild_id: str) -> Optional[GuildState]:
+        guild_id = str(guild_id)
+        with self._lock:
+            guild = self._guilds.get(guild_id)
+            if guild is not None:
+                self.hits += 1
+                self._guilds.move_to_end(guild_id)
+                return guild
+            self.misses += 1
+        data = self._rest("getGuild", guild_id)
+        if data is None:
+            # Manche discum-Versionen haben kein getGuild; getGuilds liefert alle auf einmal
+            for g in self._rest("getGuilds") or ():
+                if str(g.get("id")) == guild_id:
+                    data = g
+                    break
+        if not isinstance(data, dict) or "id" not in data:
+            return None
+        with self._lock:
+            return self._put_guild(data)
+
+    def channel(self, channel_id: str) -> Optional[ChannelState]:
+        channel_id = str(channel_id)
+        with self._lock:
+            channel = self._channels.get(channel_id)
+            if channel is not None:
+                self.hits += 1
+                self._touch(channel)
+                return channel
+            self.misses += 1
+        data = self._rest("getChannel", channel_id)
+        if not isinstance(data, dict) or "id" not in data:
+            return None
+        with self._lock:
+            return self._put_channel(data)
+
+    def channels(self, guild_id: str) -> List[ChannelState]:
+        """Alle Channels einer Guild, nach Position sortiert."""
+        guild_id = str(guild_id)
+        with self._lock:
+            guild = self._guilds.get(guild_id)
+            if guild is not None and guild.channel_ids:
+                self.hits += 1
+                self._guilds.move_to_end(guild_id)
+                return sorted((self._channels[c] for c in guild.channel_ids if c in self._channels), key=lambda c: c.position)
+            self.misses += 1
+        data = self._rest("getGuildChannels", guild_id)
+        if not isinstance(data, list):
+            return []
+        with self._lock:
+            if guild_id not in self._guilds:
+                return sorted((_channel(c, guild_id) for c in data), key=lambda c: c.position)
+            for c in data:
+                self._put_channel(c, guild_id)
+            return sorted((self._channels[c] for c in self._guilds[guild_id].channel_ids if c in self._channels), key=lambda c: c.position)
+
+    def roles(self, guild_id: str) -> List[RoleState]:
+        """Alle Rollen einer Guild, höchste Position zuerst."""
+        guild_id = str(guild_id)
+        with self._lock:
+            guild = self._guilds.get(guild_id)
+            if guild is not None and guild.role_ids:
+                self.hits += 1
+                self._guilds.move_to_end(guild_id)
+                return sorted((self._roles[r] for r in guild.role_ids), key=lambda r: r.position, reverse=True)
+            self.misses += 1
+        data = self._rest("getGuildRoles", guild_id)
+        if not isinstance(data, list):
+            return []
+        with self._lock:
+            if guild_id not in self._guilds:
+                return sorted((_role(r, guild_id) for r in data), key=lambda r: r.position, reverse=True)
+            self._set_roles(self._guilds[guild_id], data)
+            return sorted((self._roles[r] for r in self._guilds[guild_id].role_ids), key=lambda r: r.position, reverse=True)
+
+    def role(self, guild_id: str, role_id: str) -> Optional[RoleState]:
+        role_id = str(role_id)
+        with self._lock:
+            role = self._roles.get(role_id)
+            if role is not None:
+                self.hits += 1
+                self._guilds.move_to_end(role.guild_id)
+                return role
+        return next((r for r in self.roles(guild_id) if r.id == role_id), None)
+
+    def guilds(self) -> List[GuildState]:
+        """Nur der Cache-Inhalt, ohne REST."""
+        with self._lock:
+            return list(self._guilds.values())
+
+    def _rest(self, method: str, *args):
+        bot = self.client()
+        fn = getattr(bot, method, None)
+        if fn is None:
+            return None
+        try:
+            return _json(fn(*args))
+        except Exception as e:
+            with self._lock:
+                self.rest_errors += 1
+            self.logger.warning('StateCache.%s' % method, "REST-Abfrage fehlgeschlagen: %s", e)
+            return None
+
+    # --- Gateway -------------------------------------------------------------
+
+    def attach(self, events) -> None:
+        """Meldet die Handler am EventDispatcher an. Ohne Budget bleibt der Cache leer (nur REST)."""
+        if not self.enabled:
+            self.logger.debug('StateCache.attach', "State-Cache deaktiviert (STATE_CACHE_MAX_ENTRIES = 0)")
+            return
+        handlers = {
+            "READY": self._on_ready,
+            "GUILD_CREATE": self._on_guild_create,
+            "GUILD_UPDATE": self._on_guild_update,
+            "GUILD_DELETE": self._on_guild_delete,
+            "CHANNEL_CREATE": self._on_channel_update,
+            "CHANNEL_UPDATE": self._on_channel_update,
+            "CHANNEL_DELETE": self._on_channel_delete,
+            "GUILD_ROLE_CREATE": self._on_role_update,
+            "GUILD_ROLE_UPDATE": self._on_role_update,
+            "GUILD_ROLE_DELETE": self._on_role_delete,
+        }
+        for event, handler in handlers.items():
+            events.on(event, handler)
+
+    def _on_ready(self, data: Dict) -> None:
+        with self._lock:
+            self.clear()
+            for g in data.get("guilds") or ():
+                if not g.get("unavailable"):
+                    self._put_guild(g)
+            for c in data.get("private_channels") or ():
+                self._put_channel(c)
+            self.ready = True
+        self.logger.debug('StateCache.ready', "State-Cache gefüllt: %r", self)
+
+    def _on_guild_create(self, data: Dict) -> None:
+        with self._lock:
+            self._put_guild(data)
+
+    def _on_guild_update(self, data: Dict) -> None:
+        with self._lock:
+            old = self._guilds.get(str(data.get("id")))
+            if old is None:
+                return
+            guild = _guild(data)
+            guild.channel_ids, guild.role_ids = old.channel_ids, old.role_ids
+            self._guilds[guild.id] = guild
+            if "roles" in data:
+                self._set_roles(guild, data["roles"])
+
+    def _on_guild_delete(self, data: Dict) -> None:
+        with self._lock:
+            guild = self._guilds.pop(str(data.get("id")), None)
+            if guild is not None:
+                self._drop_children(guild)
+
+    def _on_channel_update(self, data: Dict) -> None:
+        with self._lock:
+            self._put_channel(data)
+
+    def _on_channel_delete(self, data: Dict) -> None:
+        with self._lock:
+            channel = self._channels.pop(str(data.get("id")), None)
+            if channel is None:
+                return
+            if channel.guild_id is None:
+                self._private.pop(channel.id, None)
+            else:
+                guild = self._guilds.get(channel.guild_id)
+                if guild is not None:
+                    guild.channel_ids = tuple(c for c in guild.channel_ids if c != channel.id)
+
+    def _on_role_update(self, data: Dict) -> None:
+        with self._lock:
+            guild = self._guilds.get(str(data.get("guild_id")))
+            if guild is None or not data.get("role"):
+                return
+            role = _role(data["role"], guild.id)
+            if role.id not in self._roles:
+                guild.role_ids += (role.id,)
+            self._roles[role.id] = role
+
+    def _on_role_delete(self, data: Dict) -> None:
+        with self._lock:
+            role = self._roles.pop(str(data.get("role_id")), None)
+            guild = self._guilds.get(str(data.get("guild_id")))
+            if role is not None and guild is not None:
+                guild.role_ids = tuple(r for r in guild.role_ids if r != role.id)
+
+    # --- Intern (alle unter _lock) -------------------------------------------
+
+    def _put_guild(self, data: Dict) -> GuildState:
+        guild = _guild(data)
+        old = self._guilds.get(guild.id)
+        if old is not None:
+            guild.channel_ids, guild.role_ids = old.channel_ids, old.role_ids
+        self._guilds[guild.id] = guild
+        self._guilds.move_to_end(guild.id)
+        for c in data.get("channels") or ():
+            self._put_channel(c, guild.id, evict=False)
+        if "roles" in data:
+            self._set_roles(guild, data["roles"], evict=False)
+        self._evict()
+        return guild
+
+    def _put_channel(self, data: Dict, guild_id: Optional[str] = None, evict: bool = True) -> ChannelState:
+        channel = _channel(data, guild_id)
+        if channel.guild_id is None:
+            self._private[channel.id] = channel
+            self._private.move_to_end(channel.id)
+        else:
+            guild = self._guilds.get(channel.guild_id)
+            if guild is None:
+                # Ohne Guild im Cache könnte der Channel nie verdrängt werden
+                return channel
+            if channel.id not in self._channels:
+                guild.channel_ids += (channel.id,)
+        self._channels[channel.id] = channel
+        if evict:
+            self._evict()
+        return channel
+
+    def _set_roles(self, guild: GuildState, roles: Iterable[Dict], evict: bool = True) -> None:
+        for r in guild.role_ids:
+            self._roles.pop(r, None)
+        records = [_role(r, guild.id) for r in roles]
+        for role in records:
+            self._roles[role.id] = role
+        guild.role_ids = tuple(r.id for r in records)
+        if evict:
+            self._evict()
+
+    def _drop_children(self, guild: GuildState) -> None:
+        for c in guild.channel_ids:
+            self._channels.pop(c, None)
+        for r in guild.role_ids:
+            self._roles.pop(r, None)
+
+    def _touch(self, channel: ChannelState) -> None:
+        if channel.guild_id is None:
+            self._private.move_to_end(channel.id)
+        elif channel.guild_id in self._guilds:
+            self._guilds.move_to_end(channel.guild_id)
+
+    def _evict(self) -> None:
+        # Zuerst ganze Guilds, dann DMs; die zuletzt benutzte Guild bleibt immer
+        while len(self) > self.max_entries:
+            if len(self._guilds) > 1:
+                _, guild = self._guilds.popitem(last=False)
+                self._drop_children(guild)
+            elif self._private:
+                channel_id, _ = self._private.popitem(last=False)
+                self._channels.pop(channel_id, None)
+            else:
+                break
+            self.evictions += 1
@@ -0,0 +1,194 @@
+# ---------------------------------------------------------------------------
+# \src\core\system\flight_recorder.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import sys
+import time
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# Nur stdlib-Imports: debug_animation hängt den Recorder ein, er darf den Logger also nicht importieren
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+FLIGHT_RECORDER_SIZE = getattr(settings, 'FLIGHT_RECORDER_SIZE', 2000)
+
+# Standardverzeichnis der Crash-Reports (wie bisher die Stackdumps)
+CRASH_DIR = os.path.join('.', 'log', 'system')
+
+# Obergrenzen pro Eintrag: Nachricht bzw. einzelnes Argument (Zeichen)
+_MAX_MSG = 1000
+_MAX_ARG = 200
+# Werte, die unverändert (und ohne Referenz auf große Objekte) gespeichert werden
+_PRIMITIVES = frozenset((int, float, bool, type(None)))
+
+# (time.time(), Art, Quelle, Nachricht, Argumente); Nachricht und Argumente nur als Strings/Zahlen
+Entry = Tuple[float, str, str, str, tuple]
+
+
+class FlightRecorder:
+    """
+    Flugschreiber: Ringpuffer mit den letzten `size` Log-Einträgen, Gateway-Events und Befehlen.
+
+    Aufzeichnen läuft immer, auch wenn DEBUG und die Log-Ausgabe aus sind, und muss
+    deshalb billig bleiben. Gespeichert werden nur Zahlen und (gekürzte) Strings, alle
+    anderen Argumente als Platzhalter mit ihrem Typ (`<dict>`), Exceptions mit ihrer Meldung. Der Puffer hält also keine
+    Referenzen auf Befehlsergebnisse oder ctx-Dicts, und jeder Eintrag ist nach oben begrenzt. Formatiert (`%`) wird erst beim Crash-Report. Der
+    Report enthält außerdem die Stacks aller Threads und die aktuellen Werte aller mit
+    `add_gauge` registrierten Queues.
+    """
+
+    def __init__(self, size: int = FLIGHT_RECORDER_SIZE):
+        self.size = max(0, int(size or 0))
+        self._buffer: Optional[Deque[Entry]] = deque(maxlen=self.size) if self.size else None
+        self._gauges: Dict[str, Callable[[], object]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._buffer is not None
+
+    def record(self, kind: str, source: str, msg, *args) -> None:
+        """`msg` wird wie beim Logger erst beim Dump mit `args` formatiert (`%`-Syntax)."""
+        self.append(kind, source, msg, args)
+
+    def append(self, kind: str, source: str, msg, args: tuple) -> None:
+        """Wie `record`, aber mit fertigem Argument-Tupel (spart das Umpacken im Logger)."""
+        buffer = self._buffer
+        if buffer is None:
+            return
+        if type(msg) is not str:
+            # Callables (Lazy-Logging) werden nicht aufgerufen, weder jetzt noch beim Crash
+            msg = f"<lazy {getattr(msg, '__qualname__', type(msg).__name__)}>" if callable(msg) else _clip(str(msg), _MAX_MSG)
+        elif len(msg) > _MAX_MSG:
+            msg = msg[:_MAX_MSG] + "…"
+        if args:
+            # Läuft bei jedem Log-Aufruf, auch mit DEBUG aus: kein repr(), keine Funktionsaufrufe pro Argument.
+            # Dicts, Payloads und Ergebnisse zu formatieren war teurer als ein eager gebauter f-String.
+            snap = []
+            for a in args:
+                t = type(a)
+                if t in _PRIMITIVES:
+                    snap.append(a)
+                elif t is str:
+                    snap.append(a if len(a) <= _MAX_ARG else a[:_MAX_ARG] + "…")
+                elif isinstance(a, BaseException):
+                    # Selten (Fehlerpfad) und für den Report das Wichtigste
+                    snap.append(_clip(f"{t.__name__}: {a}", _MAX_ARG))
+                else:
+                    snap.append(f"<{t.__name__}>")
+            args = tuple(snap)
+        buffer.append((time.time(), kind, source, msg, args))
+
+    def add_gauge(self, name: str, fn: Callable[[], object]) -> None:
+        """Registriert einen Wert (Queue-Tiefe o. Ä.), der beim Crash abgefragt wird."""
+        self._gauges[name] = fn
+
+    def remove_gauge(self, name: str) -> None:
+        self._gauges.pop(name, None)
+
+    def clear(self) -> None:
+        if self._buffer is not None:
+            self._buffer.clear()
+
+    # --- Auswertung ----------------------------------------------------------
+
+    def entries(self) -> List[Entry]:
+        if self._buffer is None:
+            return []
+        # deque.copy() läuft komplett in C und ist damit atomar gegenüber append() aus anderen Threads
+        return list(self._buffer.copy())
+
+    def format_entries(self) -> List[str]:
+        lines = []
+        for ts, kind, source, msg, args in self.entries():
+            stamp = datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+            lines.append(f"{stamp} {kind:<8} {source} → {_render(msg, args)}")
+        return lines
+
+    def format_gauges(self) -> List[str]:
+        lines = []
+        for name, fn in list(self._gauges.items()):
+            try:
+                value = fn()
+            except Exception as e:
+                value = f"<Fehler: {type(e).__name__}: {e}>"
+            lines.append(f"{name}: {value}")
+        return lines
+
+    def format_threads(self) -> List[str]:
+        frames = sys._current_frames()
+        threads = {t.ident: t for t in threading.enumerate()}
+        lines = []
+        for ident, frame in sorted(frames.items(), key=lambda item: getattr(threads.get(item[0]), "name", "")):
+            thread = threads.get(ident)
+            name = thread.name if thread is not None else "?"
+            daemon = " daemon" if thread is not None and thread.daemon else ""
+            lines.append(f"Thread {name} ({ident}{daemon}):")
+            lines.extend(line.rstrip("\n") for line in traceback.format_stack(frame))
+            lines.append("")
+        return lines
+
+    # --- Crash-Report --------------------------------------------------------
+
+    def write_crash_report(self, exception: Optional[BaseException], crash: bool = True, directory: str = CRASH_DIR) -> str:
+        """
+        Schreibt Traceback, Ringpuffer, Queue-Werte und Thread-Stacks in eine neue Datei
+        `CRASH_<HH.MM.SS_dd.mm.yyyy>[_n].log` bzw. `EXCEPTION_…` und gibt den Pfad zurück.
+        """
+        prefix = 'CRASH' if crash else 'EXCEPTION'
+        now = datetime.now()
+        os.makedirs(directory, exist_ok=True)
+        f, path = _create_unique(directory, f"{prefix}_{now.strftime('%H.%M.%S_%d.%m.%Y')}")
+        with f:
+            f.write(f"{prefix} {now.isoformat()} pid={os.getpid()}\n")
+            if exception is not None:
+                traceback.print_exception(type(exception), exception, exception.__traceback__, file=f)
+            # Jeder Abschnitt einzeln abgesichert: ein Fehler hier darf den Rest des Reports nicht verhindern
+            for title, section in (
+                ("Queues", self.format_gauges),
+                (f"Letzte Ereignisse (höchstens {self.size})", self.format_entries),
+                (f"Threads ({threading.active_count()})", self.format_threads),
+            ):
+                f.write(f"\n== {title} ==\n")
+                try:
+                    lines = section()
+                except Exception as e:
+                    lines = [f"<nicht verfügbar: {type(e).__name__}: {e}>"]
+                if not lines:
+                    lines = ["-"]
+                f.write("\n".join(lines) + "\n")
+        return path
+
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _render(msg: str, args: tuple) -> str:
+    try:
+        if args:
+            return msg % args
+        return str(msg)
+    except Exception as e:
+        return f"{msg!r} {args!r} [Formatfehler: {e}]"
+
+
+def _create_unique(directory: str, stem: str):
+    # Mehrere Crashes in derselben Sekunde (oder zwei Prozesse) überschreiben sich nicht: "x" schlägt fehl, wenn es die Datei gibt
+    n = 1
+    while True:
+        path = os.path.join(directory, f"{stem}.log" if n == 1 else f"{stem}_{n}.log")
+        try:
+            return open(path, 'x', encoding='utf-8'), path
+        except FileExistsError:
+            n += 1
+
+
+flight_recorder = FlightRecorder()
@@ -0,0 +1,228 @@
+# ---------------------------------------------------------------------------
+# \src\core\system\session_cache.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import sys
+import json
+import base64
+import tempfile
+from typing import Optional
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+SESSION_CACHE            = getattr(settings, 'SESSION_CACHE', "")
+SESSION_CACHE_PATH       = getattr(settings, 'SESSION_CACHE_PATH', os.path.join("cache", "session.bin"))
+SESSION_CACHE_PASSPHRASE = getattr(settings, 'SESSION_CACHE_PASSPHRASE', "")
+
+PASSPHRASE_ENV = "SELFBOT_SESSION_PASSPHRASE"
+KEYRING_SERVICE = "bastiix-selfbot"
+
+# scrypt-Parameter (~50-100 ms pro Ableitung), werden in der Datei mitgespeichert
+_SCRYPT_N = 2 ** 15
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_FORMAT_VERSION = 1
+
+
+class SessionCacheError(Exception):
+    """Session-Cache ist falsch konfiguriert oder das Backend nicht verfügbar."""
+
+
+class _KeyringStore:
+    """Token im Schlüsselbund des Betriebssystems (Windows Credential Locker, macOS Keychain, Secret Service)."""
+
+    name = "keyring"
+
+    def __init__(self, account: str):
+        try:
+            import keyring
+        except ImportError as e:
+            raise SessionCacheError("SESSION_CACHE = \"keyring\" braucht das Paket `keyring`") from e
+        self._keyring = keyring
+        self.account = account
+
+    def load(self) -> Optional[str]:
+        return self._keyring.get_password(KEYRING_SERVICE, self.account) or None
+
+    def save(self, token: str) -> None:
+        self._keyring.set_password(KEYRING_SERVICE, self.account, token)
+
+    def clear(self) -> None:
+        try:
+            self._keyring.delete_password(KEYRING_SERVICE, self.account)
+        except self._keyring.errors.PasswordDeleteError:
+            pass
+
+
+class _FileStore:
+    """
+    Token verschlüsselt in einer Datei (Fernet: AES-128-CBC + HMAC-SHA256). Der Schlüssel
+    wird per scrypt aus der Passphrase abgeleitet, die Passphrase selbst wird nie gespeichert.
+    """
+
+    name = "passphrase"
+
+    def __init__(self, path: str, passphrase: str):
+        try:
+            from cryptography.fernet import Fernet, InvalidToken
+            from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+        except ImportError as e:
+            raise SessionCacheError("SESSION_CACHE = \"passphrase\" braucht das Paket `cryptography`") from e
+        if not passphrase:
+            raise SessionCacheError(
+                f"Keine Passphrase gesetzt (Umgebungsvariable {PASSPHRASE_ENV} oder SESSION_CACHE_PASSPHRASE)"
+            )
+        self._fernet_cls = Fernet
+        self._invalid = InvalidToken
+        self._scrypt = Scrypt
+        self.path = path
+        self._passphrase = passphrase.encode("utf-8")
+
+    def _fernet(self, salt: bytes, n: int, r: int, p: int):
+        key = self._scrypt(salt=salt, length=32, n=n, r=r, p=p).derive(self._passphrase)
+        return self._fernet_cls(base64.urlsafe_b64encode(key))
+
+    def load(self) -> Optional[str]:
+        try:
+            if not _private(self.path):
+                debug_logger.warning(
+                    'SessionCache.load', "%s ist für andere Benutzer lesbar, wird ignoriert (chmod 600)", self.path
+                )
+                return None
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            debug_logger.warning('SessionCache.load', "Session-Datei nicht lesbar: %s", e)
+            return None
+        if data.get("v") != _FORMAT_VERSION:
+            debug_logger.warning('SessionCache.load', "Unbekanntes Format der Session-Datei (v=%s)", data.get("v"))
+            return None
+        try:
+            fernet = self._fernet(base64.b64decode(data["salt"]), data["n"], data["r"], data["p"])
+            return fernet.decrypt(data["token"].encode("ascii")).decode("utf-8")
+        except self._invalid:
+            debug_logger.warning('SessionCache.load', "Session-Datei mit dieser Passphrase nicht entschlüsselbar")
+        except (KeyError, TypeError, ValueError) as e:
+            debug_logger.warning('SessionCache.load', "Session-Datei beschädigt: %s", e)
+        return None
+
+    def save(self, token: str) -> None:
+        salt = os.urandom(16)
+        fernet = self._fernet(salt, _SCRYPT_N, _SCRYPT_R, _SCRYPT_P)
+        data = {
+            "v": _FORMAT_VERSION,
+            "kdf": "scrypt", "n": _SCRYPT_N, "r": _SCRYPT_R, "p": _SCRYPT_P,
+            "salt": base64.b64encode(salt).decode("ascii"),
+            "token": fernet.encrypt(token.encode("utf-8")).decode("ascii"),
+        }
+        _write_private(self.path, json.dumps(data))
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class SessionCache:
+    """
+    Optionaler Cache für das Token des eigenen Accounts, damit ein Neustart ohne Browser-Login
+    auskommt. Gespeichert wird entweder im OS-Schlüsselbund (`keyring`) oder verschlüsselt
+    unter einer Passphrase (`passphrase`). Fehler beim Lesen/Schreiben werden geloggt und
+    führen nur zum normalen Login, nie zum Abbruch.
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    @property
+    def backend(self) -> str:
+        return self._store.name
+
+    @classmethod
+    def from_settings(
+        cls,
+        mode: str = SESSION_CACHE,
+        path: str = SESSION_CACHE_PATH,
+        passphrase: Optional[str] = None,
+        account: Optional[str] = None
+    ) -> Optional["SessionCache"]:
+        """Liefert `None`, wenn der Cache aus ist oder nicht eingerichtet werden kann."""
+        mode = (mode or "").strip().lower()
+        if not mode:
+            return None
+        account = account or getattr(settings, 'LOGIN_EMAIL', "") or "default"
+        try:
+            if mode == "keyring":
+                store = _KeyringStore(account)
+            elif mode == "passphrase":
+                if passphrase is None:
+                    passphrase = os.environ.get(PASSPHRASE_ENV) or SESSION_CACHE_PASSPHRASE
+                store = _FileStore(path, passphrase)
+            else:
+                raise SessionCacheError(f"Unbekannter SESSION_CACHE-Wert: {mode!r} (erlaubt: \"keyring\", \"passphrase\")")
+        except SessionCacheError as e:
+            debug_logger.warning('SessionCache', "Session-Cache deaktiviert: %s", e)
+            return None
+        debug_logger.debug('SessionCache', "Session-Cache aktiv (%s)", mode)
+        return cls(store)
+
+    def load(self) -> Optional[str]:
+        try:
+            token = self._store.load()
+        except Exception as e:
+            debug_logger.warning('SessionCache.load', "Gespeicherte Sitzung nicht lesbar: %s", e)
+            return None
+        debug_logger.debug('SessionCache.load', "Gespeicherte Sitzung %s", "gefunden" if token else "nicht vorhanden")
+        return token
+
+    def save(self, token: str) -> bool:
+        try:
+            self._store.save(token)
+        except Exception as e:
+            debug_logger.warning('SessionCache.save', "Sitzung konnte nicht gespeichert werden: %s", e)
+            return False
+        debug_logger.debug('SessionCache.save', "Sitzung gespeichert (%s)", self.backend)
+        return True
+
+    def clear(self) -> None:
+        try:
+            self._store.clear()
+        except Exception as e:
+            debug_logger.warning('SessionCache.clear', "Gespeicherte Sitzung konnte nicht gelöscht werden: %s", e)
+            return
+        debug_logger.debug('SessionCache.clear', "Gespeicherte Sitzung verworfen")
+
+
+def _private(path: str) -> bool:
+    """True, wenn nur der Besitzer die Datei lesen kann. Unter Windows gelten die ACLs des Profils."""
+    mode = os.stat(path).st_mode
+    return sys.platform.startswith("win") or not mode & 0o077
+
+
+def _write_private(path: str, content: str) -> None:
+    """Atomar schreiben, Datei von Anfang an mit 0600 (Verzeichnis 0700), nie kurz lesbar für andere."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".session-", dir=directory)  # mkstemp legt mit 0600 an
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
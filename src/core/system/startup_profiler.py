@@ -0,0 +1,194 @@
+# ---------------------------------------------------------------------------
+# \src\core\system\startup_profiler.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import atexit
+import builtins
+import importlib
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Nur stdlib-Imports: das Modul wird vor allem anderen geladen, damit auch settings/selenium/discum gemessen werden
+
+# Imports unter dieser Dauer (Sekunden) werden nicht einzeln aufgeführt
+_IMPORT_MIN_SECONDS = 0.001
+
+
+class _Phase:
+    __slots__ = ("name", "start", "end", "thread")
+
+    def __init__(self, name: str, start: float, thread: str):
+        self.name = name
+        self.start = start
+        self.end: Optional[float] = None
+        self.thread = thread
+
+
+class StartupProfiler:
+    """
+    Misst die Wandzeit der Startphasen von `main.py` und jedes Modul-Imports.
+
+    Phasen werden per `with profiler.phase("login"):` oder `begin`/`end` erfasst, auch
+    überlappend aus mehreren Threads (Fast-Start). Imports werden über Wrapper um
+    `builtins.__import__` und `importlib.import_module` (Modul-Entdeckung) gemessen:
+    kumulierte Zeit inkl. verschachtelter Imports und Eigenzeit. Solange der Profiler
+    nicht aktiv ist, kosten alle Methoden praktisch nichts.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._phases: List[_Phase] = []
+        self._open: Dict[str, _Phase] = {}
+        self._imports: List[Dict] = []
+        self._local = threading.local()
+        self._original_import = None
+        self._original_import_module = None
+        self._finished = False
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.t0 = time.perf_counter()
+        self._install_import_hook()
+        # Wird der Start nie abgeschlossen (Absturz, Strg+C beim Login), trotzdem berichten
+        atexit.register(self.finish)
+
+    # --- Phasen --------------------------------------------------------------
+
+    def begin(self, name: str) -> None:
+        if not self.enabled or self._finished:
+            return
+        phase = _Phase(name, time.perf_counter() - self.t0, threading.current_thread().name)
+        with self._lock:
+            self._phases.append(phase)
+            self._open[name] = phase
+
+    def end(self, name: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            phase = self._open.pop(name, None)
+            if phase is not None:
+                phase.end = time.perf_counter() - self.t0
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    # --- Imports -------------------------------------------------------------
+
+    def _timed(self, name: str, relative_to: Optional[str], call):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        stack.append(0.0)
+        try:
+            return call()
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            if len(sys.modules) > loaded and total >= _IMPORT_MIN_SECONDS:
+                if relative_to:
+                    name = f"{relative_to}.{name.lstrip('.')}".strip(".")
+                self._imports.append({
+                    "module": name,
+                    "start": round(start - self.t0, 6),
+                    "cumulative": round(total, 6),
+                    "self": round(total - children, 6),
+                    "thread": threading.current_thread().name,
+                })
+
+    def _install_import_hook(self) -> None:
+        original = self._original_import = builtins.__import__
+        original_module = self._original_import_module = importlib.import_module
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Schneller Pfad: bereits geladene Module
+            if level == 0 and not fromlist and name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            package = (globals or {}).get('__package__') if level else None
+            return self._timed(name, package, lambda: original(name, globals, locals, fromlist, level))
+
+        def timed_import_module(name, package=None):
+            if name in sys.modules:
+                return original_module(name, package)
+            return self._timed(name, package if name.startswith(".") else None, lambda: original_module(name, package))
+
+        builtins.__import__ = timed_import
+        importlib.import_module = timed_import_module
+
+    def _remove_import_hook(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            importlib.import_module = self._original_import_module
+            self._original_import = self._original_import_module = None
+
+    # --- Bericht -------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        now = time.perf_counter() - self.t0
+        with self._lock:
+            phases = [
+                {
+                    "name": p.name, "start": round(p.start, 6),
+                    "duration": round((p.end if p.end is not None else now) - p.start, 6),
+                    "finished": p.end is not None, "thread": p.thread,
+                }
+                for p in self._phases
+            ]
+        return {"total": round(now, 6), "phases": phases, "imports": list(self._imports)}
+
+    def report(self, data: Optional[Dict] = None, top: int = 15) -> str:
+        data = data or self.snapshot()
+        lines = [f"Startup-Profil: {data['total']:.3f}s bis zum Abschluss", ""]
+        lines.append(f"{'Phase':<28}{'Start':>9}{'Dauer':>9}  Thread")
+        for p in data["phases"]:
+            suffix = "" if p["finished"] else "  (läuft noch)"
+            lines.append(f"{p['name']:<28}{p['start']:>8.3f}s{p['duration']:>8.3f}s  {p['thread']}{suffix}")
+        imports = sorted(data["imports"], key=lambda r: r["cumulative"], reverse=True)[:top]
+        if imports:
+            lines += ["", f"{'Import (Top ' + str(top) + ')':<40}{'gesamt':>9}{'eigen':>9}"]
+            for r in imports:
+                lines.append(f"{r['module'][:39]:<40}{r['cumulative']:>8.3f}s{r['self']:>8.3f}s")
+        return "\n".join(lines)
+
+    def finish(self, path: Optional[str] = None) -> Optional[str]:
+        """Beendet die Messung, schreibt JSON nach `path` (Standard: log/system/) und gibt den Bericht aus."""
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        self._remove_import_hook()
+        data = self.snapshot()
+        if path is None:
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join('.', 'log', 'system', f"STARTUP_{stamp}.json")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            sys.stderr.write(f"Startup-Profil konnte nicht geschrieben werden: {e}\n")
+            path = None
+        sys.stderr.write(self.report(data) + (f"\n\nGespeichert unter {path}\n" if path else "\n"))
+        sys.stderr.flush()
+        return path
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,305 @@
+# ---------------------------------------------------------------------------
+# \src\core\system\store.py
+# \author @bastiix
+# ---------------------------------------------------------------------------
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.animation.debug_animation import logger as debug_logger
+
+try:
+    import settings
+except ImportError:
+    settings = None
+
+STORE_PATH            = getattr(settings, 'STORE_PATH', None) or os.path.join(os.getcwd(), "cache", "store.sqlite3")
+STORE_COMMIT_INTERVAL = getattr(settings, 'STORE_COMMIT_INTERVAL', 0.5)
+STORE_CACHE_SIZE      = getattr(settings, 'STORE_CACHE_SIZE', 10000)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS kv ("
+    " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+    " PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+)
+_MISSING = object()
+# Wartezeit nach einem fehlgeschlagenen Commit (Platte voll, Datei gesperrt)
+_RETRY_DELAY = 1.0
+
+Key = Tuple[str, str]
+
+
+class KVStore:
+    """
+    Gemeinsamer Key-Value-Speicher für Module, SQLite im WAL-Modus.
+
+    Werte sind JSON-kompatibel und liegen pro Modul in einem eigenen Namespace.
+    Schreiben kehrt sofort zurück: der Wert landet im Cache und in einer Warteliste,
+    ein Hintergrund-Thread schreibt alle angefallenen Änderungen spätestens nach
+    `commit_interval` Sekunden in einer Transaktion (Group Commit). Lesen geht über
+    einen LRU-Cache, nur Fehlzugriffe fragen die Datenbank. Die Datei wird erst beim
+    ersten Zugriff geöffnet.
+    """
+
+    def __init__(
+        self,
+        path: str = STORE_PATH,
+        commit_interval: float = STORE_COMMIT_INTERVAL,
+        cache_size: int = STORE_CACHE_SIZE,
+        logger=None
+    ):
+        self.path = path
+        self.commit_interval = max(0.0, float(commit_interval))
+        self.cache_size = max(0, int(cache_size))
+        self.logger = logger or debug_logger
+        self._cond = threading.Condition()
+        # Noch nicht geschriebene Änderungen; None = löschen
+        self._pending: Dict[Key, Optional[str]] = {}
+        # Kodierte Werte; None = bekannt, dass der Key fehlt
+        self._cache: "OrderedDict[Key, Optional[str]]" = OrderedDict()
+        self._read_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._writer: Optional[threading.Thread] = None
+        self._flush_requested = False
+        self._closed = False
+        self._stats = {"reads": 0, "cache_hits": 0, "db_reads": 0, "writes": 0, "commits": 0, "committed_keys": 0}
+
+    def namespace(self, name: str) -> "Namespace":
+        if not name or not isinstance(name, str):
+            raise ValueError("Namespace muss ein nicht-leerer String sein")
+        return Namespace(self, name)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self._stats, pending=len(self._pending), cached=len(self._cache))
+
+    # --- Lesen ---------------------------------------------------------------
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        k = (namespace, str(key))
+        with self._cond:
+            self._stats["reads"] += 1
+            raw = self._pending.get(k, _MISSING)
+            if raw is _MISSING:
+                raw = self._cache.get(k, _MISSING)
+                if raw is not _MISSING:
+                    self._cache.move_to_end(k)
+            if raw is not _MISSING:
+                self._stats["cache_hits"] += 1
+        if raw is _MISSING:
+            row = self._query("SELECT value FROM kv WHERE namespace = ? AND key = ?", k)
+            raw = row[0][0] if row else None
+            with self._cond:
+                self._stats["db_reads"] += 1
+                # Nur eintragen, wenn kein Schreibzugriff dazwischen kam
+                if k not in self._pending and k not in self._cache:
+                    self._remember(k, raw)
+                else:
+                    raw = self._pending.get(k, self._cache.get(k))
+        return default if raw is None else json.loads(raw)
+
+    def contains(self, namespace: str, key: str) -> bool:
+        return self.get(namespace, key, _MISSING) is not _MISSING
+
+    def keys(self, namespace: str) -> List[str]:
+        rows = self._query("SELECT key FROM kv WHERE namespace = ?", (namespace,))
+        keys = {row[0] for row in rows}
+        with self._cond:
+            for (ns, key), raw in self._pending.items():
+                if ns != namespace:
+                    continue
+                if raw is None:
+                    keys.discard(key)
+                else:
+                    keys.add(key)
+        return sorted(keys)
+
+    def items(self, namespace: str) -> List[Tuple[str, Any]]:
+        rows = self._query("SELECT key, value FROM kv WHERE namespace = ?", (namespace,))
+        values = dict(rows)
+        with self._cond:
+            for (ns, key), raw in self._pending.items():
+                if ns != namespace:
+                    continue
+                if raw is None:
+                    values.pop(key, None)
+                else:
+                    values[key] = raw
+        return [(key, json.loads(values[key])) for key in sorted(values)]
+
+    # --- Schreiben -----------------------------------------------------------
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        # Sofort kodieren: nicht serialisierbare Werte scheitern beim Aufrufer, nicht im Writer-Thread
+        raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        self._put((namespace, str(key)), raw)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._put((namespace, str(key)), None)
+
+    def _put(self, k: Key, raw: Optional[str]) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Store ist geschlossen")
+            self._pending[k] = raw
+            self._remember(k, raw)
+            self._stats["writes"] += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='kv-store', daemon=True)
+                self._writer.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Schreibt alle ausstehenden Änderungen sofort. False, wenn das nicht in `timeout` gelingt."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                if self._writer is None or not self._writer.is_alive():
+                    return False
+                self._flush_requested = True
+                self._cond.notify_all()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.logger.warning('KVStore.flush', "%s Änderungen nicht geschrieben", len(self._pending))
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        self.flush(timeout)
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join(timeout)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        self.logger.debug('KVStore.close', "Store geschlossen")
+
+    # --- Intern --------------------------------------------------------------
+
+    def _remember(self, k: Key, raw: Optional[str]) -> None:
+        if not self.cache_size:
+            return
+        self._cache[k] = raw
+        self._cache.move_to_end(k)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL-Modus übersteht NORMAL jeden Prozessabsturz; nur bei Stromausfall kann der letzte Commit fehlen
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        return conn
+
+    def _query(self, sql: str, params: Iterable) -> List[Tuple]:
+        with self._read_lock:
+            if self._reader is None:
+                self._reader = self._connect(check_same_thread=False)
+            return self._reader.execute(sql, tuple(params)).fetchall()
+
+    def _write_loop(self) -> None:
+        conn = None
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    break
+                # Weitere Änderungen sammeln, damit viele Schreibzugriffe eine Transaktion teilen
+                deadline = time.monotonic() + self.commit_interval
+                while not self._flush_requested and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._flush_requested = False
+                batch = dict(self._pending)
+            try:
+                if conn is None:
+                    conn = self._connect()
+                self._commit(conn, batch)
+            except sqlite3.Error as e:
+                self.logger.error('KVStore._write_loop', "Commit von %s Änderungen fehlgeschlagen: %s", len(batch), e)
+                with self._cond:
+                    if self._closed:
+                        break
+                    self._cond.wait(_RETRY_DELAY)
+                continue
+            with self._cond:
+                # Nur entfernen, was seitdem nicht erneut geändert wurde
+                for k, raw in batch.items():
+                    if self._pending.get(k, _MISSING) is raw:
+                        del self._pending[k]
+                self._stats["commits"] += 1
+                self._stats["committed_keys"] += len(batch)
+                self._cond.notify_all()
+        if conn is not None:
+            conn.close()
+
+    @staticmethod
+    def _commit(conn: sqlite3.Connection, batch: Dict[Key, Optional[str]]) -> None:
+        upserts = [(ns, key, raw) for (ns, key), raw in batch.items() if raw is not None]
+        deletes = [k for k, raw in batch.items() if raw is None]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if upserts:
+                conn.executemany("INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)", upserts)
+            if deletes:
+                conn.executemany("DELETE FROM kv WHERE namespace = ? AND key = ?", deletes)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class Namespace:
+    """Sicht eines Moduls auf den Store. Keys sind Strings, Werte alles, was `json` kodieren kann."""
+
+    __slots__ = ("store", "name")
+
+    def __init__(self, store: KVStore, name: str):
+        self.store = store
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<Namespace {self.name!r}>"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.store.get(self.name, key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self.store.set(self.name, key, value)
+
+    def delete(self, key: str) -> None:
+        self.store.delete(self.name, key)
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            self.store.set(self.name, key, value)
+
+    def keys(self) -> List[str]:
+        return self.store.keys(self.name)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return self.store.items(self.name)
+
+    def clear(self) -> None:
+        for key in self.store.keys(self.name):
+            self.store.delete(self.name, key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.store.contains(self.name, key)
@@ -60,7 +60,7 @@ def setup(command_tree):
 
         # 2) Debug-Log: Zeige alle übergebenen Argumente
         #    Nützlich, um später zu prüfen, was genau der Nutzer eingegeben hat
-        debug_logger.debug('ping_callback', f"Args: {args}")
+        debug_logger.debug('ping_callback', "Args: %s", args)
 
         # 3) Validierung: `$ping` darf keine Argumente bekommen
         if args: